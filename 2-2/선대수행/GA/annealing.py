@@ -0,0 +1,202 @@
+"""
+담금질 기법(SA) - Individual2D_Full과 같은 비용 모델(CostModel2D)
+- 여러 독립 체인을 (C, ...) 배열로 한 프로세스에서 동시에 진행
+- 이동은 사용 가능한 셀 두 개의 스왑, 비용 변화는 CostModel2D.swap_deltas (체인당 O(n))
+- 냉각 스케줄: geometric / linear / log, 정체된 체인은 재가열(reheat)
+"""
+
+import numpy as np
+import time
+from typing import List
+import sys
+from pathlib import Path
+
+parent_path = Path(__file__).parent.parent
+sys.path.insert(0, str(parent_path))
+
+from GA.ga_integrated import Individual2D_Full
+from GA.cost_model import CostModel2D
+from GA.crossover import usable_cells
+from GA.population import layouts_to_cells
+
+
+def clamped_costs(raw: np.ndarray) -> np.ndarray:
+    """raw 비용 (..., 3)에서 라플라시안 항을 0 이상으로 자른 복사본 (total_cost에 넘길 형태)"""
+    costs = raw.copy()
+    costs[..., 1] = np.maximum(costs[..., 1], 0)
+    return costs
+
+
+def random_swap_pairs(usable: np.ndarray, size: int, rng):
+    """서로 다른 사용 가능한 셀 두 개씩 size쌍 → (cell_a, cell_b)"""
+    ia = rng.integers(len(usable), size=size)
+    ib = (ia + 1 + rng.integers(len(usable) - 1, size=size)) % len(usable)
+    return usable[ia], usable[ib]
+
+
+def metropolis_swap_step(cost_model: CostModel2D, grid: np.ndarray, cells: np.ndarray, raw: np.ndarray,
+                         energy: np.ndarray, cell_a: np.ndarray, cell_b: np.ndarray, temps, rng) -> np.ndarray:
+    """
+    체인마다 셀 cell_a ↔ cell_b 스왑을 온도 temps의 Metropolis 기준으로 수락
+    grid, cells, raw, energy는 수락된 체인만 제자리에서 갱신
+    Returns:
+        (C,) 수락 여부
+    """
+    new_raw = raw + cost_model.swap_deltas(cells, grid, cell_a, cell_b)
+    new_energy = cost_model.total_cost(clamped_costs(new_raw))
+    delta = new_energy - energy
+    accept = (delta <= 0) | (rng.random(len(energy)) < np.exp(-np.maximum(delta, 0) / temps))
+
+    if accept.any():
+        r = np.flatnonzero(accept)
+        a, b = cell_a[accept], cell_b[accept]
+        char_a, char_b = grid[r, a], grid[r, b]
+        grid[r, a], grid[r, b] = char_b, char_a
+        ok_a, ok_b = char_a >= 0, char_b >= 0
+        cells[r[ok_a], char_a[ok_a]] = b[ok_a]
+        cells[r[ok_b], char_b[ok_b]] = a[ok_b]
+        raw[accept] = new_raw[accept]
+        energy[accept] = new_energy[accept]
+    return accept
+
+
+def temperature(schedule: str, progress: np.ndarray, t0: float, t_end: float) -> np.ndarray:
+    """진행도 progress(0~1)에서의 온도"""
+    progress = np.clip(progress, 0.0, 1.0)
+    if schedule == 'geometric':
+        return t0 * (t_end / t0) ** progress
+    if schedule == 'linear':
+        return t0 + (t_end - t0) * progress
+    if schedule == 'log':
+        # T0 / (1 + c·log(1 + k)) 꼴, progress = 1에서 t_end가 되도록 c를 맞춤
+        c = (t0 / t_end - 1) / np.log(1 + 1000)
+        return t0 / (1 + c * np.log(1 + 1000 * progress))
+    raise ValueError(f"unknown schedule: {schedule}")
+
+
+def initial_temperature(cost_model: CostModel2D, cells, grid, usable, rng, samples: int = 200,
+                        accept: float = 0.8) -> float:
+    """무작위 스왑의 평균 비용 증가량이 accept 확률로 받아들여지는 온도"""
+    idx = rng.integers(len(cells), size=samples)
+    a, b = random_swap_pairs(usable, samples, rng)
+    raw = cost_model.raw_costs(cells[idx])
+    d = cost_model.total_cost(clamped_costs(raw + cost_model.swap_deltas(cells[idx], grid[idx], a, b))) - \
+        cost_model.total_cost(clamped_costs(raw))
+    up = d[d > 0]
+    return float(-up.mean() / np.log(accept)) if len(up) else 1.0
+
+
+def solve_sa(population: List[Individual2D_Full],
+             n_chains: int = None,
+             steps: int = 20000,
+             time_limit: float = None,
+             schedule: str = 'geometric',
+             t0: float = None,
+             t_end: float = None,
+             reheat_patience: int = None,
+             reheat_fraction: float = 0.5,
+             resync_every: int = 1000,
+             seed: int = None,
+             verbose: bool = False):
+    """
+    Args:
+        population: 시작 배열 (체인 수만큼 순환해서 사용) - 첫 개체의 모델/가중치로 비용 모델 구성
+        n_chains: 동시에 진행할 체인 수 (None이면 len(population))
+        steps: 체인당 최대 이동 수
+        time_limit: 초 단위 벽시계 예산 (주어지면 진행도 = max(단계, 시간) 비율)
+        schedule: 'geometric', 'linear', 'log'
+        t0, t_end: 시작/끝 온도 (None이면 t0는 초기 수락률 0.8 기준 추정, t_end = t0 × 1e-3)
+        reheat_patience: 이 단계 수 동안 체인 최고 비용이 개선되지 않으면 재가열 (None이면 끔)
+        reheat_fraction: 재가열 시 체인의 진행도를 이 비율만큼 되돌림
+        resync_every: 누적 오차를 없애기 위해 전체 비용을 다시 계산하는 주기
+        seed: 난수 시드
+    Returns:
+        (최고 개체, 정보 dict - history, 체인별 최고 비용, 수락률, 평가 수, 재가열 수, 경과 시간)
+    """
+    rng = np.random.default_rng(seed)
+    template = population[0]
+    cost_model = CostModel2D.from_individual(template)
+    n_chains = n_chains or len(population)
+
+    layouts = np.stack([population[k % len(population)].layout_2d for k in range(n_chains)])
+    grid = layouts.reshape(n_chains, -1).astype(np.intp)
+    cells = layouts_to_cells(layouts)
+    usable = usable_cells(layouts[0])
+
+    raw = cost_model.raw_costs(cells)
+    energy = cost_model.total_cost(clamped_costs(raw))
+    best_energy = energy.copy()
+    best_grid = grid.copy()
+    since_best = np.zeros(n_chains, dtype=int)
+    offset = np.zeros(n_chains)  # 재가열로 되돌린 진행도
+
+    if t0 is None:
+        t0 = initial_temperature(cost_model, cells, grid, usable, rng)
+    if t_end is None:
+        t_end = t0 * 1e-3
+
+    log_every = max(1, min(steps, 100000) // 100)
+    history = []
+    accepted = 0
+    reheats = 0
+    start = time.perf_counter()
+    done = 0
+    for step in range(1, steps + 1):
+        progress = step / steps
+        if time_limit is not None:
+            elapsed = time.perf_counter() - start
+            if elapsed >= time_limit:
+                break
+            progress = max(progress, elapsed / time_limit)
+        done = step
+        temp = temperature(schedule, progress - offset, t0, t_end)
+
+        cell_a, cell_b = random_swap_pairs(usable, n_chains, rng)
+        accept = metropolis_swap_step(cost_model, grid, cells, raw, energy, cell_a, cell_b, temp, rng)
+        accepted += int(accept.sum())
+
+        if resync_every and step % resync_every == 0:
+            raw = cost_model.raw_costs(cells)
+            energy = cost_model.total_cost(clamped_costs(raw))
+
+        improved = energy < best_energy - 1e-12
+        best_energy[improved] = energy[improved]
+        best_grid[improved] = grid[improved]
+        since_best[improved] = 0
+        since_best[~improved] += 1
+
+        if reheat_patience is not None:
+            stalled = since_best >= reheat_patience
+            if stalled.any():
+                offset[stalled] += reheat_fraction * (progress - offset[stalled])
+                since_best[stalled] = 0
+                reheats += int(stalled.sum())
+
+        if step % log_every == 0:
+            history.append({
+                'step': step,
+                'best': float(best_energy.min()),
+                'mean': float(energy.mean()),
+                'temperature': float(np.median(temp))
+            })
+            if verbose:
+                print(f"Step {step}: best={best_energy.min():.4f}, mean={energy.mean():.4f}, "
+                      f"T={np.median(temp):.4g}")
+
+    k = int(np.argmin(best_energy))
+    best = template.copy()
+    best.layout_2d = best_grid[k].reshape(layouts.shape[1:])
+    best.evaluate()
+
+    info = {
+        'history': history,
+        'chain_best_cost': best_energy,
+        'acceptance_rate': accepted / max(1, done * n_chains),
+        'evaluations': done * n_chains,
+        'reheats': reheats,
+        'steps': done,
+        'seconds': time.perf_counter() - start,
+        't0': t0,
+        't_end': t_end
+    }
+    return best, info
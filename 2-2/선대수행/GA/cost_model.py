@@ -0,0 +1,204 @@
+"""
+모집단 일괄 평가 - Individual2D_Full과 같은 비용 모델을 (P, 26) 셀 인덱스 배열로 계산
+"""
+
+import numpy as np
+import sys
+from pathlib import Path
+
+parent_path = Path(__file__).parent.parent
+sys.path.insert(0, str(parent_path))
+
+from models.step_cost import step_cost_tensor, grid_distance_sq_tensor, center_distance_cost
+
+
+class CostModel2D:
+    """
+    고정된 비용 텐서 묶음
+    - S: 셀 쌍 step 비용 (피로도)
+    - L: 정규화 라플라시안 (없으면 격자 거리 제곱 G로 대체)
+    - 셀별 위치 비용 × 자모 빈도
+    costs()는 열 순서 [총 피로도(쌍), 라플라시안 페널티, 개별 자모 빈도 비용]의 (P, 3) 행렬
+    """
+
+    def __init__(self,
+                 keyboard,
+                 fatigue_model_obj,
+                 co_occurrence: np.ndarray,
+                 frequency_vec: np.ndarray = None,
+                 laplacian_spectral_obj=None,
+                 lap_weight: float = 0.3,
+                 freq_weight: float = 1.0,
+                 shape=(3, 10),
+                 chunk_size: int = 2048):
+        """
+        Args:
+            (Individual2D_Full과 동일)
+            shape: 2D 배열 크기 (행, 열)
+            chunk_size: (chunk, 26, 26) 임시 배열로 나눠 계산할 개체 수
+        """
+        self.shape = tuple(shape)
+        self.n_chars = min(26, co_occurrence.shape[0])
+        self.lap_weight = lap_weight
+        self.freq_weight = freq_weight
+        self.chunk_size = chunk_size
+
+        W = np.asarray(co_occurrence, dtype=float)[:self.n_chars, :self.n_chars]
+        self.W = np.where(W > 0, W, 0.0)
+        self.S = step_cost_tensor(keyboard, fatigue_model_obj, *self.shape)
+        self.G = grid_distance_sq_tensor(*self.shape)
+
+        self.L = None
+        if laplacian_spectral_obj is not None:
+            # compute_laplacian은 W가 같으면 캐시된 읽기 전용 L을 돌려줌
+            L = laplacian_spectral_obj.compute_laplacian(normalized=True)
+            if L.shape == (26, 26):
+                self.L = L
+
+        if frequency_vec is None:
+            frequency_vec = np.ones(26) / 26
+        freq = np.asarray(frequency_vec[:26], dtype=float)
+        self.freq = np.where(freq > 0, freq, 0.0)
+        self.position_cost = center_distance_cost(*self.shape)
+
+    @classmethod
+    def from_individual(cls, ind, **kwargs) -> 'CostModel2D':
+        """Individual2D_Full이 참조하는 모델/행렬로 생성"""
+        return cls(ind.keyboard, ind.fatigue_model, ind.co_occurrence, ind.frequency_vec,
+                   ind.laplacian_spectral, ind.lap_weight, ind.freq_weight, ind.shape, **kwargs)
+
+    def costs(self, cells: np.ndarray) -> np.ndarray:
+        """
+        Args:
+            cells: (P, 26) 글자별 flat 셀 인덱스 (배치되지 않은 글자는 -1)
+        Returns:
+            (P, 3) [총 피로도(쌍), 라플라시안 페널티, 개별 자모 빈도 비용]
+        """
+        raw = self.raw_costs(cells)
+        raw[:, 1] = np.maximum(raw[:, 1], 0)
+        return raw
+
+    def raw_costs(self, cells: np.ndarray) -> np.ndarray:
+        """costs()와 같지만 라플라시안 이차형식을 clamp하지 않은 값"""
+        cells = np.atleast_2d(np.asarray(cells))
+        out = np.empty((len(cells), 3))
+        for start in range(0, len(cells), self.chunk_size):
+            block = cells[start:start + self.chunk_size]
+            out[start:start + len(block)] = self._raw_costs_block(block)
+        return out
+
+    def total_cost(self, costs: np.ndarray) -> np.ndarray:
+        """(P, 3) 비용 행렬 → (P,) 가중 합"""
+        costs = np.atleast_2d(costs)
+        return self.freq_weight * costs[:, 2] + costs[:, 0] + self.lap_weight * costs[:, 1]
+
+    def fitness(self, costs: np.ndarray) -> np.ndarray:
+        """적합도 = 1 / (가중 비용 + ε)"""
+        return 1.0 / (self.total_cost(costs) + 1e-6)
+
+    def swap_deltas(self, cells: np.ndarray, grid: np.ndarray, cell_a: np.ndarray, cell_b: np.ndarray) -> np.ndarray:
+        """
+        체인(개체)마다 두 셀의 글자를 맞바꿨을 때 raw 비용 항의 변화량 - 체인당 O(n)
+        Args:
+            cells: (C, 26) 글자별 flat 셀 인덱스
+            grid: (C, 행×열) 셀별 글자 (빈 칸 -1)
+            cell_a, cell_b: (C,) 교환할 두 셀 (서로 달라야 함)
+        Returns:
+            (C, 3) [Δ 총 피로도(쌍), Δ 라플라시안 이차형식(clamp 전), Δ 개별 자모 빈도 비용]
+        """
+        rows = np.arange(len(cells))
+        char_a, char_b = grid[rows, cell_a], grid[rows, cell_b]
+        ok_a = (char_a >= 0) & (char_a < cells.shape[1])
+        ok_b = (char_b >= 0) & (char_b < cells.shape[1])
+        new_cells = cells.copy()
+        new_cells[rows[ok_a], char_a[ok_a]] = cell_b[ok_a]
+        new_cells[rows[ok_b], char_b[ok_b]] = cell_a[ok_b]
+
+        out = np.zeros((len(cells), 3))
+        out[:, 0] = self._qap_swap_delta(self.W, self.S, cells, new_cells, char_a, char_b)
+
+        if self.L is not None:
+            # x^T L x 에서 옮겨진 두 글자 좌표만 d만큼 바뀔 때: Σ d_m (Lx + Lᵀx)_m + Σ d_m L_mm' d_m'
+            ma, mb = np.where(ok_a, char_a, 0), np.where(ok_b, char_b, 0)
+            old_rc = np.divmod(np.where(cells[:, :26] >= 0, cells[:, :26], 0), self.shape[1])
+            new_rc = np.divmod(np.where(new_cells[:, :26] >= 0, new_cells[:, :26], 0), self.shape[1])
+            for old, new in zip(old_rc, new_rc):  # 행(y) 좌표, 열(x) 좌표
+                old = old.astype(float)
+                da = np.where(ok_a, new[rows, ma] - old[rows, ma], 0.0)
+                db = np.where(ok_b, new[rows, mb] - old[rows, mb], 0.0)
+                for m, dm in ((ma, da), (mb, db)):
+                    lx = (self.L[m] * old).sum(axis=1) + (self.L[:, m].T * old).sum(axis=1)
+                    out[:, 1] += dm * (lx + dm * self.L[m, m])
+                out[:, 1] += da * db * (self.L[ma, mb] + self.L[mb, ma])
+        else:
+            out[:, 1] = self._qap_swap_delta(self.W, self.G, cells, new_cells, char_a, char_b)
+
+        m = len(self.freq)
+        pc = self.position_cost
+        for char, old_cell, new_cell in ((char_a, cell_a, cell_b), (char_b, cell_b, cell_a)):
+            ok = (char >= 0) & (char < m)
+            out[:, 2] += np.where(ok, self.freq[np.where(ok, char, 0)] * (pc[new_cell] - pc[old_cell]), 0.0)
+        return out
+
+    def _qap_swap_delta(self, W, T, cells, new_cells, char_a, char_b) -> np.ndarray:
+        """Σ W_ij T[cell_i, cell_j] 의 변화량 - 옮겨진 글자의 행/열만 더하고 겹친 쌍은 한 번 뺌"""
+        n = W.shape[0]
+        rows = np.arange(len(cells))
+        placed = cells[:, :n] >= 0
+        c_old = np.where(placed, cells[:, :n], 0)
+        c_new = np.where(placed, new_cells[:, :n], 0)
+
+        moved = []
+        for char in (char_a, char_b):
+            ok = (char >= 0) & (char < n)
+            moved.append((np.where(ok, char, 0), ok))
+
+        delta = np.zeros(len(cells))
+        for m, ok in moved:
+            old_m, new_m = c_old[rows, m], c_new[rows, m]
+            row = (W[m] * placed * (T[new_m[:, None], c_new] - T[old_m[:, None], c_old])).sum(axis=1)
+            col = (W[:, m].T * placed * (T[c_new, new_m[:, None]] - T[c_old, old_m[:, None]])).sum(axis=1)
+            # (m, m) 쌍은 행과 열에서 두 번 더해짐
+            diag = W[m, m] * (T[new_m, new_m] - T[old_m, old_m])
+            delta += np.where(ok, row + col - diag, 0.0)
+
+        # (a, b), (b, a) 쌍도 두 글자의 합에서 두 번씩 더해짐
+        (ma, ok_a), (mb, ok_b) = moved
+        oa, ob = c_old[rows, ma], c_old[rows, mb]
+        na, nb = c_new[rows, ma], c_new[rows, mb]
+        both = W[ma, mb] * (T[na, nb] - T[oa, ob]) + W[mb, ma] * (T[nb, na] - T[ob, oa])
+        delta -= np.where(ok_a & ok_b, both, 0.0)
+        return delta
+
+    def _raw_costs_block(self, cells: np.ndarray) -> np.ndarray:
+        n = self.n_chars
+        placed = cells >= 0
+        all_placed = placed[:, :n].all()
+
+        # 총 피로도: Σ W_ij · S[cell_i, cell_j]  (두 글자가 모두 배치된 쌍만)
+        c = cells[:, :n]
+        pair_cost = self.S[c[:, :, None], c[:, None, :]]
+        if all_placed:
+            fatigue = np.einsum('ij,pij->p', self.W, pair_cost)
+        else:
+            mask = placed[:, :n, None] & placed[:, None, :n]
+            fatigue = np.einsum('ij,pij->p', self.W, pair_cost * mask)
+
+        # 라플라시안: x^T L x + y^T L y  (배치되지 않은 글자는 좌표 0)
+        if self.L is not None:
+            rows, cols = np.divmod(np.where(placed, cells, 0)[:, :26], self.shape[1])
+            X = cols.astype(float)
+            Y = rows.astype(float)
+            lap = ((X @ self.L) * X).sum(axis=1) + ((Y @ self.L) * Y).sum(axis=1)
+        else:
+            grid = self.G[c[:, :, None], c[:, None, :]]
+            if not all_placed:
+                grid = grid * mask
+            lap = np.einsum('ij,pij->p', self.W, grid)
+
+        # 개별 자모 빈도 비용: Σ freq[i] · position_cost[cell_i]
+        m = len(self.freq)
+        pos_cost = np.where(placed[:, :m], self.position_cost[cells[:, :m]], 0.0)
+        freq_cost = pos_cost @ self.freq
+
+        return np.stack([fatigue, lap, freq_cost], axis=1)
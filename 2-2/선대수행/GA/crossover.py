@@ -0,0 +1,175 @@
+"""
+순열 교차 커널 - 한 세대의 부모 쌍 전체를 한 번에 처리
+parents: (K, 2, n) 배열, 각 행은 같은 값 집합의 순열
+반환: (K, 2, n) 자식 배열 (항상 유효한 순열)
+
+2D 배열은 사용 가능한 셀(-1이 아닌 칸)의 글자만 순서열로 꺼내서 교차하고 다시 채움
+"""
+
+import numpy as np
+
+
+def random_cuts(k: int, n: int, rng=None) -> np.ndarray:
+    """(k, 2) 구간 [a, b), 0 <= a < b <= n (rng가 없으면 전역 np.random 사용)"""
+    if rng is None:
+        a = np.random.randint(0, n - 1, size=k)
+        u = np.random.random(k)
+    else:
+        a = rng.integers(0, n - 1, size=k)
+        u = rng.random(k)
+    b = a + 1 + (u * (n - a)).astype(int)  # a+1 .. n
+    return np.stack([a, b], axis=1)
+
+
+def _ranks(parents: np.ndarray):
+    """값 → 0..n-1 순위와 되돌릴 정렬 값 (값이 이미 0..n-1이면 그대로)"""
+    values = np.sort(parents[0, 0])
+    n = len(values)
+    if values[0] == 0 and values[-1] == n - 1:
+        return parents.astype(np.intp, copy=False), None
+    return np.searchsorted(values, parents), values
+
+
+def _positions(seqs: np.ndarray) -> np.ndarray:
+    """pos[..., v] = 값 v의 위치 (순위 순열의 역순열)"""
+    pos = np.empty_like(seqs)
+    np.put_along_axis(pos, seqs, np.broadcast_to(np.arange(seqs.shape[-1]), seqs.shape), axis=-1)
+    return pos
+
+
+def _finish(children, values, dtype, out):
+    if values is not None:
+        children = values[children]
+    if out is None:
+        return children.astype(dtype, copy=False)
+    out[...] = children
+    return out
+
+
+def _segment_mask(cuts: np.ndarray, n: int) -> np.ndarray:
+    i = np.arange(n)
+    return (i >= cuts[:, :1]) & (i < cuts[:, 1:])
+
+
+def ox_crossover(parents: np.ndarray, cuts: np.ndarray = None, rng=None, out: np.ndarray = None) -> np.ndarray:
+    """
+    순서 교차(OX)
+    자식 i는 부모 i의 구간 [a, b)를 그대로 받고, 나머지 칸은 b부터 (순환) 다른 부모의 값 순서대로 채움
+    """
+    parents = np.asarray(parents)
+    k, _, n = parents.shape
+    if cuts is None:
+        cuts = random_cuts(k, n, rng)
+    seqs, values = _ranks(parents)
+    pos = _positions(seqs)
+
+    a, b = cuts[:, 0, None], cuts[:, 1, None]
+    j = np.arange(n)
+    order = (b + j) % n                                  # (k, n) b부터 순환하는 위치
+    n_fill = n - (b - a)                                 # 구간 밖 칸 수
+    fill_slot = j < n_fill                               # order의 앞 n_fill칸이 구간 밖
+
+    children = np.empty_like(seqs)
+    for child, (donor, filler) in enumerate(((0, 1), (1, 0))):
+        d, f = seqs[:, donor], seqs[:, filler]
+        filler_rot = np.take_along_axis(f, order, axis=1)
+        donor_pos = np.take_along_axis(pos[:, donor], filler_rot, axis=1)
+        keep = (donor_pos < a) | (donor_pos >= b)        # 구간에 이미 있는 값은 건너뜀
+        kept = np.take_along_axis(filler_rot, np.argsort(~keep, axis=1, kind='stable'), axis=1)
+        vals = np.where(fill_slot, kept, np.take_along_axis(d, order, axis=1))
+        np.put_along_axis(children[:, child], order, vals, axis=1)
+    return _finish(children, values, parents.dtype, out)
+
+
+def pmx_crossover(parents: np.ndarray, cuts: np.ndarray = None, rng=None, out: np.ndarray = None) -> np.ndarray:
+    """
+    부분 사상 교차(PMX)
+    자식 i는 부모 i의 구간 [a, b)를 받고, 나머지는 다른 부모 값 - 충돌하는 값은 구간의 사상을 따라 치환
+    """
+    parents = np.asarray(parents)
+    k, _, n = parents.shape
+    if cuts is None:
+        cuts = random_cuts(k, n, rng)
+    seqs, values = _ranks(parents)
+    pos = _positions(seqs)
+    seg = _segment_mask(cuts, n)
+
+    children = np.empty_like(seqs)
+    for child, (donor, filler) in enumerate(((0, 1), (1, 0))):
+        d, f = seqs[:, donor], seqs[:, filler]
+        donor_pos = pos[:, donor]
+        vals = f.copy()
+        # 값이 donor 구간에 있으면 v → f[pos_donor(v)] 로 따라감 (최대 구간 길이만큼)
+        active = ~seg & np.take_along_axis(seg, np.take_along_axis(donor_pos, vals, axis=1), axis=1)
+        while active.any():
+            mapped = np.take_along_axis(f, np.take_along_axis(donor_pos, vals, axis=1), axis=1)
+            vals = np.where(active, mapped, vals)
+            active &= np.take_along_axis(seg, np.take_along_axis(donor_pos, vals, axis=1), axis=1)
+        children[:, child] = np.where(seg, d, vals)
+    return _finish(children, values, parents.dtype, out)
+
+
+def cycle_crossover(parents: np.ndarray, out: np.ndarray = None) -> np.ndarray:
+    """
+    사이클 교차(CX)
+    두 부모가 만드는 위치 사이클을 번갈아 가져옴 (첫 사이클은 자기 부모에서)
+    사이클 번호는 포인터 더블링으로 사이클 최소 위치를 구해서 매김 - O(n log n)
+    """
+    parents = np.asarray(parents)
+    k, _, n = parents.shape
+    seqs, values = _ranks(parents)
+    p1, p2 = seqs[:, 0], seqs[:, 1]
+
+    # 위치 i → p2[i]가 p1에 있는 위치
+    step = np.take_along_axis(_positions(p1), p2, axis=1)
+    root = np.broadcast_to(np.arange(n), (k, n)).copy()
+    for _ in range(max(1, int(np.ceil(np.log2(n))))):
+        root = np.minimum(root, np.take_along_axis(root, step, axis=1))
+        step = np.take_along_axis(step, step, axis=1)
+
+    is_start = root == np.arange(n)
+    cycle_no = np.take_along_axis(np.cumsum(is_start, axis=1) - 1, root, axis=1)
+    own = (cycle_no % 2 == 0)
+
+    children = np.empty_like(seqs)
+    children[:, 0] = np.where(own, p1, p2)
+    children[:, 1] = np.where(own, p2, p1)
+    return _finish(children, values, parents.dtype, out)
+
+
+CROSSOVERS = {
+    'ox': ox_crossover,
+    'pmx': pmx_crossover,
+    'cycle': cycle_crossover,
+}
+
+
+def crossover(parents: np.ndarray, method: str = 'ox', rng=None, out: np.ndarray = None) -> np.ndarray:
+    """이름으로 교차 커널 선택 ('ox', 'pmx', 'cycle')"""
+    if method not in CROSSOVERS:
+        raise ValueError(f"unknown crossover: {method}")
+    if method == 'cycle':
+        return cycle_crossover(parents, out=out)
+    return CROSSOVERS[method](parents, rng=rng, out=out)
+
+
+def usable_cells(layout: np.ndarray) -> np.ndarray:
+    """글자가 놓일 수 있는 flat 셀 인덱스 (-1이 아닌 칸) - 한 번 구해서 재사용"""
+    return np.flatnonzero(np.asarray(layout).reshape(-1) != -1)
+
+
+def crossover_layouts(parents: np.ndarray, cells: np.ndarray, method: str = 'ox', rng=None) -> np.ndarray:
+    """
+    2D 배열 부모 쌍 묶음 교차
+    Args:
+        parents: (K, 2, 행, 열) 배열
+        cells: usable_cells()로 구한 사용 가능 셀
+    Returns:
+        (K, 2, 행, 열) 자식 배열 (빈 칸은 그대로)
+    """
+    parents = np.asarray(parents)
+    k = len(parents)
+    flat = parents.reshape(k, 2, -1)
+    children = flat.copy()
+    children[:, :, cells] = crossover(flat[:, :, cells], method, rng)
+    return children.reshape(parents.shape)
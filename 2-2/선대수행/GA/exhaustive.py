@@ -0,0 +1,288 @@
+"""
+고정된 부분 배열에서 작은 글자 묶음(예: 오른손 모음 10개)을 완전 탐색으로 최적화
+- 나머지 글자는 그대로 두고 free_chars를 free_cells에 놓는 모든 순열(m!/(m-k)!)을 평가
+- 순열은 Lehmer 부호(계승 진법 순위)로 앞자리만 생성하고, 뒷자리는 미리 만든 순열 표로 한 번에
+  → 청크마다 (앞자리 묶음 × 뒷자리 전체) 평가, 메모리는 chunk_size에 비례
+- 비용은 상수 + 글자별 선형 표 + 글자 쌍 이차 표로 분해 (Individual2D_Full과 같은 비용 모델)
+- workers >= 2면 순위 구간을 프로세스 풀에 나눠서 평가
+"""
+
+import numpy as np
+import time
+from multiprocessing import Pool
+from typing import Sequence
+import sys
+from pathlib import Path
+
+parent_path = Path(__file__).parent.parent
+sys.path.insert(0, str(parent_path))
+
+from GA.ga_integrated import Individual2D_Full
+from GA.cost_model import CostModel2D
+from GA.population import layouts_to_cells
+
+
+def n_permutations(m: int, k: int) -> int:
+    """m개 셀에 k개 글자를 놓는 순열 수 m!/(m-k)!"""
+    total = 1
+    for t in range(k):
+        total *= m - t
+    return total
+
+
+def unrank(ranks: np.ndarray, m: int, k: int) -> np.ndarray:
+    """
+    순위 → (B, k) 순열 (사전순) - 위치 i의 자릿수는 남은 셀 중 몇 번째인지
+    Returns:
+        perms[b, i] = 글자 i를 놓을 셀 (0..m-1)
+    """
+    ranks = np.asarray(ranks, dtype=np.int64)
+    weights = np.ones(k, dtype=np.int64)
+    for i in range(k - 2, -1, -1):
+        weights[i] = weights[i + 1] * (m - i - 1)
+
+    avail = np.ones((len(ranks), m), dtype=bool)
+    perms = np.empty((len(ranks), k), dtype=np.intp)
+    rows = np.arange(len(ranks))
+    for i in range(k):
+        digit = (ranks // weights[i]) % (m - i)
+        # 남은 셀 중 digit번째 = 누적 개수가 처음으로 digit + 1이 되는 칸
+        pick = np.argmax(np.cumsum(avail, axis=1) > digit[:, None], axis=1)
+        perms[:, i] = pick
+        avail[rows, pick] = False
+    return perms
+
+
+class SubproblemTables:
+    """
+    고정 글자는 그대로, free 글자 k개 × free 셀 m개에 대한 비용 분해
+    - const: 고정 글자끼리의 비용
+    - linear: (k, m) 글자 i를 셀 a에 둘 때 고정 글자와의 비용 + 자기 자신
+    - quad: (k, k, m·m) 글자 쌍 (i, j)를 셀 (a, b)에 둘 때 (양방향 합, quad[j, i]는 전치)
+    값은 복소수로 두 채널을 한 번에 모음: 실수부 = 피로도 + 빈도 가중, 허수부 = 라플라시안 raw
+    (라플라시안 항은 clamp해야 하므로 따로 더한 뒤 마지막에 가중)
+    """
+
+    def __init__(self, cost_model: CostModel2D, cells: np.ndarray, free_chars: Sequence[int],
+                 free_cells: Sequence[int]):
+        self.lap_weight = cost_model.lap_weight
+        self.free_chars = np.asarray(free_chars, dtype=np.intp)
+        self.free_cells = np.asarray(free_cells, dtype=np.intp)
+        k, m = len(self.free_chars), len(self.free_cells)
+        self.k, self.m = k, m
+
+        fixed_cells = np.asarray(cells).copy()
+        fixed_cells[self.free_chars] = -1
+        raw = cost_model.raw_costs(fixed_cells[None])[0]
+        self.const = complex(raw[0] + cost_model.freq_weight * raw[2], raw[1])
+
+        n = len(fixed_cells)
+        W = np.zeros((n, n))
+        W[:cost_model.n_chars, :cost_model.n_chars] = cost_model.W
+        terms = [(W, cost_model.S, 1.0)]
+        if cost_model.L is not None:
+            rows, cols = np.divmod(np.arange(cost_model.S.shape[0]), cost_model.shape[1])
+            terms.append((cost_model.L, np.outer(cols, cols) + np.outer(rows, rows), 1j))
+        else:
+            terms.append((W, cost_model.G, 1j))
+
+        fixed = np.flatnonzero(fixed_cells >= 0)
+        c_fixed = fixed_cells[fixed]
+        fc, fx = self.free_cells, self.free_chars
+
+        self.linear = np.zeros((k, m), dtype=complex)
+        self.quad = np.zeros((k, k, m * m), dtype=complex)
+        for A, B, unit in terms:
+            # Σ_j∈고정 (A_ij B[a, c_j] + A_ji B[c_j, a]) + A_ii B[a, a]
+            self.linear += unit * (A[np.ix_(fx, fixed)] @ B[np.ix_(fc, c_fixed)].T +
+                                   A[np.ix_(fixed, fx)].T @ B[np.ix_(c_fixed, fc)] +
+                                   np.diag(A)[fx][:, None] * np.diag(B)[fc][None, :])
+            B_free = B[np.ix_(fc, fc)]
+            for i in range(k):
+                for j in range(i + 1, k):
+                    q = unit * (A[fx[i], fx[j]] * B_free + A[fx[j], fx[i]] * B_free.T)
+                    self.quad[i, j] += q.reshape(-1)
+                    self.quad[j, i] += q.T.reshape(-1)
+
+        freq = np.zeros(n)
+        f = min(n, len(cost_model.freq))
+        freq[:f] = cost_model.freq[:f]
+        self.linear += cost_model.freq_weight * np.outer(freq[fx], cost_model.position_cost[fc])
+
+    def total(self, acc: np.ndarray) -> np.ndarray:
+        return acc.real + self.lap_weight * np.maximum(acc.imag, 0)
+
+    def score(self, perms: np.ndarray) -> np.ndarray:
+        """(B, k) 순열 → (B,) 총 비용"""
+        acc = np.full(len(perms), self.const)
+        for i in range(self.k):
+            acc += self.linear[i, perms[:, i]]
+            for j in range(i + 1, self.k):
+                acc += self.quad[i, j, perms[:, i] * self.m + perms[:, j]]
+        return self.total(acc)
+
+    def score_block(self, heads: np.ndarray, tails: np.ndarray) -> np.ndarray:
+        """
+        앞 h자리가 heads (H, h)로 정해진 순열들의 뒤 s자리를 tails (T, s) 전체로 채운 비용
+        tails는 남은 셀(오름차순) 안에서의 순열 - 사전순과 같은 순서
+        Returns:
+            (H, T) 총 비용
+        """
+        k, m = self.k, self.m
+        n_heads, h = heads.shape
+        s = k - h
+        rows = np.arange(n_heads)
+
+        acc_head = np.full(n_heads, self.const)
+        # 뒤 글자의 유효 선형 비용 = 선형 + 앞 글자들과의 쌍 비용
+        lin = np.broadcast_to(self.linear[h:], (n_heads, s, m)).copy()
+        for i in range(h):
+            acc_head += self.linear[i, heads[:, i]]
+            for j in range(i + 1, h):
+                acc_head += self.quad[i, j, heads[:, i] * m + heads[:, j]]
+            for j in range(s):
+                lin[:, j] += self.quad[i, h + j].reshape(m, m)[heads[:, i]]
+
+        avail = np.ones((n_heads, m), dtype=bool)
+        avail[rows[:, None], heads] = False
+        remaining = np.flatnonzero(avail).reshape(n_heads, m - h) % m
+        cells = np.take(remaining, tails, axis=1)               # (H, T, s)
+
+        acc = np.broadcast_to(acc_head[:, None], cells.shape[:2]).copy()
+        lin_flat = lin.reshape(-1)
+        base = (rows[:, None] * s) * m
+        for j in range(s):
+            acc += lin_flat[base + j * m + cells[:, :, j]]
+            for j2 in range(j + 1, s):
+                acc += self.quad[h + j, h + j2, cells[:, :, j] * m + cells[:, :, j2]]
+        return self.total(acc)
+
+
+def _top_k(costs: np.ndarray, ranks: np.ndarray, top_k: int):
+    if len(costs) > top_k:
+        keep = np.argpartition(costs, top_k - 1)[:top_k]
+        costs, ranks = costs[keep], ranks[keep]
+    order = np.lexsort((ranks, costs))
+    return costs[order], ranks[order]
+
+
+def split_positions(m: int, k: int, chunk_size: int) -> int:
+    """뒤쪽 자리 수 s - 뒤 s자리 순열 표 크기가 chunk_size 이하인 가장 큰 값 (최소 1)"""
+    s = 1
+    while s < k and n_permutations(m - k + s + 1, s + 1) <= chunk_size:
+        s += 1
+    return s
+
+
+def score_range(tables: SubproblemTables, start: int, stop: int, top_k: int, chunk_size: int):
+    """
+    앞자리 순위 [start, stop) 평가 → 상위 top_k (비용, 전체 순위)
+    전체 순위 = 앞자리 순위 × 뒤 순열 수 + 뒤 순위 (사전순)
+    """
+    k, m = tables.k, tables.m
+    s = split_positions(m, k, chunk_size)
+    h = k - s
+    tails = unrank(np.arange(n_permutations(m - h, s)), m - h, s)
+    n_tails = len(tails)
+    per_block = max(1, chunk_size // n_tails)
+
+    best_costs = np.empty(0)
+    best_ranks = np.empty(0, dtype=np.int64)
+    for lo in range(start, stop, per_block):
+        head_ranks = np.arange(lo, min(stop, lo + per_block), dtype=np.int64)
+        costs = tables.score_block(unrank(head_ranks, m, h), tails).reshape(-1)
+        ranks = (head_ranks[:, None] * n_tails + np.arange(n_tails)).reshape(-1)
+        best_costs, best_ranks = _top_k(np.concatenate([best_costs, costs]),
+                                        np.concatenate([best_ranks, ranks]), top_k)
+    return best_costs, best_ranks
+
+
+def n_heads(tables: SubproblemTables, chunk_size: int) -> int:
+    """score_range가 나누는 앞자리 순열 수"""
+    s = split_positions(tables.m, tables.k, chunk_size)
+    return n_permutations(tables.m, tables.k - s)
+
+
+_worker_state = {}
+
+
+def _init_worker(tables: SubproblemTables):
+    # 비용 표는 워커 시작 시 한 번만 전달
+    _worker_state['tables'] = tables
+
+
+def _score_task(task):
+    start, stop, top_k, chunk_size = task
+    return score_range(_worker_state['tables'], start, stop, top_k, chunk_size)
+
+
+def solve_exhaustive(template: Individual2D_Full,
+                     free_chars: Sequence[int],
+                     free_cells: Sequence[int] = None,
+                     top_k: int = 10,
+                     chunk_size: int = 1 << 16,
+                     workers: int = 1,
+                     verbose: bool = False):
+    """
+    Args:
+        template: 고정 글자의 배치를 담은 개체 (free_chars의 현재 위치는 무시)
+        free_chars: 다시 배치할 글자 인덱스 k개
+        free_cells: 그 글자들이 들어갈 flat 셀 m개 (m >= k, None이면 free_chars의 현재 셀)
+        top_k: 돌려줄 상위 배열 수
+        chunk_size: 한 번에 생성/평가할 순열 수 (메모리 ≈ chunk_size × k)
+        workers: 프로세스 수 (1이면 현재 프로세스)
+    Returns:
+        (최적 개체, 정보 dict - top_k [(비용, 배열)], 평가 수, 경과 시간)
+    """
+    start_time = time.perf_counter()
+    cost_model = CostModel2D.from_individual(template)
+    grid = template.layout_2d.reshape(-1)
+    cells = layouts_to_cells(template.layout_2d[None])[0]
+
+    free_chars = np.asarray(free_chars, dtype=np.intp)
+    if free_cells is None:
+        free_cells = cells[free_chars]
+    free_cells = np.asarray(free_cells, dtype=np.intp)
+    if (free_cells < 0).any():
+        raise ValueError("free_cells must be placed cells")
+    if len(free_cells) < len(free_chars):
+        raise ValueError("need at least as many free cells as free characters")
+    occupied = grid[free_cells]
+    if not np.isin(occupied[occupied >= 0], free_chars).all():
+        raise ValueError("free_cells hold characters that are not free")
+
+    tables = SubproblemTables(cost_model, cells, free_chars, free_cells)
+    total = n_permutations(tables.m, tables.k)
+    if verbose:
+        print(f"{total} permutations of {tables.k} characters over {tables.m} cells")
+
+    heads = n_heads(tables, chunk_size)
+    if workers is None or workers > 1:
+        n_tasks = max(1, min(heads, 4 * (workers or 1)))
+        bounds = np.linspace(0, heads, n_tasks + 1).astype(np.int64)
+        tasks = [(int(a), int(b), top_k, chunk_size) for a, b in zip(bounds[:-1], bounds[1:]) if b > a]
+        with Pool(workers, initializer=_init_worker, initargs=(tables,)) as pool:
+            results = pool.map(_score_task, tasks)
+        best_costs, best_ranks = _top_k(np.concatenate([c for c, _ in results]),
+                                        np.concatenate([r for _, r in results]), top_k)
+    else:
+        best_costs, best_ranks = score_range(tables, 0, heads, top_k, chunk_size)
+
+    base = grid.copy()
+    base[free_cells] = -1
+    layouts = []
+    for perm in unrank(best_ranks, tables.m, tables.k):
+        layout = base.copy()
+        layout[free_cells[perm]] = free_chars
+        layouts.append(layout.reshape(template.layout_2d.shape))
+
+    best = template.copy()
+    best.layout_2d = layouts[0]
+    best.evaluate()
+
+    info = {
+        'top_k': list(zip(best_costs.tolist(), layouts)),
+        'evaluations': total,
+        'seconds': time.perf_counter() - start_time
+    }
+    return best, info
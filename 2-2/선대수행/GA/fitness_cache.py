@@ -0,0 +1,95 @@
+"""
+세대 간 적합도 캐시 - 배열의 raw bytes를 키로 하는 크기 제한 LRU
+"""
+
+import numpy as np
+from collections import OrderedDict
+
+# 개체가 evaluate()에서 채우는 캐시 속성 (클래스마다 일부만 가짐)
+CACHED_ATTRS = ('_fitness', '_fatigue', '_fatigue_total', '_fatigue_lap', '_lap_raw', '_freq_cost')
+
+
+def layout_of(ind) -> np.ndarray:
+    """개체의 배열 (2D 개체는 layout_2d, 1D 개체는 layout)"""
+    layout = getattr(ind, 'layout_2d', None)
+    return ind.layout if layout is None else layout
+
+
+def copy_cached_state(src, dst):
+    """src가 평가된 상태라면 캐시 속성을 dst로 복사 (copy()에서 사용)"""
+    if src._fitness is not None:
+        for name in CACHED_ATTRS:
+            if hasattr(src, name):
+                setattr(dst, name, getattr(src, name))
+    return dst
+
+
+class FitnessCache:
+    """
+    배열 bytes → 평가 결과(캐시 속성) LRU 캐시
+    같은 비용 모델(W, 키보드, 가중치)을 쓰는 실행끼리만 공유해야 함
+    """
+
+    def __init__(self, maxsize: int = 10000):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(layout: np.ndarray) -> bytes:
+        return np.ascontiguousarray(layout).tobytes()
+
+    def get(self, key: bytes):
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(self, key: bytes, entry: dict):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def lookup(self, ind) -> bool:
+        """캐시에 있으면 개체의 캐시 속성을 채우고 True"""
+        entry = self.get(self.key(layout_of(ind)))
+        if entry is None:
+            return False
+        for name, value in entry.items():
+            setattr(ind, name, value)
+        return True
+
+    def store(self, ind):
+        """평가된 개체의 캐시 속성을 저장"""
+        entry = {name: getattr(ind, name) for name in CACHED_ATTRS if hasattr(ind, name)}
+        self.put(self.key(layout_of(ind)), entry)
+
+    def evaluate(self, ind) -> float:
+        """캐시를 거쳐 개체 평가 - 이미 평가된 개체는 그대로 반환"""
+        if ind._fitness is None and not self.lookup(ind):
+            ind.evaluate()
+            self.store(ind)
+        return ind._fitness
+
+    def clear(self):
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'size': len(self._entries),
+            'maxsize': self.maxsize,
+            'hit_rate': self.hits / total if total else 0.0
+        }
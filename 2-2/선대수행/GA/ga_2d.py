@@ -4,6 +4,15 @@
 
 import numpy as np
 from typing import List, Tuple
+import sys
+from pathlib import Path
+
+parent_path = Path(__file__).parent.parent
+sys.path.insert(0, str(parent_path))
+
+from models.keyboard_layout_corrected import char_cells
+from GA.fitness_cache import FitnessCache, copy_cached_state
+from GA.stopping import StoppingPolicy, population_diversity
 
 class Individual2D:
     """2D 키보드 배열 기반 개체"""
@@ -15,18 +24,39 @@ class Individual2D:
                       예: [[0,1,2,...], [10,11,12,...], [...]]
             co_occurrence: 공기 행렬 W
         """
-        self.layout_2d = np.array(layout_2d, dtype=int)  # 2D 배열
-        self.shape = self.layout_2d.shape  # (rows, cols)
+        self.layout_2d = np.array(layout_2d, dtype=int)  # 2D 배열 (setter가 역인덱스 생성)
         self.co_occurrence = co_occurrence
         self.lap_weight = lap_weight
         self._fitness = None
         self._fatigue = None
     
+    @property
+    def layout_2d(self) -> np.ndarray:
+        return self._layout_2d
+    
+    @layout_2d.setter
+    def layout_2d(self, layout: np.ndarray):
+        """배열 교체 시 글자 → 셀 역인덱스(char_cells)도 함께 재구성"""
+        self._layout_2d = np.ascontiguousarray(layout, dtype=int)
+        self.shape = self._layout_2d.shape  # (rows, cols)
+        self.char_cells = char_cells(self._layout_2d)
+        self._fitness = None
+    
+    def swap_cells(self, cell_a: int, cell_b: int):
+        """두 flat 셀의 글자 교환 - 역인덱스는 O(1)로 갱신"""
+        flat = self._layout_2d.reshape(-1)
+        char_a, char_b = flat[cell_a], flat[cell_b]
+        flat[cell_a], flat[cell_b] = char_b, char_a
+        if char_a >= 0:
+            self.char_cells[char_a] = cell_b
+        if char_b >= 0:
+            self.char_cells[char_b] = cell_a
+        self._fitness = None
+    
     def get_position(self, char_idx: int) -> Tuple[int, int]:
         """글자 인덱스의 (row, col) 위치 반환"""
-        positions = np.where(self.layout_2d == char_idx)
-        if len(positions[0]) > 0:
-            return (positions[0][0], positions[1][0])
+        if 0 <= char_idx < len(self.char_cells) and self.char_cells[char_idx] >= 0:
+            return divmod(int(self.char_cells[char_idx]), self.shape[1])
         return None
     
     def distance(self, char_i: int, char_j: int) -> float:
@@ -71,12 +101,12 @@ class Individual2D:
         return fatigue
     
     def copy(self):
-        """복사"""
-        return Individual2D(
+        """복사 (평가된 개체는 적합도도 함께)"""
+        return copy_cached_state(self, Individual2D(
             self.layout_2d.copy(), 
             self.co_occurrence, 
             self.lap_weight
-        )
+        ))
 
 
 class GAOperators2D:
@@ -104,13 +134,12 @@ class GAOperators2D:
         c1_layout = np.vstack([layout1[:point], layout2[point:]])
         c2_layout = np.vstack([layout2[:point], layout1[point:]])
         
+        # layout_2d setter가 역인덱스를 재구성하고 _fitness를 초기화
         c1 = p1.copy()
         c1.layout_2d = c1_layout
-        c1._fitness = None
         
         c2 = p2.copy()
         c2.layout_2d = c2_layout
-        c2._fitness = None
         
         return c1, c2
     
@@ -126,8 +155,7 @@ class GAOperators2D:
             r2, c2 = np.random.randint(0, layout.shape[0]), np.random.randint(0, layout.shape[1])
             
             # 스왑
-            layout[r1, c1], layout[r2, c2] = layout[r2, c2], layout[r1, c1]
-            ind._fitness = None
+            ind.swap_cells(r1 * layout.shape[1] + c1, r2 * layout.shape[1] + c2)
         
         return ind
 
@@ -135,21 +163,34 @@ class GAOperators2D:
 class GARunner2D:
     """2D GA 실행기"""
     
-    def __init__(self, pop_size=20, generations=50, mut_rate=0.1):
+    def __init__(self, pop_size=20, generations=50, mut_rate=0.1, fitness_cache: FitnessCache = None,
+                 stopping: StoppingPolicy = None):
+        """
+        fitness_cache: 여러 실행이 공유할 적합도 캐시 (None이면 run()마다 새로 생성)
+        stopping: 종료 조건 (patience, 평탄 구간, 다양성, 시간, 평가 수 - GA.stopping 참고)
+        """
         self.pop_size = pop_size
         self.generations = generations
         self.mut_rate = mut_rate
+        self.fitness_cache = fitness_cache
+        self.stopping = stopping
+        self.stop_reason = None
         self.history = []
+        self.cache_stats = None
     
     def run(self, population: List[Individual2D], verbose=False):
         """GA 실행"""
         pop = [ind.copy() for ind in population]
         best_ever = None
         best_fitness = -np.inf
+        cache = self.fitness_cache if self.fitness_cache is not None else FitnessCache()
+        policy = (self.stopping or StoppingPolicy()).started()
+        misses = cache.misses
+        self.stop_reason = 'generations'
         
         for gen in range(self.generations):
             # 평가
-            fitness = [ind.evaluate() for ind in pop]
+            fitness = [cache.evaluate(ind) for ind in pop]
             max_fit = max(fitness)
             avg_fit = np.mean(fitness)
             self.history.append({'max': max_fit, 'avg': avg_fit})
@@ -161,6 +202,14 @@ class GARunner2D:
             if verbose:
                 print(f"Gen {gen+1}: max={max_fit:.4f}, avg={avg_fit:.4f}")
             
+            # 종료 조건
+            diversity = population_diversity([ind.layout_2d for ind in pop]) if policy.needs_diversity else None
+            if policy.update(1.0 / best_fitness - 1e-6, cache.misses - misses, diversity):
+                self.stop_reason = policy.reason
+                if verbose:
+                    print(f"Stopping at generation {gen+1}: {policy.reason}")
+                break
+            
             # 새 세대
             new_pop = []
             
@@ -188,4 +237,5 @@ class GARunner2D:
             
             pop = new_pop[:self.pop_size]
         
+        self.cache_stats = cache.stats()
         return best_ever, pop
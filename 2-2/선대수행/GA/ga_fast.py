@@ -15,6 +15,8 @@ parent_path = Path(__file__).parent.parent
 sys.path.insert(0, str(parent_path))
 
 from models.keyboard_layout import Keyboard
+from GA.fitness_cache import FitnessCache, copy_cached_state
+from GA.stopping import StoppingPolicy, population_diversity
 
 
 class Individual:
@@ -60,8 +62,8 @@ class Individual:
         return fatigue
     
     def copy(self):
-        """복사"""
-        return Individual(self.layout.copy(), self.keyboard, self.co_occurrence, self.lap_weight)
+        """복사 (평가된 개체는 적합도도 함께)"""
+        return copy_cached_state(self, Individual(self.layout.copy(), self.keyboard, self.co_occurrence, self.lap_weight))
 
 
 class GAOperators:
@@ -107,22 +109,35 @@ class GAOperators:
 class GARunner:
     """GA 실행기"""
     
-    def __init__(self, pop_size=20, generations=50, mut_rate=0.1, cross_rate=0.8):
+    def __init__(self, pop_size=20, generations=50, mut_rate=0.1, cross_rate=0.8,
+                 fitness_cache: FitnessCache = None, stopping: StoppingPolicy = None):
+        """
+        fitness_cache: 여러 실행이 공유할 적합도 캐시 (None이면 run()마다 새로 생성)
+        stopping: 종료 조건 (patience, 평탄 구간, 다양성, 시간, 평가 수 - GA.stopping 참고)
+        """
         self.pop_size = pop_size
         self.generations = generations
         self.mut_rate = mut_rate
         self.cross_rate = cross_rate
+        self.fitness_cache = fitness_cache
+        self.stopping = stopping
+        self.stop_reason = None
         self.history = []
+        self.cache_stats = None
     
     def run(self, population, verbose=False):
         """GA 실행"""
         pop = [ind.copy() for ind in population]
         best_ever = None
         best_fitness = -np.inf
+        cache = self.fitness_cache if self.fitness_cache is not None else FitnessCache()
+        policy = (self.stopping or StoppingPolicy()).started()
+        misses = cache.misses
+        self.stop_reason = 'generations'
         
         for gen in range(self.generations):
             # 평가
-            fitness = [ind.evaluate() for ind in pop]
+            fitness = [cache.evaluate(ind) for ind in pop]
             max_fit = max(fitness)
             avg_fit = np.mean(fitness)
             self.history.append({'max': max_fit, 'avg': avg_fit})
@@ -134,6 +149,14 @@ class GARunner:
             if verbose:
                 print(f"Gen {gen+1}: max={max_fit:.4f}, avg={avg_fit:.4f}")
             
+            # 종료 조건
+            diversity = population_diversity([ind.layout for ind in pop]) if policy.needs_diversity else None
+            if policy.update(1.0 / best_fitness - 1e-6, cache.misses - misses, diversity):
+                self.stop_reason = policy.reason
+                if verbose:
+                    print(f"Stopping at generation {gen+1}: {policy.reason}")
+                break
+            
             # 새 세대
             new_pop = []
             
@@ -161,4 +184,5 @@ class GARunner:
             
             pop = new_pop[:self.pop_size]
         
+        self.cache_stats = cache.stats()
         return best_ever, pop
@@ -5,6 +5,7 @@
 
 import numpy as np
 import pandas as pd
+import time
 from typing import List, Tuple
 import sys
 from pathlib import Path
@@ -12,9 +13,18 @@ from pathlib import Path
 parent_path = Path(__file__).parent.parent
 sys.path.insert(0, str(parent_path))
 
-from models.keyboard_layout_corrected import KeyboardLayout
+from models.keyboard_layout_corrected import KeyboardLayout, char_cells
 from models.fatigue_corrected import FatigueModel
 from models.rw_laplacian import laplacian_spectral
+from GA.cost_model import CostModel2D
+from GA.fitness_cache import FitnessCache, copy_cached_state
+from GA.crossover import usable_cells
+from GA.selection import tournament_select
+from GA.mutation import draw_swaps
+from GA.lower_bound import layout_lower_bound
+from GA.stopping import StoppingPolicy, population_diversity
+from models.step_cost import (step_cost_tensor, grid_distance_sq_tensor, center_distance_cost,
+                               swap_delta, quadratic_form_delta)
 
 
 class Individual2D_Full:
@@ -47,7 +57,6 @@ class Individual2D_Full:
             freq_weight: 개별 자모 빈도 비용 가중치
         """
         self.layout_2d = np.array(layout_2d, dtype=int)
-        self.shape = self.layout_2d.shape
         self.keyboard = keyboard
         self.fatigue_model = fatigue_model_obj
         self.co_occurrence = co_occurrence
@@ -59,13 +68,37 @@ class Individual2D_Full:
         self._fitness = None
         self._fatigue_total = None
         self._fatigue_lap = None
+        self._lap_raw = None
         self._freq_cost = None
+        self._step_costs = None
+    
+    @property
+    def layout_2d(self) -> np.ndarray:
+        return self._layout_2d
+    
+    @layout_2d.setter
+    def layout_2d(self, layout: np.ndarray):
+        """배열 교체 시 글자 → 셀 역인덱스(char_cells)도 함께 재구성"""
+        self._layout_2d = np.ascontiguousarray(layout, dtype=int)
+        self.shape = self._layout_2d.shape
+        self.char_cells = char_cells(self._layout_2d)
+        self._fitness = None
+    
+    def swap_cells(self, cell_a: int, cell_b: int):
+        """두 flat 셀의 글자 교환 - 역인덱스는 O(1)로 갱신"""
+        flat = self._layout_2d.reshape(-1)
+        char_a, char_b = flat[cell_a], flat[cell_b]
+        flat[cell_a], flat[cell_b] = char_b, char_a
+        if char_a >= 0:
+            self.char_cells[char_a] = cell_b
+        if char_b >= 0:
+            self.char_cells[char_b] = cell_a
+        self._fitness = None
     
     def get_position_in_keyboard(self, char_idx: int) -> Tuple[int, int]:
         """2D 배열에서 글자의 위치 반환"""
-        positions = np.where(self.layout_2d == char_idx)
-        if len(positions[0]) > 0:
-            return (positions[0][0], positions[1][0])
+        if 0 <= char_idx < len(self.char_cells) and self.char_cells[char_idx] >= 0:
+            return divmod(int(self.char_cells[char_idx]), self.shape[1])
         return None
     
     def get_keyboard_position(self, row: int, col: int) -> Tuple[int, int]:
@@ -105,84 +138,118 @@ class Individual2D_Full:
         if self._fitness is None:
             self._freq_cost = self._calc_freq_cost()
             self._fatigue_total = self._calc_fatigue_total()
-            self._fatigue_lap = self._calc_fatigue_laplacian()
-            total_cost = (self.freq_weight * self._freq_cost + 
-                         self._fatigue_total + 
-                         self.lap_weight * self._fatigue_lap)
-            self._fitness = 1.0 / (total_cost + 1e-6)
+            self._lap_raw = self._calc_laplacian_raw()
+            self._fatigue_lap = max(0, self._lap_raw)
+            self._fitness = self._fitness_from_terms()
         return self._fitness
     
+    def set_costs(self, fatigue_total: float, lap_raw: float, freq_cost: float):
+        """외부(일괄 평가)에서 계산한 비용 항을 캐시하고 적합도 갱신"""
+        self._fatigue_total = float(fatigue_total)
+        self._lap_raw = float(lap_raw)
+        self._fatigue_lap = max(0, self._lap_raw)
+        self._freq_cost = float(freq_cost)
+        self._fitness = self._fitness_from_terms()
+    
+    def _fitness_from_terms(self) -> float:
+        total_cost = (self.freq_weight * self._freq_cost + 
+                     self._fatigue_total + 
+                     self.lap_weight * self._fatigue_lap)
+        return 1.0 / (total_cost + 1e-6)
+    
+    def delta_swap(self, cell_a: int, cell_b: int) -> np.ndarray:
+        """
+        두 flat 셀의 글자를 맞바꿨을 때 비용 항의 정확한 변화량 (O(26))
+        Returns:
+            [Δ 총 피로도(쌍), Δ 라플라시안 페널티, Δ 개별 자모 빈도 비용]
+        """
+        self.evaluate()
+        d_fatigue, d_lap_raw, d_freq = self._swap_deltas(cell_a, cell_b)
+        d_lap = max(0, self._lap_raw + d_lap_raw) - self._fatigue_lap
+        return np.array([d_fatigue, d_lap, d_freq])
+    
+    def apply_swap(self, cell_a: int, cell_b: int):
+        """셀 스왑 - 이미 평가된 개체는 전체 재평가 대신 delta로 적합도 갱신"""
+        if self._fitness is None:
+            self.swap_cells(cell_a, cell_b)
+            return
+        d_fatigue, d_lap_raw, d_freq = self._swap_deltas(cell_a, cell_b)
+        self.swap_cells(cell_a, cell_b)
+        self._fatigue_total += d_fatigue
+        self._lap_raw += d_lap_raw
+        self._fatigue_lap = max(0, self._lap_raw)
+        self._freq_cost += d_freq
+        self._fitness = self._fitness_from_terms()
+    
+    def _swap_deltas(self, cell_a: int, cell_b: int) -> Tuple[float, float, float]:
+        """(Δ 피로도, Δ 라플라시안 이차형식(clamp 전), Δ 빈도 비용)"""
+        flat = self._layout_2d.reshape(-1)
+        char_a, char_b = int(flat[cell_a]), int(flat[cell_b])
+        W, cells = self._placed_weights()
+
+        S = self._step_cost_tensor()
+        d_fatigue = swap_delta(W, S, cells, cell_a, cell_b, char_a, char_b)
+
+        L = self._laplacian_matrix()
+        if L is None:
+            G = grid_distance_sq_tensor(*self.shape)
+            d_lap = swap_delta(W, G, cells, cell_a, cell_b, char_a, char_b)
+        else:
+            coord_x, coord_y = self._laplacian_coords()
+            moved = [c for c in (char_a, char_b) if 0 <= c < 26]
+            new_cells = np.array([cell_b if c == char_a else cell_a for c in moved])
+            new_y, new_x = np.divmod(new_cells, self.shape[1])
+            d_lap = (quadratic_form_delta(L, coord_x, moved, new_x) +
+                     quadratic_form_delta(L, coord_y, moved, new_y))
+
+        position_cost = center_distance_cost(*self.shape)
+        freq = np.asarray(self.frequency_vec[:26], dtype=float)
+        d_freq = 0.0
+        for char, old_cell, new_cell in ((char_a, cell_a, cell_b), (char_b, cell_b, cell_a)):
+            if 0 <= char < len(freq) and freq[char] > 0:
+                d_freq += freq[char] * (position_cost[new_cell] - position_cost[old_cell])
+
+        return d_fatigue, d_lap, float(d_freq)
+    
     def _calc_freq_cost(self) -> float:
         """
         개별 자모 빈도 비용 = Σ freq[i] · position_cost[i]
         자주 나타나는 자모가 피로가 많은 위치에 있으면 페널티
         """
-        freq_cost = 0.0
-        for char_idx in range(26):
-            if self.frequency_vec[char_idx] <= 0:
-                continue
-            
-            pos = self.get_position_in_keyboard(char_idx)
-            if pos is None:
-                continue
-            
-            # 키보드의 중심(row=1, col=4.5)으로부터의 거리 제곱을 위치 비용으로 사용
-            # 중심에서 멀수록 높은 비용
-            center_row, center_col = 1.0, 4.5
-            position_cost = ((pos[0] - center_row) ** 2 + (pos[1] - center_col) ** 2)
-            freq_cost += self.frequency_vec[char_idx] * position_cost
-        
-        return freq_cost
+        # 키보드의 중심(row=1, col=4.5)으로부터의 거리 제곱을 위치 비용으로 사용
+        freq = np.asarray(self.frequency_vec[:26], dtype=float)
+        cells = self.char_cells[:len(freq)]
+        used = (freq > 0) & (cells >= 0)
+        return float(freq[used] @ center_distance_cost(*self.shape)[cells[used]])
     
     def _calc_fatigue_total(self) -> float:
         """
         총 피로도 = Σ W_ij · f_step(i,j)
         f_step = distance × f2 × f3 × f4
+        셀 쌍 step 비용 텐서 S를 글자 위치로 인덱싱해서 한 번에 계산
         """
-        W = self.co_occurrence
-        total_fatigue = 0.0
-
-        n_chars = min(26, W.shape[0])
-        # Full pairwise computation over the 26 characters (or available size)
-        for i in range(n_chars):
-            for j in range(n_chars):
-                w_ij = W[i, j]
-                if w_ij <= 0:
-                    continue
-
-                # positions in layout
-                pos_i = self.get_position_in_keyboard(i)
-                pos_j = self.get_position_in_keyboard(j)
-                if pos_i is None or pos_j is None:
-                    continue
-
-                # distance (KeyboardLayout.distance takes (row,col) tuples)
-                dist = self.distance_in_keyboard(i, j)
-
-                # finger/hand info via keyboard model
-                pos_i_idx = self.get_keyboard_position(pos_i[0], pos_i[1])
-                pos_j_idx = self.get_keyboard_position(pos_j[0], pos_j[1])
-                hand_i, finger_i = self.keyboard.get_hand_finger(pos_i_idx)
-                hand_j, finger_j = self.keyboard.get_hand_finger(pos_j_idx)
-
-                # f2, f3, f4 via fatigue model
-                try:
-                    f2 = self.fatigue_model.get_f2_cost(finger_i, finger_j)
-                except Exception:
-                    f2 = 1.0
-                try:
-                    f3 = self.fatigue_model.get_f3_cost(hand_i, hand_j, pos_i[0], pos_j[0])
-                except Exception:
-                    f3 = 1.0
-                try:
-                    f4 = self.fatigue_model.get_f4_cost(finger_i, finger_j)
-                except Exception:
-                    f4 = 1.0
-
-                f_step = dist * f2 * f3 * f4
-                total_fatigue += w_ij * f_step
+        W, cells = self._placed_weights()
+        S = self._step_cost_tensor()
+        return float((W * S[cells][:, cells]).sum())
+    
+    def _step_cost_tensor(self) -> np.ndarray:
+        """셀 쌍 step 비용 S - 처음 한 번만 가져와서 copy()로 만든 개체끼리 공유"""
+        n_cells = self.shape[0] * self.shape[1]
+        if self._step_costs is None or self._step_costs.shape[0] != n_cells:
+            self._step_costs = step_cost_tensor(self.keyboard, self.fatigue_model, *self.shape)
+        return self._step_costs
+    
+    def _placed_weights(self) -> Tuple[np.ndarray, np.ndarray]:
+        """양수 W 중 두 글자가 모두 배치된 쌍만 남긴 가중치와 글자별 셀"""
+        n_chars = min(26, self.co_occurrence.shape[0])
+        W = self.co_occurrence[:n_chars, :n_chars]
+        W = np.where(W > 0, W, 0.0)
 
-        return total_fatigue
+        cells = self.char_cells[:n_chars]
+        placed = cells >= 0
+        if not placed.all():
+            W = W * np.outer(placed, placed)
+        return W, cells
     
     def _calc_fatigue_laplacian(self) -> float:
         """
@@ -192,76 +259,94 @@ class Individual2D_Full:
         자주 함께 쓰이는 글자(높은 W[i,j])가 멀리 떨어져 있으면 높은 페널티
         Laplacian L을 통해 전체 그래프 구조의 smoothness를 평가
         """
-        if self.laplacian_spectral is None:
+        return max(0, self._calc_laplacian_raw())  # Ensure non-negative
+    
+    def _calc_laplacian_raw(self) -> float:
+        """x^T L x + y^T L y (clamp 전) - L이 없거나 크기가 맞지 않으면 grid 페널티"""
+        L = self._laplacian_matrix()
+        if L is None:
             # fallback to simple grid distance if laplacian not available
             return self._calc_fatigue_laplacian_grid()
-
-        # Compute Laplacian matrix
-        L = self.laplacian_spectral.compute_laplacian(normalized=True)
-        
-        # Create coordinate vector: for each character i, store its (row, col) position
-        # We'll use a linear combination of row and col coordinates
-        n_chars = 26
-        coord_x = np.zeros(n_chars)
-        coord_y = np.zeros(n_chars)
-        
-        for char_idx in range(n_chars):
-            pos = self.get_position_in_keyboard(char_idx)
-            if pos is not None:
-                coord_x[char_idx] = pos[1]  # column
-                coord_y[char_idx] = pos[0]  # row
-            else:
-                # Character not placed; use neutral coordinate
-                coord_x[char_idx] = 0
-                coord_y[char_idx] = 0
         
         # Compute quadratic form: x^T L x + y^T L y
         # This penalizes arrangements where frequently-co-occurring characters are far apart
-        try:
-            penalty_x = coord_x @ L @ coord_x
-            penalty_y = coord_y @ L @ coord_y
-            penalty = penalty_x + penalty_y
-        except Exception as e:
-            # Fallback to grid distance if Laplacian computation fails
-            penalty = self._calc_fatigue_laplacian_grid()
-        
-        return max(0, penalty)  # Ensure non-negative
+        coord_x, coord_y = self._laplacian_coords()
+        return float(self.laplacian_spectral.quadratic_form(coord_x, coord_y, normalized=True))
+    
+    def _laplacian_matrix(self):
+        if self.laplacian_spectral is None:
+            return None
+        L = self.laplacian_spectral.compute_laplacian(normalized=True)
+        if L.shape != (26, 26):
+            return None
+        return L
+    
+    def _laplacian_coords(self) -> Tuple[np.ndarray, np.ndarray]:
+        """글자별 (열, 행) 좌표 벡터 - 배치되지 않은 글자는 중립 좌표 0"""
+        cells = self.char_cells[:26]
+        coord_y, coord_x = np.divmod(np.where(cells >= 0, cells, 0), self.shape[1])
+        return coord_x.astype(float), coord_y.astype(float)
     
     def _calc_fatigue_laplacian_grid(self) -> float:
         """
         Fallback: 간단한 grid 거리 기반 라플라시안 페널티
         라플라시안 객체가 없을 때 사용
         """
-        W = self.co_occurrence
-        penalty = 0.0
-        n_chars = min(26, W.shape[0])
-
-        for i in range(n_chars):
-            for j in range(n_chars):
-                w_ij = W[i, j]
-                if w_ij <= 0:
-                    continue
-                pos_i = self.get_position_in_keyboard(i)
-                pos_j = self.get_position_in_keyboard(j)
-                if pos_i is None or pos_j is None:
-                    continue
-                dist_sq = (pos_i[0] - pos_j[0])**2 + (pos_i[1] - pos_j[1])**2
-                penalty += w_ij * dist_sq
-
-        return penalty
+        W, cells = self._placed_weights()
+        rows, cols = np.divmod(cells, self.shape[1])
+        dist_sq = (rows[:, None] - rows[None, :]) ** 2 + (cols[:, None] - cols[None, :]) ** 2
+        return float((W * dist_sq).sum())
     
     def copy(self):
-        """복사"""
-        return Individual2D_Full(
+        """
+        복사 (평가된 개체는 캐시된 비용 항과 적합도도 함께)
+        frequency_vec, step 비용 S는 읽기만 하므로 다른 문맥 객체처럼 공유
+        """
+        clone = Individual2D_Full(
             self.layout_2d.copy(),
             self.keyboard,
             self.fatigue_model,
             self.co_occurrence,
-            self.frequency_vec.copy() if self.frequency_vec is not None else None,
+            self.frequency_vec,
             self.laplacian_spectral,
             self.lap_weight,
             self.freq_weight
         )
+        clone._step_costs = self._step_costs
+        return copy_cached_state(self, clone)
+
+
+def evaluate_population(population: List[Individual2D_Full],
+                        cost_model: CostModel2D = None,
+                        cache: FitnessCache = None) -> np.ndarray:
+    """
+    모집단 일괄 평가 - 아직 평가되지 않은 개체만 (P, 26) 셀 배열로 묶어 한 번에 계산
+    cache가 주어지면 이미 평가한 배열은 캐시에서 가져오고, 같은 배열은 한 번만 계산
+    Returns:
+        (P, 3) [총 피로도(쌍), 라플라시안 페널티, 개별 자모 빈도 비용]
+    """
+    if not population:
+        return np.empty((0, 3))
+    if cost_model is None:
+        cost_model = CostModel2D.from_individual(population[0])
+
+    pending = [ind for ind in population if ind._fitness is None]
+    if cache is not None:
+        pending = [ind for ind in pending if not cache.lookup(ind)]
+
+    groups = {}
+    for ind in pending:
+        groups.setdefault(FitnessCache.key(ind.layout_2d), []).append(ind)
+    if groups:
+        unique = [inds[0] for inds in groups.values()]
+        cells = np.stack([ind.char_cells[:26] for ind in unique])
+        for inds, (fatigue, lap_raw, freq) in zip(groups.values(), cost_model.raw_costs(cells)):
+            for ind in inds:
+                ind.set_costs(fatigue, lap_raw, freq)
+            if cache is not None:
+                cache.store(inds[0])
+
+    return np.array([[ind._fatigue_total, ind._fatigue_lap, ind._freq_cost] for ind in population])
 
 
 class GAOperators2D_Full:
@@ -277,117 +362,241 @@ class GAOperators2D_Full:
     @staticmethod
     def crossover_2d(p1: Individual2D_Full, p2: Individual2D_Full) -> Tuple[Individual2D_Full, Individual2D_Full]:
         """2D 교차 - 행 단위 교환"""
+        c1_layout, c2_layout = GAOperators2D_Full.crossover_layouts(p1.layout_2d, p2.layout_2d)
+        if c1_layout is None:
+            return p1.copy(), p2.copy()
+
+        # layout_2d setter가 역인덱스를 재구성하고 _fitness를 초기화
+        c1 = p1.copy()
+        c1.layout_2d = c1_layout
+
+        c2 = p2.copy()
+        c2.layout_2d = c2_layout
+
+        return c1, c2
+    
+    @staticmethod
+    def crossover_layouts(layout1: np.ndarray, layout2: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        crossover_2d의 배열 버전 - 자식 배열 두 개 (사용 가능한 셀이 1개 이하면 (None, None))
+        """
         # Preserve uniqueness of characters by performing an order-preserving
         # crossover on the sequence of usable (non -1) cells. This avoids
         # creating duplicates or dropping characters.
-        layout1 = p1.layout_2d.copy()
-        layout2 = p2.layout_2d.copy()
+        layout1 = np.array(layout1, dtype=int)
+        layout2 = np.array(layout2, dtype=int)
 
-        # Determine allowed (usable) positions as list of (r,c)
-        allowed_pos = [(r, c) for r in range(layout1.shape[0]) for c in range(layout1.shape[1]) if layout1[r, c] != -1]
-        n = len(allowed_pos)
+        # 사용 가능한 셀과 그 셀의 글자 순서열 (flat 인덱스로 한 번에)
+        allowed = usable_cells(layout1)
+        n = len(allowed)
         if n <= 1:
-            return p1.copy(), p2.copy()
-
-        # Extract sequences of character indices from allowed positions
-        seq1 = [int(layout1[r, c]) for (r, c) in allowed_pos]
-        seq2 = [int(layout2[r, c]) for (r, c) in allowed_pos]
+            return None, None
+        seq1 = layout1.reshape(-1)[allowed]
+        seq2 = layout2.reshape(-1)[allowed]
 
         # One-point order-preserving crossover (simple OX-like)
         pt = np.random.randint(1, n)
 
         def ox_child(a, b):
-            head = a[:pt]
-            tail = [x for x in b if x not in head]
-            return head + tail
-
-        child1_seq = ox_child(seq1, seq2)
-        child2_seq = ox_child(seq2, seq1)
+            # 앞부분에 쓰인 글자 표시 후 b에서 나머지를 순서대로 (+1은 -1 값용 칸)
+            in_head = np.zeros(max(a.max(), b.max()) + 2, dtype=bool)
+            in_head[a[:pt] + 1] = True
+            return np.concatenate([a[:pt], b[~in_head[b + 1]]])
 
         # Build child layouts by copying parents and filling allowed positions
-        c1_layout = layout1.copy()
-        c2_layout = layout2.copy()
-        for (r, c), val1, val2 in zip(allowed_pos, child1_seq, child2_seq):
-            c1_layout[r, c] = val1
-            c2_layout[r, c] = val2
-
-        c1 = p1.copy()
-        c1.layout_2d = c1_layout
-        c1._fitness = None
-
-        c2 = p2.copy()
-        c2.layout_2d = c2_layout
-        c2._fitness = None
-
-        return c1, c2
+        layout1.reshape(-1)[allowed] = ox_child(seq1, seq2)
+        layout2.reshape(-1)[allowed] = ox_child(seq2, seq1)
+        return layout1, layout2
     
     @staticmethod
     def mutate_2d(ind: Individual2D_Full, rate=0.1) -> Individual2D_Full:
         """2D 돌연변이 - 셀 스왑"""
         if np.random.random() < rate:
-            layout = ind.layout_2d
             # choose two random usable positions (non -1) to swap
-            usable = [(r, c) for r in range(layout.shape[0]) for c in range(layout.shape[1]) if layout[r, c] != -1]
+            usable = usable_cells(ind.layout_2d)
             if len(usable) >= 2:
-                (r1, c1), (r2, c2) = tuple(usable[i] for i in np.random.choice(len(usable), 2, replace=False))
-                layout[r1, c1], layout[r2, c2] = layout[r2, c2], layout[r1, c1]
-                ind._fitness = None
+                cell_a, cell_b = usable[np.random.choice(len(usable), 2, replace=False)]
+                # 평가된 개체는 delta로 적합도 갱신 (전체 재평가 없음)
+                ind.apply_swap(cell_a, cell_b)
 
         return ind
 
 
+    @staticmethod
+    def local_search_2d(ind: Individual2D_Full, cells: np.ndarray, mode: str = 'first',
+                        max_evals: int = None, max_time: float = None) -> int:
+        """
+        2-swap 언덕 오르기 (memetic) - 사용 가능한 셀 쌍 교환을 O(n) delta로 평가
+        Args:
+            cells: 교환할 수 있는 flat 셀 (usable_cells)
+            mode: 'first' (무작위 순서로 보다가 처음 개선되는 교환 적용) / 'best' (한 바퀴 중 최선 적용)
+            max_evals: delta 평가 횟수 예산
+            max_time: 초 단위 시간 예산
+        Returns:
+            사용한 delta 평가 수
+        """
+        if mode not in ('first', 'best'):
+            raise ValueError(f"unknown local search mode: {mode}")
+        ind.evaluate()
+        weights = np.array([1.0, ind.lap_weight, ind.freq_weight])  # [피로도, 라플라시안, 빈도]
+        i, j = np.triu_indices(len(cells), 1)
+        pairs = np.stack([cells[i], cells[j]], axis=1).tolist()
+        deadline = time.perf_counter() + max_time if max_time is not None else None
+
+        evals = 0
+        improved = True
+        while improved:
+            improved = False
+            order = np.random.permutation(len(pairs)) if mode == 'first' else range(len(pairs))
+            best_gain, best_pair = 0.0, None
+            for k in order:
+                if (max_evals is not None and evals >= max_evals) or \
+                   (deadline is not None and time.perf_counter() >= deadline):
+                    improved = False
+                    break
+                cell_a, cell_b = pairs[k]
+                gain = -float(weights @ ind.delta_swap(cell_a, cell_b))
+                evals += 1
+                if gain > 1e-12:
+                    if mode == 'first':
+                        ind.apply_swap(cell_a, cell_b)
+                        improved = True
+                    elif gain > best_gain:
+                        best_gain, best_pair = gain, (cell_a, cell_b)
+            if best_pair is not None:
+                ind.apply_swap(*best_pair)
+                improved = True
+        return evals
+
+
 class GARunner2D_Full:
     """통합 2D GA 실행기"""
     
-    def __init__(self, pop_size=20, generations=50, mut_rate=0.1):
+    def __init__(self, pop_size=20, generations=50, mut_rate=0.1, fitness_cache: FitnessCache = None,
+                 memetic_rate: float = 0.0, memetic_mode: str = 'first',
+                 memetic_evals: int = 300, memetic_time: float = None, gap_epsilon: float = None,
+                 stopping: StoppingPolicy = None):
+        """
+        fitness_cache: 여러 실행이 공유할 적합도 캐시 (None이면 run()마다 새로 생성)
+        memetic_rate: 2-swap 지역 탐색을 적용할 자식 비율 (0이면 끔)
+        memetic_mode: 'first' / 'best' 개선 방식
+        memetic_evals, memetic_time: 자식 하나당 delta 평가 수 / 초 예산
+        gap_epsilon: 최고 비용과 Gilmore–Lawler 하한의 상대 간격이 이 값 이하면 종료 (None이면 끔)
+        stopping: 종료 조건 (patience, 평탄 구간, 다양성, 시간, 평가 수 - GA.stopping 참고)
+        """
         self.pop_size = pop_size
         self.generations = generations
         self.mut_rate = mut_rate
+        self.fitness_cache = fitness_cache
+        self.memetic_rate = memetic_rate
+        self.memetic_mode = memetic_mode
+        self.memetic_evals = memetic_evals
+        self.memetic_time = memetic_time
+        self.gap_epsilon = gap_epsilon
+        self.stopping = stopping
+        self.lower_bound = None
+        self.gap = None
+        self.stop_reason = None
         self.history = []
+        self.cache_stats = None
+        self.local_search_evals = 0
+        self.population = None
     
-    def run(self, population: List[Individual2D_Full], verbose=False):
-        """GA 실행"""
-        pop = [ind.copy() for ind in population]
+    def run(self, population, verbose=False):
+        """
+        GA 실행 - 세대는 Population(배열 + 비용 항)으로 보관하고 평가 문맥은 하나만 공유
+        개체는 최고 개체, 지역 탐색 대상, 반환할 마지막 세대만 만듦
+        Args:
+            population: 개체 리스트 또는 Population (둘 다 그대로 두고 복사본으로 진행)
+        Returns:
+            (최고 개체, 마지막 세대 개체 리스트) - 마지막 세대 Population은 self.population
+        """
+        from GA.population import Population #GA.population이 이 모듈을 import하므로 여기서
+
+        if isinstance(population, Population):
+            cost_model = population.cost_model
+            pop = population.take(np.arange(len(population)))
+        else:
+            cost_model = CostModel2D.from_individual(population[0])
+            pop = Population.from_individuals(population, cost_model)
         best_ever = None
         best_fitness = -np.inf
+        cache = self.fitness_cache if self.fitness_cache is not None else FitnessCache()
+        cells = usable_cells(pop.layouts[0])
+        policy = (self.stopping or StoppingPolicy()).started(gap_epsilon=self.gap_epsilon)
+        if policy.needs_bound:
+            policy.lower_bound = layout_lower_bound(cost_model, cells)
+        self.lower_bound = policy.lower_bound
+        misses, ls_evals = cache.misses, self.local_search_evals
+        self.stop_reason = 'generations'
         
         for gen in range(self.generations):
-            fitness = [ind.evaluate() for ind in pop]
-            max_fit = max(fitness)
+            # 세대 전체 일괄 평가 (이미 비용 항이 있는 행은 건너뜀)
+            fitness = pop.evaluate(cache)
+            max_fit = float(fitness.max())
             avg_fit = np.mean(fitness)
             self.history.append({'max': max_fit, 'avg': avg_fit})
             
             if max_fit > best_fitness:
                 best_fitness = max_fit
-                best_ever = pop[np.argmax(fitness)].copy()
+                best_ever = pop.individual(int(np.argmax(fitness)))
             
             if verbose:
                 print(f"Gen {gen+1}: max={max_fit:.4f}, avg={avg_fit:.4f}")
             
-            new_pop = []
+            # 종료 조건 (하한과의 간격, patience, 시간 등)
+            diversity = population_diversity(pop.layouts) if policy.needs_diversity else None
+            stop = policy.update(1.0 / best_fitness - 1e-6,
+                                 cache.misses - misses + self.local_search_evals - ls_evals, diversity)
+            self.gap = policy.gap
+            if stop:
+                self.stop_reason = policy.reason
+                if verbose:
+                    print(f"Stopping at generation {gen+1}: {policy.reason}")
+                break
             
-            # 엘리트
+            # 엘리트 - 행(배열 + 비용 항) 그대로
             elite_idx = np.argsort(fitness)[-2:]
-            for idx in elite_idx:
-                new_pop.append(pop[idx].copy())
+            layouts = list(pop.layouts[elite_idx])
+            raw_costs = list(pop.raw_costs[elite_idx])
             
-            # 나머지
-            while len(new_pop) < self.pop_size:
-                p1 = GAOperators2D_Full.select(pop)
-                p2 = GAOperators2D_Full.select(pop)
-                
+            # 나머지 - 부모는 3-토너먼트로 한 번에 인덱스만 뽑고, 교차한 자식만 미평가
+            n_elite = len(layouts)
+            n_pairs = (self.pop_size - n_elite + 1) // 2
+            parent_idx = tournament_select(fitness, 2 * n_pairs, k=3).reshape(-1, 2)
+            unevaluated = np.full(3, np.nan)
+            for i, j in parent_idx:
+                c1, c2 = None, None
                 if np.random.random() < 0.8:
-                    c1, c2 = GAOperators2D_Full.crossover_2d(p1, p2)
+                    c1, c2 = GAOperators2D_Full.crossover_layouts(pop.layouts[i], pop.layouts[j])
+                if c1 is None:
+                    children = [(pop.layouts[i], pop.raw_costs[i]), (pop.layouts[j], pop.raw_costs[j])]
                 else:
-                    c1, c2 = p1, p2
-                
-                GAOperators2D_Full.mutate_2d(c1, self.mut_rate)
-                GAOperators2D_Full.mutate_2d(c2, self.mut_rate)
-                
-                new_pop.append(c1)
-                if len(new_pop) < self.pop_size:
-                    new_pop.append(c2)
+                    children = [(c1, unevaluated), (c2, unevaluated)]
+                for layout, raw in children:
+                    if len(layouts) < self.pop_size:
+                        layouts.append(layout)
+                        raw_costs.append(raw)
+            new_pop = Population(np.stack(layouts), pop.template, cost_model, np.stack(raw_costs))
+            
+            # 돌연변이 - 자식 전체의 스왑을 한 번에 뽑고, 평가된 행은 delta로 갱신
+            children = np.arange(n_elite, len(new_pop))
+            mutated = (np.random.random(len(children)) < self.mut_rate).astype(int)
+            rows, pairs = draw_swaps(mutated, np.arange(len(children)), cells)
+            new_pop.apply_swaps(children[rows], pairs[:, 0], pairs[:, 1])
+            
+            # memetic - 일부 자식을 지역 탐색으로 개선 (시작 전 일괄 평가)
+            if self.memetic_rate > 0 and len(children):
+                chosen = children[np.flatnonzero(np.random.random(len(children)) < self.memetic_rate)]
+                new_pop.evaluate(cache, chosen)
+                for k in chosen.tolist():
+                    child = new_pop.individual(k)
+                    self.local_search_evals += GAOperators2D_Full.local_search_2d(
+                        child, cells, self.memetic_mode, self.memetic_evals, self.memetic_time)
+                    new_pop.set_individual(k, child)
             
-            pop = new_pop[:self.pop_size]
+            pop = new_pop
         
-        return best_ever, pop
+        self.population = pop
+        self.cache_stats = cache.stats()
+        return best_ever, pop.to_individuals()
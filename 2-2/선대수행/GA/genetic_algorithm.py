@@ -12,6 +12,13 @@ sys.path.insert(0, str(parent_path))
 from models.fatigue import fatigue_model
 from models.keyboard_layout import Keyboard
 from models.rw_laplacian import laplacian_spectral
+from GA.fitness_cache import FitnessCache, copy_cached_state
+from GA.parallel import ParallelEvaluator
+from GA.crossover import ox_crossover as ox_kernel, pmx_crossover as pmx_kernel
+from GA.selection import select_parents
+from GA.mutation import swap_mutation, inversion_mutation, levy_flight_mutation
+from GA.lower_bound import qap_lower_bound
+from GA.stopping import StoppingPolicy, population_diversity
 
 
 class Individual: #유전 알고리즘 개체, array 순열로 표현하고 fatigue 역수가 적합도임 (낮을수록 적합함)
@@ -28,11 +35,14 @@ class Individual: #유전 알고리즘 개체, array 순열로 표현하고 fati
     
     def evaluate(self) -> float:
         if self._fitness is None:
-            self._fatigue = self.calculate_total_fatigue()
-            epsilon = 1e-6
-            self._fitness = 1.0 / (self._fatigue + epsilon)
+            self.set_fatigue(self.calculate_total_fatigue())
         return self._fitness
     
+    def set_fatigue(self, fatigue: float): #외부(병렬 워커)에서 계산한 피로도로 적합도 설정
+        self._fatigue = fatigue
+        epsilon = 1e-6
+        self._fitness = 1.0 / (self._fatigue + epsilon)
+    
     def calculate_total_fatigue(self) -> float: #전체 피로도
         C_total = self._calculate_step_fatigue()
         
@@ -98,15 +108,37 @@ class Individual: #유전 알고리즘 개체, array 순열로 표현하고 fati
         
         return penalty
     
-    def copy(self) -> 'Individual':
+    def copy(self) -> 'Individual': #평가된 개체는 적합도도 함께 복사
         new_layout = self.layout.copy()
-        return Individual(
+        return copy_cached_state(self, Individual(
             new_layout, 
             self.keyboard, 
             self.fatigue_calc,
             self.co_occurrence_matrix,
             self.laplacian_weight
-        )
+        ))
+
+
+def _layout_fatigue(layout: np.ndarray, arrays: Dict, context: Dict) -> float: #병렬 워커용: 공유 메모리의 W로 피로도 계산
+    ind = Individual(layout, context['keyboard'], context['fatigue_calc'],
+                     arrays.get('W'), context['laplacian_weight'])
+    return ind.calculate_total_fatigue()
+
+
+def fatigue_lower_bound(template: Individual, method: str = 'best') -> float: #Individual.calculate_total_fatigue의 하한 (Gilmore–Lawler / 고윳값)
+    W = template.co_occurrence_matrix
+    if W is None:
+        return 0.0
+    n = len(template.layout)
+    flow = np.where(W[:n, :n] > 0, W[:n, :n], 0.0)
+    dist = np.array([[template._calculate_step_cost(a, b) for b in range(n)] for a in range(n)], dtype=float)
+    
+    if template.laplacian_weight > 0:
+        n_cols = template.keyboard._get_key_positions().shape[1]
+        rows, cols = np.divmod(np.arange(n), n_cols)
+        dist += template.laplacian_weight * ((rows[:, None] - rows[None, :]) ** 2 + (cols[:, None] - cols[None, :]) ** 2)
+    
+    return qap_lower_bound(flow, dist, method=method)
 
 
 class GAOperators: #GA 연산자
@@ -126,71 +158,34 @@ class GAOperators: #GA 연산자
     
     @staticmethod
     def pmx_crossover(parent1: Individual, parent2: Individual) -> Tuple[Individual, Individual]:
-        layout1 = parent1.layout.copy()
-        layout2 = parent2.layout.copy()
-        n = len(layout1)
+        n = len(parent1.layout)
         
         point1 = np.random.randint(0, n - 1)
         point2 = np.random.randint(point1 + 1, n)
 
-        child1 = np.zeros(n, dtype=int)
-        child2 = np.zeros(n, dtype=int)
-
-        child1[point1:point2] = layout1[point1:point2]
-        child2[point1:point2] = layout2[point1:point2]
-        
-        def fill_pmx(child, parent_from, parent_to, start, end):
-            for i in range(n):
-                if i < start or i >= end:
-                    val = parent_to[i]
-                    while val in child:
-                        idx = np.where(parent_to == val)[0][0]
-                        val = parent_from[idx]
-                    child[i] = val
-        
-        fill_pmx(child1, layout2, layout1, point1, point2)
-        fill_pmx(child2, layout1, layout2, point1, point2)
-        
-        child1_ind = parent1.copy()
-        child1_ind.layout = child1
-        child1_ind._fitness = None
-        
-        child2_ind = parent2.copy()
-        child2_ind.layout = child2
-        child2_ind._fitness = None
-        
-        return child1_ind, child2_ind
+        #구간 [point1, point2)는 자기 부모에서, 나머지는 상대 부모에서 사상을 따라 채움 (GA.crossover 커널)
+        children = pmx_kernel(np.stack([parent1.layout, parent2.layout])[None], np.array([[point1, point2]]))[0]
+        return GAOperators._make_children(parent1, parent2, children)
     
     @staticmethod
     def ox_crossover(parent1: Individual, parent2: Individual) -> Tuple[Individual, Individual]:
-        layout1 = parent1.layout.copy()
-        layout2 = parent2.layout.copy()
-        n = len(layout1)
+        n = len(parent1.layout)
         
         point1 = np.random.randint(0, n - 1)
         point2 = np.random.randint(point1 + 1, n)
         
-        def ox_fill(child, parent_from, parent_to, start, end):
-            child[start:end] = parent_from[start:end]
-            used = set(child[start:end])
-            pos = end % n
-            for val in parent_to[(end) % n:] + list(parent_to[:(end) % n]):
-                if val not in used:
-                    child[pos] = val
-                    pos = (pos + 1) % n
-        
-        child1 = np.zeros(n, dtype=int)
-        child2 = np.zeros(n, dtype=int)
-        
-        ox_fill(child1, layout1, layout2, point1, point2)
-        ox_fill(child2, layout2, layout1, point1, point2)
-        
+        #구간 밖은 point2부터 순환하며 상대 부모의 순서대로 채움 (GA.crossover 커널)
+        children = ox_kernel(np.stack([parent1.layout, parent2.layout])[None], np.array([[point1, point2]]))[0]
+        return GAOperators._make_children(parent1, parent2, children)
+    
+    @staticmethod
+    def _make_children(parent1: Individual, parent2: Individual, children: np.ndarray) -> Tuple[Individual, Individual]:
         child1_ind = parent1.copy()
-        child1_ind.layout = child1
+        child1_ind.layout = children[0]
         child1_ind._fitness = None
         
         child2_ind = parent2.copy()
-        child2_ind.layout = child2
+        child2_ind.layout = children[1]
         child2_ind._fitness = None
         
         return child1_ind, child2_ind
@@ -332,8 +327,11 @@ class GARunner:
                  mutation_rate: float = 0.1,
                  crossover_rate: float = 0.8,
                  elite_size: int = 2,
-                 selection_type: str = 'tournament',
-                 crossover_type: str = 'pmx'):
+                 selection_type: str = 'tournament', #'tournament', 'roulette'(SUS), 'rank'
+                 crossover_type: str = 'pmx',
+                 fitness_cache: FitnessCache = None, #여러 실행이 공유할 적합도 캐시 (None이면 run()마다 새로 생성)
+                 workers: int = 1, #2 이상이면 프로세스 풀에서 병렬 평가
+                 stopping: StoppingPolicy = None): #종료 조건 (patience, 평탄 구간, 다양성, 시간, 평가 수)
         
         self.population_size = population_size
         self.max_generations = max_generations
@@ -342,6 +340,13 @@ class GARunner:
         self.elite_size = elite_size
         self.selection_type = selection_type
         self.crossover_type = crossover_type
+        self.fitness_cache = fitness_cache
+        self.workers = workers
+        self.stopping = stopping
+        self.cache_stats = None
+        self.lower_bound = None
+        self.gap = None
+        self.stop_reason = None
         
         self.best_fitness_history = []
         self.avg_fitness_history = []
@@ -349,91 +354,143 @@ class GARunner:
     
     def run(self, population: List[Individual], #GA 실행
             patience: int = None,
-            verbose: bool = True) -> Tuple[Individual, List[Individual]]:
+            verbose: bool = True,
+            gap_epsilon: float = None, #최고 피로도와 하한의 상대 간격이 이 값 이하면 종료
+            lower_bound: float = None) -> Tuple[Individual, List[Individual]]: #None이면 fatigue_lower_bound로 계산
         
         current_population = [ind.copy() for ind in population]
         best_individual = None
         best_fitness = -np.inf
-        no_improve_count = 0
-        
-        for generation in range(self.max_generations):
-            # 적합도 평가
-            fitness_values = [ind.evaluate() for ind in current_population]
-
-            max_fitness = max(fitness_values)
-            avg_fitness = np.mean(fitness_values)
-            self.best_fitness_history.append(max_fitness)
-            self.avg_fitness_history.append(avg_fitness)
-            self.population_history.append([ind.copy() for ind in current_population])
-
-            gen_best_idx = np.argmax(fitness_values)
-            if fitness_values[gen_best_idx] > best_fitness:
-                best_fitness = fitness_values[gen_best_idx]
-                best_individual = current_population[gen_best_idx].copy()
-                no_improve_count = 0
-            else:
-                no_improve_count += 1
-            
-            if verbose:
-                print(f"Generation {generation + 1}: Best={max_fitness:.6f}, Avg={avg_fitness:.6f}")
-            
-            # 조기 종료
-            if patience and no_improve_count >= patience:
+        cache = self.fitness_cache if self.fitness_cache is not None else FitnessCache()
+        
+        #run() 인자는 stopping의 같은 항목보다 우선
+        policy = (self.stopping or StoppingPolicy()).started(patience=patience, gap_epsilon=gap_epsilon,
+                                                             lower_bound=lower_bound)
+        if policy.needs_bound:
+            policy.lower_bound = fatigue_lower_bound(current_population[0])
+        self.lower_bound = policy.lower_bound
+        misses = cache.misses
+        self.stop_reason = 'generations'
+        
+        evaluator = self._make_evaluator(current_population)
+        try:
+            for generation in range(self.max_generations):
+                # 적합도 평가 (이전 세대에서 평가한 배열은 캐시에서)
+                fitness_values = self._evaluate_population(current_population, cache, evaluator)
+
+                max_fitness = max(fitness_values)
+                avg_fitness = np.mean(fitness_values)
+                self.best_fitness_history.append(max_fitness)
+                self.avg_fitness_history.append(avg_fitness)
+                # 세대별 배열만 (P, n) int8로 보관 - 개체 전체 복사 대신
+                self.population_history.append(np.array([ind.layout for ind in current_population], dtype=np.int8))
+
+                gen_best_idx = np.argmax(fitness_values)
+                if fitness_values[gen_best_idx] > best_fitness:
+                    best_fitness = fitness_values[gen_best_idx]
+                    best_individual = current_population[gen_best_idx].copy()
+
                 if verbose:
-                    print(f"Early stopping at generation {generation + 1}")
-                break
+                    print(f"Generation {generation + 1}: Best={max_fitness:.6f}, Avg={avg_fitness:.6f}")
 
-            new_population = []
-            
-            # 엘리트 유지
-            elite_indices = np.argsort(fitness_values)[-self.elite_size:]
-            for idx in elite_indices:
-                new_population.append(current_population[idx].copy())
-            
-            while len(new_population) < self.population_size:
-                # 선택
-                if self.selection_type == 'tournament':
-                    parent1 = GAOperators.tournament_selection(current_population)
-                    parent2 = GAOperators.tournament_selection(current_population)
-                else:  
-                    parent1 = GAOperators.roulette_wheel_selection(current_population)
-                    parent2 = GAOperators.roulette_wheel_selection(current_population)
-                
-                # 교차
-                if np.random.random() < self.crossover_rate:
-                    if self.crossover_type == 'pmx':
-                        child1, child2 = GAOperators.pmx_crossover(parent1, parent2)
-                    else:  # ox
-                        child1, child2 = GAOperators.ox_crossover(parent1, parent2)
-                else:
-                    child1, child2 = parent1.copy(), parent2.copy()
-
-                if np.random.random() < self.mutation_rate:
-                    mutation_choice = np.random.random()
-                    if mutation_choice < 0.7:
-                        child1 = GAOperators.swap_mutation(child1, self.mutation_rate)
-                    elif mutation_choice < 0.9:
-                        child1 = GAOperators.inversion_mutation(child1, self.mutation_rate)
-                    else:
-                        child1 = GAOperators.levy_flight_mutation(child1, self.mutation_rate)
-                
-                if np.random.random() < self.mutation_rate:
-                    mutation_choice = np.random.random()
-                    if mutation_choice < 0.7:
-                        child2 = GAOperators.swap_mutation(child2, self.mutation_rate)
-                    elif mutation_choice < 0.9:
-                        child2 = GAOperators.inversion_mutation(child2, self.mutation_rate)
+                # 조기 종료 (patience, 하한과의 간격, 시간 등)
+                diversity = population_diversity([ind.layout for ind in current_population]) if policy.needs_diversity else None
+                stop = policy.update(1.0 / best_fitness - 1e-6, cache.misses - misses, diversity)
+                self.gap = policy.gap
+                if stop:
+                    self.stop_reason = policy.reason
+                    if verbose:
+                        print(f"Early stopping at generation {generation + 1}: {policy.reason}")
+                    break
+
+                new_population = []
+
+                # 엘리트 유지
+                elite_indices = np.argsort(fitness_values)[-self.elite_size:]
+                for idx in elite_indices:
+                    new_population.append(current_population[idx].copy())
+
+                # 선택 - 이번 세대의 부모 인덱스를 한 번에 (개체 복사 없음, 자식은 교차 또는 copy()로 새로 만듦)
+                n_pairs = (self.population_size - len(new_population) + 1) // 2
+                method = self.selection_type if self.selection_type in ('tournament', 'rank') else 'sus'
+                parent_idx = select_parents(fitness_values, 2 * n_pairs, method).reshape(-1, 2)
+
+                for i, j in parent_idx:
+                    parent1 = current_population[i]
+                    parent2 = current_population[j]
+
+                    # 교차
+                    if np.random.random() < self.crossover_rate:
+                        if self.crossover_type == 'pmx':
+                            child1, child2 = GAOperators.pmx_crossover(parent1, parent2)
+                        else:  # ox
+                            child1, child2 = GAOperators.ox_crossover(parent1, parent2)
                     else:
-                        child2 = GAOperators.levy_flight_mutation(child2, self.mutation_rate)
-                
-                new_population.append(child1)
-                if len(new_population) < self.population_size:
-                    new_population.append(child2)
-            
-            current_population = new_population[:self.population_size]
-        
+                        child1, child2 = parent1.copy(), parent2.copy()
+
+                    new_population.append(child1)
+                    if len(new_population) < self.population_size:
+                        new_population.append(child2)
+
+                # 돌연변이 - 자식 배열을 (m, n) 버퍼로 모아 연산자별로 한 번에 (swap 70%, inversion 20%, Lévy 10%)
+                self._mutate_children(new_population[len(elite_indices):self.population_size])
+
+                current_population = new_population[:self.population_size]
+
+        finally:
+            if evaluator is not None:
+                evaluator.close()
+
+        self.cache_stats = cache.stats()
         return best_individual, current_population
     
+    def _mutate_children(self, children: List[Individual]):
+        if not children:
+            return
+        buf = np.array([child.layout for child in children])
+        mutate = np.flatnonzero(np.random.random(len(children)) < self.mutation_rate)
+        choice = np.random.random(len(mutate))
+        logs = [
+            swap_mutation(buf, self.mutation_rate, rows=mutate[choice < 0.7]),
+            inversion_mutation(buf, self.mutation_rate, rows=mutate[(choice >= 0.7) & (choice < 0.9)]),
+            levy_flight_mutation(buf, self.mutation_rate, rows=mutate[choice >= 0.9])
+        ]
+        #실제로 바뀐 개체만 배열 교체 + 재평가 표시 (자식은 이미 복사본이므로 제자리 변경 가능)
+        for row in np.unique(np.concatenate([rows for rows, _ in logs])):
+            children[row].layout = buf[row]
+            children[row]._fitness = None
+    
+    def _make_evaluator(self, population: List[Individual]) -> ParallelEvaluator:
+        #W는 shared_memory로 한 번만, 키보드/피로도 함수는 워커 시작 시 한 번만 전달
+        if self.workers <= 1 or not population:
+            return None
+        template = population[0]
+        context = {
+            'keyboard': template.keyboard,
+            'fatigue_calc': template.fatigue_calc,
+            'laplacian_weight': template.laplacian_weight
+        }
+        return ParallelEvaluator(self.workers, _layout_fatigue,
+                                 {'W': template.co_occurrence_matrix}, context)
+    
+    def _evaluate_population(self, population: List[Individual], cache: FitnessCache,
+                             evaluator: ParallelEvaluator = None) -> List[float]:
+        if evaluator is None:
+            return [cache.evaluate(ind) for ind in population]
+        
+        #캐시에 없는 배열만 모아서 (같은 배열은 한 번만) 워커에 분배
+        pending = {}
+        for ind in population:
+            if ind._fitness is None and not cache.lookup(ind):
+                pending.setdefault(cache.key(ind.layout), []).append(ind)
+        if pending:
+            layouts = np.stack([inds[0].layout for inds in pending.values()])
+            for inds, fatigue in zip(pending.values(), evaluator.map(layouts)):
+                for ind in inds:
+                    ind.set_fatigue(fatigue)
+                cache.store(inds[0])
+        return [ind._fitness for ind in population]
+    
     def get_statistics(self) -> Dict:
         return {
             'best_fitness_history': self.best_fitness_history,
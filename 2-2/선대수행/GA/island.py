@@ -0,0 +1,183 @@
+"""
+섬(island) 모델 GA - GARunner2D_Full 부분 모집단 K개를 별도 프로세스에서 진화시키고
+M세대마다 상위 개체를 이웃 섬으로 이주
+"""
+
+import numpy as np
+from multiprocessing import Pool
+from typing import List
+import sys
+from pathlib import Path
+
+parent_path = Path(__file__).parent.parent
+sys.path.insert(0, str(parent_path))
+
+from GA.ga_integrated import Individual2D_Full, GARunner2D_Full
+from GA.population import Population
+from GA.cost_model import CostModel2D
+from GA.fitness_cache import FitnessCache
+
+
+_worker_state = {}
+
+
+def _init_worker(template: Individual2D_Full):
+    # 키보드/피로도/W/라플라시안은 워커 시작 시 한 번만 전달
+    _worker_state['template'] = template
+    _worker_state['cost_model'] = CostModel2D.from_individual(template)
+    _worker_state['cache'] = FitnessCache()
+
+
+def _evolve_island(task):
+    """한 섬을 interval 세대 진화 - 배열과 적합도만 주고받음"""
+    layouts, generations, mut_rate, seed = task
+    template = _worker_state['template']
+    cost_model = _worker_state['cost_model']
+    cache = _worker_state['cache']
+
+    np.random.seed(seed)
+    pop = Population(layouts, template, cost_model)
+
+    runner = GARunner2D_Full(pop_size=len(pop), generations=generations, mut_rate=mut_rate,
+                             fitness_cache=cache)
+    best, _ = runner.run(pop)
+    # 이주할 개체를 고르기 위해 마지막 세대도 평가
+    final = runner.population
+    fitness = final.evaluate(cache)
+    return final.layouts.copy(), fitness, best.layout_2d.astype(np.int8), best.evaluate()
+
+
+class IslandRunner2D:
+    """섬 모델 GA 실행기"""
+
+    def __init__(self,
+                 n_islands: int = 4,
+                 island_size: int = 20,
+                 generations: int = 100,
+                 mut_rate: float = 0.1,
+                 migration_interval: int = 10,
+                 migration_size: int = 2,
+                 topology: str = 'ring',
+                 workers: int = None,
+                 seed: int = None):
+        """
+        Args:
+            n_islands: 섬(부분 모집단) 수 K
+            island_size: 섬당 개체 수
+            generations: 총 세대 수
+            mut_rate: 돌연변이 확률
+            migration_interval: 이주 주기 M (세대)
+            migration_size: 섬마다 내보내는 상위 개체 수
+            topology: 'ring' (i → i+1) 또는 'random' (매 이주마다 무작위 순열)
+            workers: 프로세스 수 (None이면 섬 수, 1이면 현재 프로세스에서 순차 실행)
+            seed: 재현용 시드
+        """
+        if topology not in ('ring', 'random'):
+            raise ValueError(f"unknown topology: {topology}")
+        self.n_islands = n_islands
+        self.island_size = island_size
+        self.generations = generations
+        self.mut_rate = mut_rate
+        self.migration_interval = migration_interval
+        self.migration_size = migration_size
+        self.topology = topology
+        self.workers = workers
+        self.seed = seed
+        self.history = []
+
+    def run(self, population: List[Individual2D_Full], verbose=False):
+        """
+        Args:
+            population: 초기 개체 - 앞에서부터 섬마다 island_size개씩 나눔
+                        (부족하면 있는 개체를 섞어 채움)
+        Returns:
+            (최고 개체, 섬별 마지막 개체 리스트)
+        """
+        template = population[0].copy()
+        rng = np.random.default_rng(self.seed)
+        seeds = np.random.SeedSequence(self.seed)
+
+        layouts = np.stack([ind.layout_2d for ind in population]).astype(np.int8)
+        need = self.n_islands * self.island_size
+        if len(layouts) < need:
+            extra = rng.integers(len(layouts), size=need - len(layouts))
+            layouts = np.concatenate([layouts, layouts[extra]])
+        islands = list(layouts[:need].reshape(self.n_islands, self.island_size, *layouts.shape[1:]))
+
+        best_layout, best_fitness = None, -np.inf
+        workers = self.workers or self.n_islands
+        pool = None
+        if workers > 1:
+            pool = Pool(min(workers, self.n_islands), initializer=_init_worker, initargs=(template,))
+        else:
+            # 현재 프로세스에서 실행 - 전역 np.random 상태는 끝나고 되돌림
+            saved_state = np.random.get_state()
+            _init_worker(template)
+
+        try:
+            done = 0
+            while done < self.generations:
+                step = min(self.migration_interval, self.generations - done)
+                epoch_seeds = seeds.spawn(self.n_islands)
+                tasks = [(islands[k], step, self.mut_rate, int(epoch_seeds[k].generate_state(1)[0]))
+                         for k in range(self.n_islands)]
+                results = pool.map(_evolve_island, tasks) if pool is not None else [_evolve_island(t) for t in tasks]
+
+                islands = [r[0] for r in results]
+                fitness = [r[1] for r in results]
+                for _, _, layout, fit in results:
+                    if fit > best_fitness:
+                        best_layout, best_fitness = layout, fit
+
+                done += step
+                self.history.append({
+                    'generation': done,
+                    'max': best_fitness,
+                    'island_max': [float(f.max()) for f in fitness],
+                    'island_avg': [float(f.mean()) for f in fitness]
+                })
+                if verbose:
+                    print(f"Gen {done}: max={best_fitness:.4f}, "
+                          f"islands={[round(float(f.max()), 4) for f in fitness]}")
+
+                if done < self.generations and self.n_islands > 1:
+                    self._migrate(islands, fitness, rng)
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+            else:
+                np.random.set_state(saved_state)
+
+        best = template.copy()
+        best.layout_2d = best_layout
+        final = []
+        for island in islands:
+            for layout in island:
+                ind = template.copy()
+                ind.layout_2d = layout
+                final.append(ind)
+        return best, final
+
+    def _migrate(self, islands, fitness, rng):
+        """각 섬의 상위 migration_size 개체를 목적지 섬의 최하위 개체와 교체"""
+        m = min(self.migration_size, self.island_size - 1)
+        if m <= 0:
+            return
+        if self.topology == 'ring':
+            dest = [(k + 1) % self.n_islands for k in range(self.n_islands)]
+        else:
+            # 자기 자신으로 가지 않는 무작위 순열
+            perm = rng.permutation(self.n_islands)
+            dest = [0] * self.n_islands
+            for i in range(self.n_islands):
+                dest[perm[i]] = perm[(i + 1) % self.n_islands]
+
+        # 모든 섬의 이주 개체를 먼저 뽑아둔 뒤 교체 (교체 순서에 영향받지 않게)
+        top = [np.argsort(fitness[k])[-m:] for k in range(self.n_islands)]
+        emigrants = [(islands[k][top[k]].copy(), fitness[k][top[k]].copy()) for k in range(self.n_islands)]
+        for k, (layouts, fit) in enumerate(emigrants):
+            d = dest[k]
+            worst = np.argsort(fitness[d])[:m]
+            islands[d][worst] = layouts
+            fitness[d][worst] = fit
@@ -0,0 +1,106 @@
+"""
+배열 QAP 하한 - Σ_ij A_ij B[p_i, p_j] + Σ_i C[i, p_i] 의 최솟값 아래쪽 추정
+- Gilmore–Lawler: 글자 i를 셀 k에 둘 때의 최소 비용 l_ik (최소 스칼라곱) → 선형 할당
+- 고윳값: 대칭 부분 고윳값의 최소 스칼라곱 - 비대칭 부분 Frobenius 노름 곱 + 선형 항 할당
+흐름 행렬은 셀 수만큼 0으로 채워서 (빈 칸 = 흐름 없는 가상 글자) 정사각 문제로 풀어요
+"""
+
+import numpy as np
+from scipy.optimize import linear_sum_assignment
+import sys
+from pathlib import Path
+
+parent_path = Path(__file__).parent.parent
+sys.path.insert(0, str(parent_path))
+
+
+def _pad(flow: np.ndarray, linear: np.ndarray, m: int):
+    n = flow.shape[0]
+    if n > m:
+        raise ValueError(f"more characters ({n}) than cells ({m})")
+    A = np.zeros((m, m))
+    A[:n, :n] = flow
+    C = np.zeros((m, m))
+    if linear is not None:
+        C[:n] = linear
+    return A, C
+
+
+def _assignment_cost(cost: np.ndarray) -> float:
+    rows, cols = linear_sum_assignment(cost)
+    return float(cost[rows, cols].sum())
+
+
+def _off_diagonal(X: np.ndarray) -> np.ndarray:
+    m = X.shape[0]
+    return X[~np.eye(m, dtype=bool)].reshape(m, m - 1)
+
+
+def gilmore_lawler_bound(flow: np.ndarray, dist: np.ndarray, linear: np.ndarray = None) -> float:
+    """
+    Gilmore–Lawler 하한
+    Args:
+        flow: (n, n) 글자 쌍 흐름 A
+        dist: (m, m) 셀 쌍 거리 B (m >= n)
+        linear: (n, m) 글자 i를 셀 k에 둘 때의 선형 비용 (없으면 0)
+    """
+    dist = np.asarray(dist, dtype=float)
+    A, C = _pad(np.asarray(flow, dtype=float), linear, dist.shape[0])
+    # l_ik = A_ii B_kk + min_perm Σ_j≠i A_ij B_k,σ(j)  (오름차순 · 내림차순이 최소 스칼라곱)
+    a_off = np.sort(_off_diagonal(A), axis=1)
+    b_off = -np.sort(-_off_diagonal(dist), axis=1)
+    l = np.outer(np.diag(A), np.diag(dist)) + a_off @ b_off.T + C
+    return _assignment_cost(l)
+
+
+def eigenvalue_bound(flow: np.ndarray, dist: np.ndarray, linear: np.ndarray = None) -> float:
+    """
+    고윳값 하한 (Finke–Burkard–Rendl) - 비대칭 행렬은 대칭/반대칭으로 나눠서
+    <A, P B Pᵀ> >= <λ(A_s)↑, λ(B_s)↓> - ||A_a||·||B_a||
+    """
+    dist = np.asarray(dist, dtype=float)
+    A, C = _pad(np.asarray(flow, dtype=float), linear, dist.shape[0])
+    A_s, B_s = (A + A.T) / 2, (dist + dist.T) / 2
+    quad = np.sort(np.linalg.eigvalsh(A_s)) @ np.sort(np.linalg.eigvalsh(B_s))[::-1]
+    quad -= np.linalg.norm(A - A_s) * np.linalg.norm(dist - B_s)
+    return float(quad) + _assignment_cost(C)
+
+
+BOUNDS = {
+    'gl': gilmore_lawler_bound,
+    'eigen': eigenvalue_bound,
+}
+
+
+def qap_lower_bound(flow: np.ndarray, dist: np.ndarray, linear: np.ndarray = None, method: str = 'best') -> float:
+    """method: 'gl', 'eigen', 'best' (둘 중 큰 값)"""
+    if method == 'best':
+        return max(f(flow, dist, linear) for f in BOUNDS.values())
+    if method not in BOUNDS:
+        raise ValueError(f"unknown bound: {method}")
+    return BOUNDS[method](flow, dist, linear)
+
+
+def layout_lower_bound(cost_model, cells: np.ndarray, method: str = 'best') -> float:
+    """
+    CostModel2D.total_cost의 하한 (사용 가능한 셀 cells에 글자를 배치하는 모든 배열에 대해)
+    - 피로도 + 빈도 항은 위의 QAP 하한
+    - L이 있으면 clamp된 라플라시안 항은 0 이상이므로 0으로, 없으면 W·G를 거리 행렬에 더해서 함께
+    """
+    cells = np.asarray(cells)
+    dist = cost_model.S[np.ix_(cells, cells)]
+    if cost_model.L is None:
+        dist = dist + cost_model.lap_weight * cost_model.G[np.ix_(cells, cells)]
+    n = cost_model.n_chars
+    freq = np.zeros(n)
+    m = min(n, len(cost_model.freq))
+    freq[:m] = cost_model.freq[:m]
+    linear = cost_model.freq_weight * np.outer(freq, cost_model.position_cost[cells])
+    return qap_lower_bound(cost_model.W, dist, linear, method)
+
+
+def optimality_gap(cost: float, bound: float) -> float:
+    """상대 간격 (cost - bound) / cost - 0이면 최적임이 증명된 것"""
+    if cost <= 0:
+        return 0.0
+    return max(0.0, (cost - bound) / cost)
@@ -0,0 +1,160 @@
+"""
+벡터화 돌연변이 - (P, n) 자식 버퍼 전체에 제자리(in-place) 적용
+난수(스왑 위치, 뒤집기 구간, Lévy 스왑 횟수)는 세대 전체에 대해 한 번에 뽑음
+
+모든 연산자는 적용한 스왑 기록 (rows, pairs)를 돌려줌
+- rows: (m,) 행 번호, pairs: (m, 2) 맞바꾼 두 칸 (버퍼의 열 인덱스), 적용 순서대로
+- 뒤집기도 양 끝부터의 스왑으로 기록 → 증분 평가기(apply_swap 등)가 그대로 재생 가능
+"""
+
+import numpy as np
+
+
+def _rng(rng):
+    # rng가 없으면 저장소의 다른 연산자처럼 전역 np.random 사용
+    return np.random if rng is None else rng
+
+
+def _integers(rng, low, high, size):
+    if rng is None:
+        return np.random.randint(low, high, size=size)
+    return rng.integers(low, high, size=size)
+
+
+def _candidates(n_rows: int, rows):
+    return np.arange(n_rows) if rows is None else np.asarray(rows, dtype=np.intp)
+
+
+def _empty_log():
+    return np.empty(0, dtype=np.intp), np.empty((0, 2), dtype=np.intp)
+
+
+def _distinct_pairs(m: int, n_cells: int, rng=None) -> np.ndarray:
+    """(m, 2) 서로 다른 두 위치 (0..n_cells-1)"""
+    a = _integers(rng, 0, n_cells, m)
+    b = (a + 1 + _integers(rng, 0, n_cells - 1, m)) % n_cells
+    return np.stack([a, b], axis=1)
+
+
+def draw_swaps(counts: np.ndarray, rows: np.ndarray, cells: np.ndarray, rng=None):
+    """
+    행마다 counts개의 무작위 스왑 기록 생성 (적용은 하지 않음)
+    같은 행의 여러 스왑은 라운드 순서대로 기록
+    """
+    counts = np.asarray(counts)
+    log_rows, log_pairs = [], []
+    for t in range(int(counts.max()) if len(counts) else 0):
+        active = rows[counts > t]
+        log_rows.append(active)
+        log_pairs.append(cells[_distinct_pairs(len(active), len(cells), rng)])
+    if not log_rows:
+        return _empty_log()
+    return np.concatenate(log_rows), np.concatenate(log_pairs)
+
+
+def apply_swaps(buf: np.ndarray, rows: np.ndarray, pairs: np.ndarray) -> np.ndarray:
+    """
+    스왑 기록을 버퍼에 순서대로 적용 (제자리)
+    한 라운드 안에서 같은 행이 두 번 나오지 않도록 행별 등장 순서로 묶어서 벡터화
+    """
+    if len(rows) == 0:
+        return buf
+    order = np.argsort(rows, kind='stable')
+    sorted_rows = rows[order]
+    first = np.searchsorted(sorted_rows, sorted_rows)
+    occurrence = np.empty(len(rows), dtype=np.intp)
+    occurrence[order] = np.arange(len(rows)) - first
+    for t in range(int(occurrence.max()) + 1):
+        sel = occurrence == t
+        r, a, b = rows[sel], pairs[sel, 0], pairs[sel, 1]
+        tmp = buf[r, a].copy()
+        buf[r, a] = buf[r, b]
+        buf[r, b] = tmp
+    return buf
+
+
+def swap_mutation(buf: np.ndarray, rate: float = 0.1, rows=None, cells: np.ndarray = None,
+                  trials: int = None, rng=None):
+    """
+    스왑 돌연변이 - 행마다 trials번 시도, 각 시도는 rate 확률로 두 칸 교환
+    (trials 기본값 max(1, int(n × rate))는 GAOperators.swap_mutation과 같음)
+    Args:
+        buf: (P, n) 버퍼 (제자리 변경)
+        rows: 적용할 행 (None이면 전체)
+        cells: 바꿀 수 있는 열 (None이면 전체, 2D 배열은 usable_cells)
+    Returns:
+        (rows, pairs) 스왑 기록
+    """
+    rows = _candidates(len(buf), rows)
+    cells = np.arange(buf.shape[1]) if cells is None else np.asarray(cells)
+    if len(rows) == 0 or len(cells) < 2:
+        return _empty_log()
+    if trials is None:
+        trials = max(1, int(len(cells) * rate))
+    counts = _rng(rng).binomial(trials, rate, size=len(rows))
+    log = draw_swaps(counts, rows, cells, rng)
+    apply_swaps(buf, *log)
+    return log
+
+
+def inversion_mutation(buf: np.ndarray, rate: float = 0.05, rows=None, cells: np.ndarray = None, rng=None):
+    """
+    뒤집기 돌연변이 - rate 확률로 구간 [start, end)를 뒤집음
+    (start ∈ [0, n-2], end ∈ [start+1, n-1] - GAOperators.inversion_mutation과 같은 분포)
+    Returns:
+        (rows, pairs) - 뒤집기를 바깥쪽부터의 스왑으로 기록
+    """
+    rows = _candidates(len(buf), rows)
+    cells = np.arange(buf.shape[1]) if cells is None else np.asarray(cells)
+    n = len(cells)
+    if len(rows) == 0 or n < 2:
+        return _empty_log()
+    rows = rows[_rng(rng).random(len(rows)) < rate]
+    if len(rows) == 0:
+        return _empty_log()
+
+    start = _integers(rng, 0, n - 1, len(rows))
+    end = start + 1 + (_rng(rng).random(len(rows)) * (n - 1 - start)).astype(int)  # start+1 .. n-1
+
+    # 구간 전체를 한 번에 뒤집기
+    j = np.arange(n)
+    length = (end - start)[:, None]
+    inside = j < length
+    src = np.where(inside, end[:, None] - 1 - j, 0)
+    dst = np.where(inside, start[:, None] + j, 0)
+    r = np.broadcast_to(rows[:, None], inside.shape)
+    vals = buf[r[inside], cells[src[inside]]]
+    buf[r[inside], cells[dst[inside]]] = vals
+
+    # 기록: (start+j, end-1-j), j < 길이//2
+    half = j < (length // 2)
+    pairs = np.stack([cells[(start[:, None] + j)[half]], cells[(end[:, None] - 1 - j)[half]]], axis=1)
+    return r[half], pairs
+
+
+def levy_flight_mutation(buf: np.ndarray, rate: float = 0.02, rows=None, cells: np.ndarray = None, rng=None):
+    """
+    Lévy 비행 돌연변이 - rate 확률로 두꺼운 꼬리 분포의 횟수만큼 무작위 스왑
+    스왑 횟수 = int(n × pareto(2) × 0.1) + 1, 최대 n // 2 (GAOperators.levy_flight_mutation과 같음)
+    """
+    rows = _candidates(len(buf), rows)
+    cells = np.arange(buf.shape[1]) if cells is None else np.asarray(cells)
+    n = len(cells)
+    if len(rows) == 0 or n < 2:
+        return _empty_log()
+    rows = rows[_rng(rng).random(len(rows)) < rate]
+    if len(rows) == 0:
+        return _empty_log()
+    counts = (n * _rng(rng).pareto(2.0, size=len(rows)) * 0.1).astype(int) + 1
+    counts = np.minimum(counts, n // 2)
+    log = draw_swaps(counts, rows, cells, rng)
+    apply_swaps(buf, *log)
+    return log
+
+
+def touched_cells(rows: np.ndarray, pairs: np.ndarray, n_rows: int):
+    """스왑 기록 → 행별로 바뀐 칸 목록 (중복 제거)"""
+    touched = [[] for _ in range(n_rows)]
+    for r, (a, b) in zip(rows.tolist(), pairs.tolist()):
+        touched[r].extend((a, b))
+    return [np.unique(t).astype(np.intp) for t in touched]
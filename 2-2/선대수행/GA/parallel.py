@@ -0,0 +1,121 @@
+"""
+프로세스 풀 병렬 평가
+- 큰 읽기 전용 행렬(W, L, step 비용 텐서 등)은 shared_memory에 한 번만 올림
+- 작업마다 보내는 것은 압축된 배열(int8)뿐
+"""
+
+import numpy as np
+from multiprocessing import Pool, shared_memory
+from typing import Callable, Dict
+
+
+class SharedArrays:
+    """여러 numpy 배열을 하나의 shared_memory 블록에 올려 워커 프로세스와 공유"""
+
+    def __init__(self, arrays: Dict[str, np.ndarray]):
+        arrays = {name: np.ascontiguousarray(a) for name, a in arrays.items() if a is not None}
+        layout = {}
+        offset = 0
+        for name, a in arrays.items():
+            offset = (offset + 63) // 64 * 64  # 64바이트 정렬
+            layout[name] = (offset, a.shape, a.dtype.str)
+            offset += a.nbytes
+
+        self._shm = shared_memory.SharedMemory(create=True, size=max(offset, 1))
+        for name, a in arrays.items():
+            start, shape, dtype = layout[name]
+            np.ndarray(shape, dtype=dtype, buffer=self._shm.buf, offset=start)[...] = a
+        self.spec = (self._shm.name, layout)
+
+    @staticmethod
+    def attach(spec):
+        """워커에서 spec으로 붙기 - (shm, {이름: 읽기 전용 배열})"""
+        name, layout = spec
+        shm = shared_memory.SharedMemory(name=name)
+        arrays = {}
+        for key, (start, shape, dtype) in layout.items():
+            a = np.ndarray(shape, dtype=dtype, buffer=shm.buf, offset=start)
+            a.flags.writeable = False
+            arrays[key] = a
+        return shm, arrays
+
+    def close(self):
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+_worker_state = {}
+
+
+def _init_worker(spec, evaluate_fn, context):
+    shm, arrays = SharedArrays.attach(spec)
+    _worker_state['shm'] = shm  # 워커가 끝날 때까지 매핑 유지
+    _worker_state['arrays'] = arrays
+    _worker_state['evaluate_fn'] = evaluate_fn
+    _worker_state['context'] = context
+
+
+def _evaluate_chunk(layouts: np.ndarray) -> np.ndarray:
+    fn = _worker_state['evaluate_fn']
+    arrays = _worker_state['arrays']
+    context = _worker_state['context']
+    return np.array([fn(layout, arrays, context) for layout in layouts], dtype=float)
+
+
+class ParallelEvaluator:
+    """
+    배열 묶음을 여러 프로세스에서 평가
+    evaluate_fn(layout, arrays, context) -> float 는 모듈 최상위 함수여야 함 (pickle 가능)
+    """
+
+    def __init__(self,
+                 workers: int,
+                 evaluate_fn: Callable,
+                 shared: Dict[str, np.ndarray],
+                 context: dict = None,
+                 chunks_per_worker: int = 4):
+        """
+        Args:
+            workers: 프로세스 수
+            evaluate_fn: 배열 하나의 비용 함수
+            shared: shared_memory로 공유할 배열 (이름 → 배열)
+            context: 워커 시작 시 한 번만 전달할 작은 객체들 (키보드, 가중치 등)
+            chunks_per_worker: 부하 분산을 위해 워커당 나눌 조각 수
+        """
+        self.workers = workers
+        self.chunks_per_worker = chunks_per_worker
+        self._shared = SharedArrays(shared)
+        self._pool = Pool(workers, initializer=_init_worker,
+                          initargs=(self._shared.spec, evaluate_fn, context or {}))
+
+    def map(self, layouts) -> np.ndarray:
+        """(P, ...) 배열 묶음 → (P,) 비용, 입력 순서 유지"""
+        layouts = np.asarray(layouts)
+        if len(layouts) == 0:
+            return np.empty(0)
+        if layouts.min() >= -128 and layouts.max() < 128:
+            layouts = layouts.astype(np.int8)
+        n_chunks = min(len(layouts), self.workers * self.chunks_per_worker)
+        chunks = np.array_split(layouts, n_chunks)
+        return np.concatenate(self._pool.map(_evaluate_chunk, chunks))
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+        self._shared.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,195 @@
+"""
+배열 기반 모집단 - 개체 리스트 대신 (P, 행, 열) int8 배열 하나와 (P, 3) 비용 배열로 보관
+키보드/피로도 모델/W/라플라시안 같은 평가 문맥은 CostModel2D와 템플릿 개체로 한 번만 보유
+"""
+
+import numpy as np
+from typing import List
+import sys
+from pathlib import Path
+
+parent_path = Path(__file__).parent.parent
+sys.path.insert(0, str(parent_path))
+
+from GA.ga_integrated import Individual2D_Full
+from GA.cost_model import CostModel2D
+from GA.fitness_cache import FitnessCache
+
+
+def layouts_to_cells(layouts: np.ndarray, n_chars: int = 26) -> np.ndarray:
+    """
+    (P, 행, 열) 배열 묶음 → (P, n_chars) 글자별 flat 셀 인덱스 (없으면 -1)
+    char_cells와 같이 같은 글자가 여러 번 있으면 첫 위치
+    """
+    flat = np.asarray(layouts).reshape(len(layouts), -1)
+    cells = np.full((len(flat), n_chars), -1, dtype=np.intp)
+    p, k = np.nonzero((flat >= 0) & (flat < n_chars))
+    # 뒤에서부터 써서 첫 위치가 남도록
+    cells[p[::-1], flat[p, k][::-1]] = k[::-1]
+    return cells
+
+
+class Population:
+    """
+    모집단 컨테이너
+    - layouts: (P, 행, 열) int8 연속 배열
+    - raw_costs: (P, 3) [총 피로도(쌍), 라플라시안 이차형식(clamp 전), 개별 자모 빈도 비용]
+                 평가되지 않은 행은 NaN
+    개체(Individual2D_Full)는 필요할 때만 만들어 줌
+    """
+
+    def __init__(self,
+                 layouts: np.ndarray,
+                 template: Individual2D_Full,
+                 cost_model: CostModel2D = None,
+                 raw_costs: np.ndarray = None):
+        """
+        Args:
+            layouts: (P, 행, 열) 배열 묶음
+            template: 평가 문맥(키보드, 피로도 모델, W, 빈도, 라플라시안, 가중치)을 가진 개체
+            cost_model: 일괄 평가 모델 (None이면 template으로 생성)
+            raw_costs: 이미 계산된 (P, 3) 비용 (None이면 미평가)
+        """
+        self.layouts = np.ascontiguousarray(layouts, dtype=np.int8)
+        self.template = template
+        self.cost_model = cost_model if cost_model is not None else CostModel2D.from_individual(template)
+        if raw_costs is None:
+            raw_costs = np.full((len(self.layouts), 3), np.nan)
+        self.raw_costs = np.array(raw_costs, dtype=float)
+
+    @classmethod
+    def from_individuals(cls, individuals: List[Individual2D_Full], cost_model: CostModel2D = None) -> 'Population':
+        """개체 리스트 → 모집단 (평가된 개체의 비용 항은 그대로 가져옴)"""
+        raw = np.full((len(individuals), 3), np.nan)
+        for i, ind in enumerate(individuals):
+            if ind._fitness is not None:
+                raw[i] = ind._fatigue_total, ind._lap_raw, ind._freq_cost
+        layouts = np.stack([ind.layout_2d for ind in individuals])
+        return cls(layouts, individuals[0], cost_model, raw)
+
+    def __len__(self):
+        return len(self.layouts)
+
+    def __getitem__(self, idx):
+        """정수 → 개체, 슬라이스/인덱스 배열 → 부분 모집단"""
+        if isinstance(idx, (int, np.integer)):
+            return self.individual(idx)
+        return self.take(idx)
+
+    @property
+    def shape(self):
+        return self.layouts.shape[1:]
+
+    @property
+    def cells(self) -> np.ndarray:
+        """(P, 26) 글자별 flat 셀 인덱스"""
+        return layouts_to_cells(self.layouts)
+
+    @property
+    def evaluated(self) -> np.ndarray:
+        return ~np.isnan(self.raw_costs).any(axis=1)
+
+    @property
+    def costs(self) -> np.ndarray:
+        """(P, 3) 비용 - 라플라시안 항은 clamp"""
+        costs = self.raw_costs.copy()
+        costs[:, 1] = np.maximum(costs[:, 1], 0)
+        return costs
+
+    @property
+    def fitness(self) -> np.ndarray:
+        """(P,) 적합도 (미평가 개체는 NaN)"""
+        return self.cost_model.fitness(self.costs)
+
+    def evaluate(self, cache: FitnessCache = None, rows: np.ndarray = None) -> np.ndarray:
+        """
+        미평가 행만 일괄 평가 - 같은 배열은 한 번만 계산
+        cache가 주어지면 캐시의 (피로도, 라플라시안, 빈도) 항을 먼저 찾아봄
+        rows가 주어지면 그 행들만 평가
+        Returns:
+            (P,) 적합도
+        """
+        pending = np.flatnonzero(~self.evaluated)
+        if rows is not None:
+            pending = np.intersect1d(pending, rows)
+        if len(pending):
+            flat = self.layouts.reshape(len(self.layouts), -1)
+            groups = {}
+            for i in pending:
+                groups.setdefault(flat[i].tobytes(), []).append(i)
+
+            todo = []
+            for rows in groups.values():
+                entry = cache.get(self._cache_key(rows[0])) if cache is not None else None
+                if entry is None:
+                    todo.append(rows)
+                else:
+                    self.raw_costs[rows] = entry['_fatigue_total'], entry['_lap_raw'], entry['_freq_cost']
+
+            if todo:
+                raw = self.cost_model.raw_costs(layouts_to_cells(self.layouts[[rows[0] for rows in todo]]))
+                for rows, costs in zip(todo, raw):
+                    self.raw_costs[rows] = costs
+                    if cache is not None:
+                        cache.store(self.individual(rows[0]))
+        return self.fitness
+
+    def apply_swaps(self, rows: np.ndarray, cell_a: np.ndarray, cell_b: np.ndarray):
+        """
+        행 rows[k]의 셀 cell_a[k] ↔ cell_b[k] 교환 (한 호출에서 같은 행은 한 번만)
+        평가된 행은 CostModel2D.swap_deltas로 비용 항을 O(n) 갱신
+        """
+        rows = np.asarray(rows, dtype=np.intp)
+        if not len(rows):
+            return
+        cell_a, cell_b = np.asarray(cell_a, dtype=np.intp), np.asarray(cell_b, dtype=np.intp)
+        flat = self.layouts.reshape(len(self.layouts), -1)
+
+        done = self.evaluated[rows]
+        if done.any():
+            r = rows[done]
+            grid = flat[r].astype(np.intp)
+            self.raw_costs[r] += self.cost_model.swap_deltas(layouts_to_cells(self.layouts[r]), grid,
+                                                             cell_a[done], cell_b[done])
+        flat[rows, cell_a], flat[rows, cell_b] = flat[rows, cell_b], flat[rows, cell_a]
+
+    def _cache_key(self, i: int) -> bytes:
+        # FitnessCache는 개체의 layout_2d(int) bytes를 키로 씀
+        return FitnessCache.key(self.layouts[i].astype(int))
+
+    def individual(self, i: int) -> Individual2D_Full:
+        """i번째 개체 - 평가 문맥은 템플릿과 공유 (복사하지 않음)"""
+        t = self.template
+        ind = Individual2D_Full(self.layouts[i], t.keyboard, t.fatigue_model, t.co_occurrence,
+                                t.frequency_vec, t.laplacian_spectral, t.lap_weight, t.freq_weight)
+        ind._step_costs = t._step_cost_tensor()
+        if not np.isnan(self.raw_costs[i]).any():
+            ind.set_costs(*self.raw_costs[i])
+        return ind
+
+    def to_individuals(self) -> List[Individual2D_Full]:
+        return [self.individual(i) for i in range(len(self))]
+
+    def set_individual(self, i: int, ind: Individual2D_Full):
+        """개체의 배열(과 평가된 경우 비용 항)을 i번째 행에 기록"""
+        self.layouts[i] = ind.layout_2d
+        if ind._fitness is not None:
+            self.raw_costs[i] = ind._fatigue_total, ind._lap_raw, ind._freq_cost
+        else:
+            self.raw_costs[i] = np.nan
+
+    def take(self, idx) -> 'Population':
+        """선택한 행으로 새 모집단 (배열 복사, 문맥 공유)"""
+        return Population(self.layouts[idx], self.template, self.cost_model, self.raw_costs[idx])
+
+    def concat(self, other: 'Population') -> 'Population':
+        return Population(np.concatenate([self.layouts, other.layouts]), self.template, self.cost_model,
+                          np.concatenate([self.raw_costs, other.raw_costs]))
+
+    def best(self) -> int:
+        """적합도가 가장 높은 행 번호 (평가된 행 중)"""
+        return int(np.nanargmax(self.fitness))
+
+    @property
+    def nbytes(self) -> int:
+        return self.layouts.nbytes + self.raw_costs.nbytes
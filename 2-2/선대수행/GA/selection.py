@@ -0,0 +1,92 @@
+"""
+벡터화 선택 - (P,) 적합도 배열로 한 세대에 필요한 부모 인덱스를 한 번에 뽑음
+개체를 복사하지 않고 인덱스만 돌려줌 (적합도는 클수록 좋음, 비용을 쓰려면 -cost나 1/cost)
+"""
+
+import numpy as np
+
+
+def _generator(rng):
+    # rng가 없으면 저장소의 다른 연산자처럼 전역 np.random 사용
+    return np.random if rng is None else rng
+
+
+def _integers(rng, high, size):
+    if rng is None:
+        return np.random.randint(0, high, size=size)
+    return rng.integers(0, high, size=size)
+
+
+def tournament_select(fitness: np.ndarray, n: int, k: int = 3, rng=None) -> np.ndarray:
+    """
+    k-토너먼트 n번 - 각 토너먼트는 서로 다른 k개 후보 (P < k면 중복 허용)
+    Returns:
+        (n,) 승자 인덱스
+    """
+    fitness = np.asarray(fitness, dtype=float)
+    p = len(fitness)
+    cand = _integers(rng, p, (n, k))
+    if 1 < k <= p:
+        # 같은 후보가 겹친 토너먼트만 다시 뽑음
+        while True:
+            s = np.sort(cand, axis=1)
+            dup = (s[:, 1:] == s[:, :-1]).any(axis=1)
+            if not dup.any():
+                break
+            cand[dup] = _integers(rng, p, (int(dup.sum()), k))
+    winner = np.argmax(fitness[cand], axis=1)
+    return cand[np.arange(n), winner]
+
+
+def sus_select(weights: np.ndarray, n: int, rng=None) -> np.ndarray:
+    """
+    확률적 균등 샘플링(SUS) - 가중치 비례, 한 번의 난수와 searchsorted로 n개
+    뽑힌 순서는 섞어서 돌려줌 (짝지을 때 인접 인덱스끼리 묶이지 않게)
+    """
+    weights = np.asarray(weights, dtype=float)
+    if n == 0:
+        return np.empty(0, dtype=np.intp)
+    cum = np.cumsum(weights)
+    step = cum[-1] / n
+    pointers = _generator(rng).random() * step + step * np.arange(n)
+    idx = np.minimum(np.searchsorted(cum, pointers, side='right'), len(weights) - 1)
+    return _generator(rng).permutation(idx)
+
+
+def roulette_weights(fitness: np.ndarray) -> np.ndarray:
+    """룰렛 가중치 - 모두 양수가 되도록 최솟값을 뺀 적합도 (GAOperators.roulette_wheel_selection과 같음)"""
+    fitness = np.asarray(fitness, dtype=float)
+    return fitness - fitness.min() + 1e-6
+
+
+def rank_weights(fitness: np.ndarray, pressure: float = 1.5) -> np.ndarray:
+    """
+    선형 순위 가중치 - 최하위 2 - pressure, 최상위 pressure (1 <= pressure <= 2)
+    적합도 값의 크기와 무관하게 선택압이 일정
+    """
+    p = len(fitness)
+    ranks = np.empty(p)
+    ranks[np.argsort(fitness, kind='stable')] = np.arange(p)
+    if p == 1:
+        return np.ones(1)
+    return (2 - pressure) + 2 * (pressure - 1) * ranks / (p - 1)
+
+
+def select_parents(fitness: np.ndarray, n: int, method: str = 'tournament', rng=None,
+                   tournament_size: int = 3, pressure: float = 1.5) -> np.ndarray:
+    """
+    한 세대의 부모 인덱스 n개
+    Args:
+        fitness: (P,) 적합도
+        n: 뽑을 부모 수 (보통 2 × (P - 엘리트 수))
+        method: 'tournament', 'sus' (= 'roulette', 적합도 비례), 'rank'
+    Returns:
+        (n,) 인덱스 - reshape(-1, 2)로 짝지어 사용
+    """
+    if method == 'tournament':
+        return tournament_select(fitness, n, tournament_size, rng)
+    if method in ('sus', 'roulette'):
+        return sus_select(roulette_weights(fitness), n, rng)
+    if method == 'rank':
+        return sus_select(rank_weights(fitness, pressure), n, rng)
+    raise ValueError(f"unknown selection: {method}")
@@ -0,0 +1,129 @@
+"""
+실행기 공통 종료 조건 - 세대(반복)마다 update()를 부르고 True면 멈춤
+- patience: 최고 비용이 이 세대 수 동안 개선되지 않음
+- window, min_improvement: 최근 window 세대의 최고 비용 상대 개선이 min_improvement 미만 (평탄한 꼬리)
+- diversity_floor: 모집단 다양성(정규화 평균 해밍 거리)이 이 값 미만
+- time_limit: run() 시작부터의 초 단위 벽시계 예산
+- max_evals: 적합도 평가 수 상한 (캐시 적중은 제외)
+- gap_epsilon: 하한과의 상대 간격 (lower_bound는 실행기가 채우거나 직접 지정)
+멈춘 이유는 reason에 기록 ('patience', 'plateau', 'diversity', 'time_limit', 'max_evals', 'gap')
+"""
+
+import numpy as np
+import copy
+import time
+import sys
+from pathlib import Path
+
+parent_path = Path(__file__).parent.parent
+sys.path.insert(0, str(parent_path))
+
+from GA.lower_bound import optimality_gap
+
+
+def population_diversity(layouts: np.ndarray) -> float:
+    """
+    (P, ...) 배열 묶음의 평균 쌍별 해밍 거리 / 칸 수 (0 = 모두 같음)
+    칸마다 값 개수 c_v로 Σ (P² - Σ c_v²) / (P(P-1)) - O(P·n)
+    """
+    layouts = np.asarray(layouts).reshape(len(layouts), -1)
+    p, n = layouts.shape
+    if p < 2:
+        return 0.0
+    shifted = layouts - layouts.min()
+    width = int(shifted.max()) + 1
+    counts = np.zeros((n, width))
+    np.add.at(counts, (np.broadcast_to(np.arange(n), (p, n)), shifted), 1)
+    same = (counts ** 2).sum() - p * n
+    return float(1.0 - same / (p * (p - 1) * n))
+
+
+class StoppingPolicy:
+    """실행기 공통 종료 조건 (실행기는 run()마다 started()로 복사본을 만들어 사용)"""
+
+    def __init__(self,
+                 patience: int = None,
+                 window: int = None,
+                 min_improvement: float = 1e-4,
+                 diversity_floor: float = None,
+                 time_limit: float = None,
+                 max_evals: int = None,
+                 gap_epsilon: float = None,
+                 lower_bound: float = None):
+        self.patience = patience
+        self.window = window
+        self.min_improvement = min_improvement
+        self.diversity_floor = diversity_floor
+        self.time_limit = time_limit
+        self.max_evals = max_evals
+        self.gap_epsilon = gap_epsilon
+        self.lower_bound = lower_bound
+        self.start()
+
+    @property
+    def needs_diversity(self) -> bool:
+        return self.diversity_floor is not None
+
+    @property
+    def needs_bound(self) -> bool:
+        return self.gap_epsilon is not None and self.lower_bound is None
+
+    def start(self) -> 'StoppingPolicy':
+        self.reason = None
+        self.best_cost = np.inf
+        self.since_best = 0
+        self.gap = None
+        self.diversity = None
+        self.evaluations = 0
+        self.history = []
+        self._start_time = time.perf_counter()
+        return self
+
+    def started(self, **overrides) -> 'StoppingPolicy':
+        """실행 한 번에 쓸 초기화된 복사본 - None이 아닌 overrides 항목은 덮어씀 (원본은 그대로)"""
+        policy = copy.copy(self)
+        for name, value in overrides.items():
+            if value is not None:
+                setattr(policy, name, value)
+        return policy.start()
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self._start_time
+
+    def update(self, best_cost: float, evaluations: int = None, diversity: float = None) -> bool:
+        """
+        Args:
+            best_cost: 지금까지의 최고(최소) 비용
+            evaluations: 누적 평가 수
+            diversity: 현재 모집단 다양성 (diversity_floor를 쓸 때만 필요)
+        Returns:
+            멈춰야 하면 True (이유는 self.reason)
+        """
+        if best_cost < self.best_cost - 1e-12:
+            self.best_cost = best_cost
+            self.since_best = 0
+        else:
+            self.since_best += 1
+        self.history.append(best_cost)
+        if evaluations is not None:
+            self.evaluations = evaluations
+        self.diversity = diversity
+        if self.lower_bound is not None:
+            self.gap = optimality_gap(best_cost, self.lower_bound)
+
+        if self.gap_epsilon is not None and self.gap is not None and self.gap <= self.gap_epsilon:
+            self.reason = 'gap'
+        elif self.patience and self.since_best >= self.patience:
+            self.reason = 'patience'
+        elif self.window and len(self.history) > self.window:
+            old = self.history[-self.window - 1]
+            if (old - best_cost) / max(abs(old), 1e-12) < self.min_improvement:
+                self.reason = 'plateau'
+        if self.reason is None:
+            if self.diversity_floor is not None and diversity is not None and diversity < self.diversity_floor:
+                self.reason = 'diversity'
+            elif self.max_evals is not None and self.evaluations >= self.max_evals:
+                self.reason = 'max_evals'
+            elif self.time_limit is not None and self.elapsed() >= self.time_limit:
+                self.reason = 'time_limit'
+        return self.reason is not None
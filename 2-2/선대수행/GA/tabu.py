@@ -0,0 +1,221 @@
+"""
+타부 탐색 (robust tabu search) - Individual2D_Full과 같은 비용 모델
+- 이동: 두 글자의 셀 교환 (빈 칸은 create_initial_population처럼 고정)
+- n×n 스왑 delta 행렬 전체를 유지하고 이동마다 O(n²)로 갱신
+    · 피로도: QAP(W, S)
+    · 라플라시안: QAP(L, X), X[a, b] = col_a·col_b + row_a·row_b  (L이 없으면 QAP(W, G))
+    · 빈도: 선형 항 f_i · position_cost[cell_i]
+- 무작위 타부 기간, aspiration(최고 기록 갱신 시 타부 무시), 반복/시간 예산
+"""
+
+import numpy as np
+import time
+from typing import List
+import sys
+from pathlib import Path
+
+parent_path = Path(__file__).parent.parent
+sys.path.insert(0, str(parent_path))
+
+from GA.ga_integrated import Individual2D_Full, evaluate_population
+from GA.cost_model import CostModel2D
+from GA.population import layouts_to_cells
+
+
+class QAPDeltaMatrix:
+    """
+    Σ_ij A_ij B[p_i, p_j] 에서 글자 r, s의 셀을 맞바꿀 때의 변화량 D[r, s] (모든 쌍)
+    M = Aᵀ B_p, N = A B_pᵀ (B_p[i, j] = B[p_i, p_j])를 보관하고 교환마다 rank-2 갱신 → O(n²)
+    """
+
+    def __init__(self, A: np.ndarray, B: np.ndarray, p: np.ndarray):
+        self.A = np.asarray(A, dtype=float)
+        self.B = np.asarray(B, dtype=float)
+        self.reset(p)
+
+    def reset(self, p: np.ndarray):
+        """O(n³) 전체 재계산 (시작과 누적 오차 제거용)"""
+        self.Bp = self.B[np.ix_(p, p)]
+        self.M = self.A.T @ self.Bp
+        self.N = self.A @ self.Bp.T
+
+    def swap(self, u: int, v: int):
+        """글자 u, v의 셀 교환 반영 - O(n²)"""
+        A, Bp = self.A, self.Bp
+        # Aᵀ P = Aᵀ + e ⊗ (열 u, v 교환분),  B_p' = P B_p P
+        e = A[v] - A[u]
+        self.M += np.outer(e, Bp[u] - Bp[v])
+        f = A[:, v] - A[:, u]
+        self.N += np.outer(f, Bp[:, u] - Bp[:, v])
+        for X in (self.M, self.N):
+            X[:, [u, v]] = X[:, [v, u]]
+        Bp[[u, v]] = Bp[[v, u]]
+        Bp[:, [u, v]] = Bp[:, [v, u]]
+
+    def deltas(self) -> np.ndarray:
+        """D[r, s] (대각은 0) - O(n²)"""
+        A, Bp, M, N = self.A, self.Bp, self.M, self.N
+        a, b = np.diag(A), np.diag(Bp)
+        dM, dN = np.diag(M), np.diag(N)
+        At, Bt = A.T, Bp.T
+        ar, as_ = a[:, None], a[None, :]
+        br, bs = b[:, None], b[None, :]
+
+        # Σ_k (k 전체) [A_kr(B_ks - B_kr) + A_ks(B_kr - B_ks) + A_rk(B_sk - B_rk) + A_sk(B_rk - B_sk)]
+        D = (M - dM[:, None]) + (M.T - dM[None, :]) + (N - dN[:, None]) + (N.T - dN[None, :])
+        # k = r, k = s 항 제거
+        D -= ar * (Bp - br) + A * (br - Bp) + ar * (Bt - br) + At * (br - Bt)
+        D -= At * (bs - Bt) + as_ * (Bt - bs) + A * (bs - Bp) + as_ * (Bp - bs)
+        # r, s 자신의 항
+        D += ar * (bs - br) + A * (Bt - Bp) + At * (Bp - Bt) + as_ * (br - bs)
+        np.fill_diagonal(D, 0.0)
+        return D
+
+
+def _linear_deltas(f: np.ndarray, cost_p: np.ndarray) -> np.ndarray:
+    # Σ f_i c[p_i] 에서 r, s 교환: (f_r - f_s)(c[p_s] - c[p_r])
+    return (f[:, None] - f[None, :]) * (cost_p[None, :] - cost_p[:, None])
+
+
+class _TabuState:
+    """세 비용 항의 delta 행렬과 현재 배치"""
+
+    def __init__(self, cost_model: CostModel2D, p: np.ndarray):
+        n = len(p)
+        self.cm = cost_model
+        self.p = p.copy()
+
+        W = np.zeros((n, n))
+        W[:cost_model.n_chars, :cost_model.n_chars] = cost_model.W
+        self.fatigue = QAPDeltaMatrix(W, cost_model.S, self.p)
+        if cost_model.L is not None:
+            rows, cols = np.divmod(np.arange(cost_model.S.shape[0]), cost_model.shape[1])
+            X = np.outer(cols, cols) + np.outer(rows, rows)
+            self.lap = QAPDeltaMatrix(cost_model.L, X, self.p)
+        else:
+            self.lap = QAPDeltaMatrix(W, cost_model.G, self.p)
+
+        self.freq = np.zeros(n)
+        m = min(n, len(cost_model.freq))
+        self.freq[:m] = cost_model.freq[:m]
+        self.raw = cost_model.raw_costs(self.p[None])[0]
+
+    def deltas(self) -> np.ndarray:
+        """(3, n, n) 모든 교환 (r, s)의 raw 비용 항 변화량"""
+        return np.stack([self.fatigue.deltas(), self.lap.deltas(),
+                         _linear_deltas(self.freq, self.cm.position_cost[self.p])])
+
+    def total(self, raw: np.ndarray) -> np.ndarray:
+        """raw 비용 항 (3, ...) → clamp 후 가중 합"""
+        cm = self.cm
+        return cm.freq_weight * raw[2] + raw[0] + cm.lap_weight * np.maximum(raw[1], 0)
+
+    def apply(self, r: int, s: int, delta: np.ndarray):
+        self.p[[r, s]] = self.p[[s, r]]
+        self.fatigue.swap(r, s)
+        self.lap.swap(r, s)
+        self.raw = self.raw + delta
+
+    def resync(self):
+        self.fatigue.reset(self.p)
+        self.lap.reset(self.p)
+        self.raw = self.cm.raw_costs(self.p[None])[0]
+
+
+def solve_tabu(population: List[Individual2D_Full],
+               iterations: int = 5000,
+               time_limit: float = None,
+               tenure: tuple = (0.9, 1.1),
+               aspiration: bool = True,
+               resync_every: int = 500,
+               seed: int = None,
+               verbose: bool = False):
+    """
+    Args:
+        population: 시작 후보 - 그중 가장 좋은 배열에서 시작
+        iterations: 최대 이동 수
+        time_limit: 초 단위 벽시계 예산
+        tenure: 타부 기간 범위 (n의 배수) - 이동마다 그 사이에서 무작위
+        aspiration: 타부 이동이라도 최고 기록을 갱신하면 허용
+        resync_every: delta 행렬을 O(n³)로 다시 계산하는 주기
+    Returns:
+        (최고 개체, 정보 dict - history, 반복 수, 경과 시간)
+    """
+    rng = np.random.default_rng(seed)
+    template = population[0]
+    cost_model = CostModel2D.from_individual(template)
+
+    costs = evaluate_population(population, cost_model)
+    start_ind = population[int(np.argmin(cost_model.total_cost(costs)))]
+    layout_shape = start_ind.layout_2d.shape
+    grid = start_ind.layout_2d.reshape(-1)
+    p = layouts_to_cells(start_ind.layout_2d[None])[0]
+    if (p < 0).any():
+        raise ValueError("tabu search needs every character placed")
+    n = len(p)
+
+    state = _TabuState(cost_model, p)
+    current = float(state.total(state.raw))
+    best_cost, best_p = current, state.p.copy()
+
+    # tabu_until[i, cell]: 이 반복 전까지 글자 i를 cell로 되돌리는 이동 금지
+    tabu_until = np.zeros((n, grid.size), dtype=np.int64)
+    lo, hi = max(1, int(tenure[0] * n)), max(2, int(tenure[1] * n) + 1)
+    upper = np.triu(np.ones((n, n), dtype=bool), 1)
+
+    history = []
+    start = time.perf_counter()
+    done = 0
+    for it in range(1, iterations + 1):
+        if time_limit is not None and time.perf_counter() - start >= time_limit:
+            break
+        done = it
+
+        deltas = state.deltas()
+        cost_after = state.total(state.raw[:, None, None] + deltas)
+        # r → p_s, s → p_r 둘 다 타부일 때만 금지
+        forbidden = (tabu_until[np.arange(n)[:, None], state.p[None, :]] > it) & \
+                    (tabu_until[np.arange(n)[None, :], state.p[:, None]] > it)
+        allowed = upper & ~forbidden
+        if aspiration:
+            allowed |= upper & (cost_after < best_cost - 1e-12)
+        candidates = np.where(allowed, cost_after, np.inf)
+        if not np.isfinite(candidates).any():
+            candidates = np.where(upper, cost_after, np.inf)
+
+        # 같은 값이 여러 개면 무작위로
+        best_val = candidates.min()
+        ties = np.flatnonzero(candidates.ravel() <= best_val + 1e-12)
+        r, s = divmod(int(rng.choice(ties)), n)
+
+        old_r, old_s = state.p[r], state.p[s]
+        state.apply(r, s, deltas[:, r, s])
+        current = float(cost_after[r, s])
+        tabu_until[r, old_r] = it + rng.integers(lo, hi)
+        tabu_until[s, old_s] = it + rng.integers(lo, hi)
+
+        if resync_every and it % resync_every == 0:
+            state.resync()
+            current = float(state.total(state.raw))
+
+        if current < best_cost - 1e-12:
+            best_cost, best_p = current, state.p.copy()
+
+        if it % max(1, min(iterations, 100000) // 100) == 0:
+            history.append({'iteration': it, 'best': best_cost, 'current': current})
+            if verbose:
+                print(f"Iter {it}: best={best_cost:.4f}, current={current:.4f}")
+
+    layout = np.full(grid.size, -1, dtype=int)
+    layout[best_p] = np.arange(n)
+    best = template.copy()
+    best.layout_2d = layout.reshape(layout_shape)
+    best.evaluate()
+
+    info = {
+        'history': history,
+        'best_cost': best_cost,
+        'iterations': done,
+        'seconds': time.perf_counter() - start
+    }
+    return best, info
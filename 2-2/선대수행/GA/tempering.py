@@ -0,0 +1,168 @@
+"""
+병렬 템퍼링 (replica exchange) - Individual2D_Full과 같은 비용 모델(CostModel2D)
+- R개의 레플리카를 온도 사다리 위에서 (R, ...) 배열로 한 프로세스에서 동시에 진행
+- 이동은 사용 가능한 셀 두 개의 스왑 (CostModel2D.swap_deltas, 레플리카당 O(n))
+- exchange_every 단계마다 이웃 온도끼리 상태 교환 (짝수/홀수 쌍 번갈아)
+- adapt_every 단계마다 교환 수락률이 target_exchange에 가까워지도록 사다리 간격 조정 (양 끝 고정)
+"""
+
+import numpy as np
+import time
+from typing import List
+import sys
+from pathlib import Path
+
+parent_path = Path(__file__).parent.parent
+sys.path.insert(0, str(parent_path))
+
+from GA.ga_integrated import Individual2D_Full
+from GA.cost_model import CostModel2D
+from GA.crossover import usable_cells
+from GA.population import layouts_to_cells
+from GA.annealing import clamped_costs, random_swap_pairs, metropolis_swap_step, initial_temperature
+
+
+def geometric_ladder(t_min: float, t_max: float, n: int) -> np.ndarray:
+    """t_min ~ t_max 기하 간격 온도 n개 (오름차순)"""
+    if n == 1:
+        return np.array([t_min])
+    return t_min * (t_max / t_min) ** (np.arange(n) / (n - 1))
+
+
+def adapt_ladder(temps: np.ndarray, exchange_rate: np.ndarray, target: float = 0.25,
+                 step: float = 1.0) -> np.ndarray:
+    """
+    교환 수락률로 사다리 조정 - 양 끝 온도는 고정하고 log 간격만 다시 나눔
+    간격마다 exp(step·(수락률 - target))배 한 뒤 전체 폭을 원래대로 맞춤
+    (수락률이 높은 구간은 넓어지고 낮은 구간은 좁아짐)
+    """
+    gaps = np.diff(np.log(temps))
+    new_gaps = gaps * np.exp(step * (np.asarray(exchange_rate) - target))
+    new_gaps *= gaps.sum() / new_gaps.sum()
+    return temps[0] * np.exp(np.concatenate([[0.0], np.cumsum(new_gaps)]))
+
+
+def solve_pt(population: List[Individual2D_Full],
+             n_replicas: int = 8,
+             steps: int = 20000,
+             time_limit: float = None,
+             t_min: float = None,
+             t_max: float = None,
+             exchange_every: int = 10,
+             adapt_every: int = 500,
+             target_exchange: float = 0.25,
+             resync_every: int = 1000,
+             seed: int = None,
+             verbose: bool = False):
+    """
+    Args:
+        population: 시작 배열 (레플리카 수만큼 순환해서 사용) - 첫 개체의 모델/가중치로 비용 모델 구성
+        n_replicas: 레플리카(온도) 수
+        steps: 레플리카당 최대 이동 수
+        time_limit: 초 단위 벽시계 예산
+        t_min, t_max: 사다리 양 끝 온도 (None이면 t_max는 초기 수락률 0.8 기준 추정, t_min = t_max × 1e-3)
+        exchange_every: 이웃 온도 교환 주기 (단계)
+        adapt_every: 사다리 조정 주기 (None/0이면 고정 사다리)
+        target_exchange: 조정 목표 교환 수락률
+        resync_every: 누적 오차를 없애기 위해 전체 비용을 다시 계산하는 주기
+        seed: 난수 시드
+    Returns:
+        (최고 개체, 정보 dict - history, 최종 온도, 이동/교환 수락률, 평가 수, 경과 시간)
+    """
+    rng = np.random.default_rng(seed)
+    template = population[0]
+    cost_model = CostModel2D.from_individual(template)
+
+    layouts = np.stack([population[k % len(population)].layout_2d for k in range(n_replicas)])
+    grid = layouts.reshape(n_replicas, -1).astype(np.intp)
+    cells = layouts_to_cells(layouts)
+    usable = usable_cells(layouts[0])
+
+    raw = cost_model.raw_costs(cells)
+    energy = cost_model.total_cost(clamped_costs(raw))
+    best_energy = float(energy.min())
+    best_grid = grid[int(np.argmin(energy))].copy()
+
+    if t_max is None:
+        t_max = initial_temperature(cost_model, cells, grid, usable, rng)
+    if t_min is None:
+        t_min = t_max * 1e-3
+    temps = geometric_ladder(t_min, t_max, n_replicas)
+
+    # 쌍 (i, i+1)별 교환 시도/수락 (조정 구간마다 초기화)
+    tried = np.zeros(max(1, n_replicas - 1))
+    swapped = np.zeros(max(1, n_replicas - 1))
+    total_tried = total_swapped = 0
+    exchange_round = 0
+
+    log_every = max(1, min(steps, 100000) // 100)
+    history = []
+    accepted = 0
+    start = time.perf_counter()
+    done = 0
+    for step in range(1, steps + 1):
+        if time_limit is not None and time.perf_counter() - start >= time_limit:
+            break
+        done = step
+
+        # 레플리카별 Metropolis 이동
+        cell_a, cell_b = random_swap_pairs(usable, n_replicas, rng)
+        accept = metropolis_swap_step(cost_model, grid, cells, raw, energy, cell_a, cell_b, temps, rng)
+        accepted += int(accept.sum())
+
+        if resync_every and step % resync_every == 0:
+            raw = cost_model.raw_costs(cells)
+            energy = cost_model.total_cost(clamped_costs(raw))
+
+        k = int(np.argmin(energy))
+        if energy[k] < best_energy - 1e-12:
+            best_energy = float(energy[k])
+            best_grid = grid[k].copy()
+
+        # 이웃 온도 교환: 슬롯 i, i+1의 상태를 맞바꿈 (온도는 슬롯에 고정)
+        if n_replicas > 1 and step % exchange_every == 0:
+            lo = np.arange(exchange_round % 2, n_replicas - 1, 2)
+            hi = lo + 1
+            exchange_round += 1
+            log_p = (1 / temps[lo] - 1 / temps[hi]) * (energy[lo] - energy[hi])
+            ok = np.log(rng.random(len(lo))) < np.minimum(log_p, 0)
+            tried[lo] += 1
+            swapped[lo[ok]] += 1
+            total_tried += len(lo)
+            total_swapped += int(ok.sum())
+            i, j = lo[ok], hi[ok]
+            for arr in (grid, cells, raw, energy):
+                arr[i], arr[j] = arr[j].copy(), arr[i].copy()
+
+        if adapt_every and n_replicas > 2 and step % adapt_every == 0 and tried.min() > 0:
+            temps = adapt_ladder(temps, swapped / tried, target_exchange)
+            tried[:] = 0
+            swapped[:] = 0
+
+        if step % log_every == 0:
+            history.append({
+                'step': step,
+                'best': best_energy,
+                'mean': float(energy.mean()),
+                't_min': float(temps[0]),
+                't_max': float(temps[-1])
+            })
+            if verbose:
+                print(f"Step {step}: best={best_energy:.4f}, cold={energy[0]:.4f}, "
+                      f"T=[{temps[0]:.4g}, {temps[-1]:.4g}]")
+
+    best = template.copy()
+    best.layout_2d = best_grid.reshape(layouts.shape[1:])
+    best.evaluate()
+
+    info = {
+        'history': history,
+        'best_cost': best_energy,
+        'temperatures': temps,
+        'acceptance_rate': accepted / max(1, done * n_replicas),
+        'exchange_rate': total_swapped / max(1, total_tried),
+        'evaluations': done * n_replicas,
+        'steps': done,
+        'seconds': time.perf_counter() - start
+    }
+    return best, info
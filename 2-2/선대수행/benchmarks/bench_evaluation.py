@@ -0,0 +1,315 @@
+"""
+평가 처리량 벤치마크
+- 구현별 초당 평가 수, 세대당 실행 시간, 최대 메모리(tracemalloc)
+- datas/*.csv와 고정 시드로 만든 같은 입력 사용
+- 결과는 JSON으로 저장 (--baseline으로 이전 결과와 비교)
+
+사용 예:
+    python benchmarks/bench_evaluation.py --sizes 20 100 1000 10000 --out bench.json
+    python benchmarks/bench_evaluation.py --impl ga_integrated population --baseline bench.json
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+parent_path = Path(__file__).parent.parent
+sys.path.insert(0, str(parent_path))
+
+
+def load_inputs():
+    """공기 행렬 W, 자모 빈도, 키보드/피로도 모델, 라플라시안 (한 번만 로드)"""
+    from datas.data import load_combined_cooccurrence, load_combined_frequency
+    from models.keyboard_layout_corrected import KeyboardLayout
+    from models.fatigue_corrected import FatigueModel
+    from models.rw_laplacian import laplacian_spectral
+
+    datas = parent_path / 'datas'
+    W = load_combined_cooccurrence(str(datas / 'all_raw_weight.csv'), str(datas / 'high_raw_weight.csv'))
+    freq = load_combined_frequency(str(datas / 'all_count.csv'), str(datas / 'high_count.csv'))
+    return {
+        'W': W,
+        'freq': freq,
+        'keyboard': KeyboardLayout(),
+        'fatigue': FatigueModel(),
+        'laplacian': laplacian_spectral(W)
+    }
+
+
+def make_layouts(pop_size: int, seed: int):
+    """고정 시드 초기 배열 (P, 3, 10)"""
+    from ga_runner_integrated import create_initial_population
+    np.random.seed(seed)
+    return create_initial_population(pop_size)
+
+
+# 구현별 정의
+#   build(inputs, layouts) -> 평가 대상 (개체 리스트 등)
+#   evaluate(inputs, objs) -> 모두 평가
+#   runner(inputs, pop_size, generations) -> (GA 실행기, run() 키워드 인자) (None이면 세대 벤치 생략)
+
+def _ga_fast():
+    from GA.ga_fast import Individual, GARunner
+    from models.keyboard_layout import Keyboard
+    keyboard = Keyboard()
+
+    def build(inputs, layouts):
+        return [Individual(l.reshape(-1), keyboard, inputs['W'], 0.3) for l in layouts]
+
+    def evaluate(inputs, objs):
+        for ind in objs:
+            ind.evaluate()
+
+    def runner(inputs, pop_size, generations):
+        return GARunner(pop_size=pop_size, generations=generations), {}
+
+    return build, evaluate, runner
+
+
+def _ga_2d():
+    from GA.ga_2d import Individual2D, GARunner2D
+
+    def build(inputs, layouts):
+        return [Individual2D(l, inputs['W'], 0.3) for l in layouts]
+
+    def evaluate(inputs, objs):
+        for ind in objs:
+            ind.evaluate()
+
+    def runner(inputs, pop_size, generations):
+        return GARunner2D(pop_size=pop_size, generations=generations), {}
+
+    return build, evaluate, runner
+
+
+def _ga_integrated():
+    from GA.ga_integrated import Individual2D_Full, GARunner2D_Full
+
+    def build(inputs, layouts):
+        return [Individual2D_Full(l, inputs['keyboard'], inputs['fatigue'], inputs['W'],
+                                  inputs['freq'], inputs['laplacian']) for l in layouts]
+
+    def evaluate(inputs, objs):
+        for ind in objs:
+            ind.evaluate()
+
+    def runner(inputs, pop_size, generations):
+        return GARunner2D_Full(pop_size=pop_size, generations=generations), {}
+
+    return build, evaluate, runner
+
+
+def _ga_integrated_batch():
+    # 같은 개체를 evaluate_population으로 일괄 평가
+    from GA.ga_integrated import evaluate_population
+    build, _, _ = _ga_integrated()
+
+    def evaluate(inputs, objs):
+        evaluate_population(objs)
+
+    return build, evaluate, None
+
+
+def _population():
+    from GA.population import Population
+    from GA.ga_integrated import Individual2D_Full
+
+    def build(inputs, layouts):
+        template = Individual2D_Full(layouts[0], inputs['keyboard'], inputs['fatigue'], inputs['W'],
+                                     inputs['freq'], inputs['laplacian'])
+        return Population(np.stack(layouts), template)
+
+    def evaluate(inputs, pop):
+        pop.evaluate()
+
+    return build, evaluate, None
+
+
+def _genetic_algorithm():
+    from GA.genetic_algorithm import Individual, GARunner
+    from models.keyboard_layout import Keyboard
+    keyboard = Keyboard()
+
+    def build(inputs, layouts):
+        return [Individual(l.reshape(-1), keyboard, None, inputs['W'], 0.3) for l in layouts]
+
+    def evaluate(inputs, objs):
+        for ind in objs:
+            ind.evaluate()
+
+    def runner(inputs, pop_size, generations):
+        return GARunner(population_size=pop_size, max_generations=generations), {'verbose': False}
+
+    return build, evaluate, runner
+
+
+def _keyboard_layout():
+    def build(inputs, layouts):
+        return layouts
+
+    def evaluate(inputs, layouts):
+        tables = inputs['fatigue'].get_all_tables()
+        for layout in layouts:
+            inputs['keyboard'].evaluate_layout(layout, inputs['W'], *tables)
+
+    return build, evaluate, None
+
+
+IMPLEMENTATIONS = {
+    'ga_fast': _ga_fast,
+    'ga_2d': _ga_2d,
+    'ga_integrated': _ga_integrated,
+    'ga_integrated_batch': _ga_integrated_batch,
+    'population': _population,
+    'genetic_algorithm': _genetic_algorithm,
+    'keyboard_layout': _keyboard_layout,
+}
+
+
+def _peak_memory(fn) -> int:
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def bench_evaluation(inputs, build, evaluate, layouts, repeat):
+    """새로 만든(미평가) 개체 묶음을 평가하는 시간 - repeat번 중 최솟값"""
+    # 워밍업: step 비용 텐서/라플라시안 등 1회성 캐시는 측정에서 제외
+    evaluate(inputs, build(inputs, layouts[:1]))
+
+    best = np.inf
+    for _ in range(repeat):
+        objs = build(inputs, layouts)
+        t = time.perf_counter()
+        evaluate(inputs, objs)
+        best = min(best, time.perf_counter() - t)
+
+    peak = _peak_memory(lambda: evaluate(inputs, build(inputs, layouts)))
+    return {
+        'n_evals': len(layouts),
+        'seconds': best,
+        'evals_per_sec': len(layouts) / best if best > 0 else None,
+        'peak_memory_bytes': peak
+    }
+
+
+def bench_generations(inputs, runner, layouts, generations):
+    """GA 실행 시간 / 세대 수, 메모리는 1세대 실행의 최댓값"""
+    make_runner, build = runner
+    ga, kwargs = make_runner(inputs, len(layouts), generations)
+    population = build(inputs, layouts)
+    np.random.seed(0)
+    t = time.perf_counter()
+    ga.run(population, **kwargs)
+    seconds = time.perf_counter() - t
+
+    ga1, kwargs1 = make_runner(inputs, len(layouts), 1)
+    np.random.seed(0)
+    peak = _peak_memory(lambda: ga1.run(build(inputs, layouts), **kwargs1))
+    return {
+        'generations': generations,
+        'seconds_per_generation': seconds / generations,
+        'peak_memory_bytes': peak
+    }
+
+
+def run_benchmarks(impls, sizes, generations, repeat, max_evals, max_runner_pop, seed, verbose=True):
+    inputs = load_inputs()
+    results = []
+    for name in impls:
+        try:
+            build, evaluate, runner = IMPLEMENTATIONS[name]()
+        except ImportError as e:
+            # 이 트리에 없는 모듈에 의존하는 구현은 건너뜀
+            results.append({'impl': name, 'skipped': f'{type(e).__name__}: {e}'})
+            if verbose:
+                print(f"{name}: skipped ({e})")
+            continue
+
+        for pop_size in sizes:
+            layouts = make_layouts(pop_size, seed)
+            entry = {'impl': name, 'pop_size': pop_size}
+            # 느린 구현은 max_evals개만 평가해서 처리량 추정
+            entry['evaluation'] = bench_evaluation(inputs, build, evaluate, layouts[:max_evals], repeat)
+            if runner is not None and pop_size <= max_runner_pop:
+                entry['generation'] = bench_generations(inputs, (runner, build), layouts, generations)
+            results.append(entry)
+
+            if verbose:
+                ev = entry['evaluation']
+                line = f"{name:>20} P={pop_size:<6} {ev['evals_per_sec']:>12.1f} evals/s  peak={ev['peak_memory_bytes'] / 1e6:.2f}MB"
+                if 'generation' in entry:
+                    gen = entry['generation']
+                    line += f"  {gen['seconds_per_generation'] * 1e3:.1f} ms/gen"
+                print(line)
+    return results
+
+
+def _git_revision():
+    try:
+        out = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=parent_path,
+                             capture_output=True, text=True, timeout=10)
+        return out.stdout.strip() or None
+    except Exception:
+        return None
+
+
+def compare(results, baseline_path):
+    """이전 JSON과 같은 (구현, P)끼리 초당 평가 수 비율 출력"""
+    with open(baseline_path, encoding='utf-8') as f:
+        baseline = json.load(f)
+    old = {(r['impl'], r.get('pop_size')): r for r in baseline['results'] if 'evaluation' in r}
+    print(f"\nvs {baseline_path} ({baseline.get('git_revision')})")
+    for r in results:
+        prev = old.get((r['impl'], r.get('pop_size')))
+        if prev is None or 'evaluation' not in r:
+            continue
+        ratio = r['evaluation']['evals_per_sec'] / prev['evaluation']['evals_per_sec']
+        print(f"{r['impl']:>20} P={r['pop_size']:<6} x{ratio:.2f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='GA 평가 처리량 벤치마크')
+    parser.add_argument('--impl', nargs='+', default=list(IMPLEMENTATIONS), choices=list(IMPLEMENTATIONS))
+    parser.add_argument('--sizes', nargs='+', type=int, default=[20, 100, 1000, 10000])
+    parser.add_argument('--generations', type=int, default=3)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--max-evals', type=int, default=2000, help='평가 벤치에서 구현당 최대 개체 수')
+    parser.add_argument('--max-runner-pop', type=int, default=10000, help='세대 벤치를 돌릴 최대 모집단 크기')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--out', default='bench_results.json')
+    parser.add_argument('--baseline', default=None, help='비교할 이전 결과 JSON')
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.impl, args.sizes, args.generations, args.repeat,
+                             args.max_evals, args.max_runner_pop, args.seed)
+    report = {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'git_revision': _git_revision(),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'settings': vars(args),
+        'results': results
+    }
+    with open(args.out, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print(f"saved: {args.out}")
+
+    if args.baseline:
+        compare(results, args.baseline)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,7 +1,13 @@
-import pandas as pd
 import numpy as np
-from jamo import h2j, j2hcj
-import copy
+import unicodedata
+import codecs
+import csv
+import hashlib
+import mmap
+import os
+import re
+import tempfile
+from pathlib import Path
 
 korean_list = list("ㄱㄴㄷㄹㅁㅂㅅㅇㅈㅊㅋㅌㅍㅎㅏㅐㅑㅓㅔㅕㅗㅛㅜㅠㅡㅣ")
 double_jamo = {
@@ -32,61 +38,269 @@ double_jamo = {
     "ㅖ": "ㅔ"
 }
 
-def preprocess_word(words = pd.DataFrame()):
-    words_count = dict() #jamo freq
-    raw_weight = dict() #raw dict (이중딕셔너리임, 후행 자모 빈도)
-
-    for i in korean_list:
-        words_count[i] = 0
-
-    for i in korean_list:
-        raw_weight[i] = copy.deepcopy(words_count)
-
-    for i in words.iterrows(): 
-        syllables = list(j2hcj(h2j(i[1]['단어']))) #jamo seperate
-        for j, sy in enumerate(syllables):
-            if sy in double_jamo.keys(): #이중자모 분리
-                syllables.pop(j)
-                syllables[j:j] = list(double_jamo[sy])
-
-        for j in enumerate(syllables): #freq
-            index, char = j[0], j[1]
+UNKNOWN = len(korean_list) #자모가 아닌 글자와 단어 경계 코드 (26) - 이 코드가 낀 bigram은 세지 않음
+jamo_index = {ch: i for i, ch in enumerate(korean_list)}
+
+#완성형 음절 = 0xAC00 + (초성 × 21 + 중성) × 28 + 종성
+CHOSEONG = list("ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ")
+JUNGSEONG = list("ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ")
+JONGSEONG = [""] + list("ㄱㄲㄳㄴㄵㄶㄷㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅄㅅㅆㅇㅈㅊㅋㅌㅍㅎ")
+MAX_JAMO = 5 #초성 1 + 중성 2 + 종성 2
+
+
+def char_codes(ch: str) -> list: #호환 자모 하나 → korean_list 인덱스 목록 (이중자모 분리 포함)
+    return [jamo_index.get(part, UNKNOWN) for part in double_jamo.get(ch, ch)]
+
+
+def _build_jamo_table():
+    """
+    BMP 코드 포인트 → 자모 코드 (h2j → j2hcj → 이중자모 분리와 같은 결과)
+    - 완성형 음절 11,172개 (유니코드 산술), 호환 자모 (U+3131~), 조합형 자모 (U+1100~ 등, 이름으로 대응)
+    - 나머지 글자는 UNKNOWN 하나
+    Returns:
+        (codes (65536, MAX_JAMO) int8, lengths (65536,) int8)
+    """
+    codes = np.full((0x10000, MAX_JAMO), UNKNOWN, dtype=np.int8)
+    lengths = np.ones(0x10000, dtype=np.int8)
+
+    def parts(jamo_list):
+        seqs = [char_codes(j) if j else [] for j in jamo_list]
+        table = np.full((len(seqs), 2), UNKNOWN, dtype=np.int8)
+        for i, seq in enumerate(seqs):
+            table[i, :len(seq)] = seq
+        return table, np.array([len(seq) for seq in seqs], dtype=np.int8)
+
+    cho, cho_len = parts(CHOSEONG)
+    jung, jung_len = parts(JUNGSEONG)
+    jong, jong_len = parts(JONGSEONG)
+
+    #음절: 초성/중성/종성 조각을 앞에서부터 이어 붙임
+    l, v, t = np.meshgrid(np.arange(19), np.arange(21), np.arange(28), indexing='ij')
+    l, v, t = l.ravel(), v.ravel(), t.ravel()
+    cp = 0xAC00 + (l * 21 + v) * 28 + t
+    pieces = np.concatenate([cho[l], jung[v], jong[t]], axis=1) #(11172, 6) 조각마다 2칸
+    piece_len = np.stack([cho_len[l], jung_len[v], jong_len[t]], axis=1)
+    keep = np.tile(np.arange(2), 3)[None, :] < np.repeat(piece_len, 2, axis=1)
+    rows = np.broadcast_to(np.arange(len(cp))[:, None], keep.shape)
+    out = np.full((len(cp), 6), UNKNOWN, dtype=np.int8)
+    out[rows[keep], (np.cumsum(keep, axis=1) - 1)[keep]] = pieces[keep]
+    codes[cp] = out[:, :MAX_JAMO]
+    lengths[cp] = piece_len.sum(axis=1)
+
+    #호환 자모
+    compat = [chr(c) for c in range(0x3131, 0x3164)]
+    table, table_len = parts(compat)
+    codes[0x3131:0x3164, :2] = table
+    lengths[0x3131:0x3164] = table_len
+
+    #조합형 자모 - j2hcj처럼 이름이 같은 호환 자모로 (HANGUL CHOSEONG X → HANGUL LETTER X)
+    for start, stop in ((0x1100, 0x1200), (0xA960, 0xA980), (0xD7B0, 0xD800)):
+        for c in range(start, stop):
+            name = unicodedata.name(chr(c), '').split(' ', 2)
+            if len(name) < 3 or name[1] not in ('CHOSEONG', 'JUNGSEONG', 'JONGSEONG'):
+                continue
             try:
-                words_count[char] += i[1]['빈도']
+                letter = unicodedata.lookup('HANGUL LETTER ' + name[2])
             except KeyError:
-                pass
-
-            if index < len(syllables) - 1: #add next 자모!
-                try:
-                    raw_weight[char][syllables[index + 1]] += i[1]['빈도']
-                except KeyError:
-                    pass
+                continue
+            seq = char_codes(letter)
+            codes[c, :len(seq)] = seq
+            lengths[c] = len(seq)
+    return codes, lengths
+
+
+JAMO_CODES, JAMO_LENGTHS = _build_jamo_table()
+
+
+def encode_words(words) -> tuple:
+    """
+    단어 목록 → 자모 코드 배열 (단어마다 뒤에 경계 코드 UNKNOWN)
+    JAMO_CODES 표에서 코드 포인트로 바로 gather (글자별 dict 조회 없음)
+    Returns:
+        (codes int8, word_id) - word_id[k] = codes[k]가 속한 단어 번호
+    """
+    text = '\n'.join(words) + '\n'
+    points = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32)
+    is_sep = points == 10
+    points = np.where(points < 0x10000, points, 0xFFFF) #BMP 밖은 자모가 아님
+
+    counts = JAMO_LENGTHS[points]
+    codes = JAMO_CODES[points][np.arange(MAX_JAMO)[None, :] < counts[:, None]]
+    word_id = np.repeat(np.cumsum(is_sep) - is_sep, counts)
+    return codes, word_id
+
+
+def count_jamo(words, freqs) -> tuple:
+    """
+    단어별 빈도로 가중한 자모 빈도 / 인접 자모 쌍 빈도
+    Returns:
+        (unigram (26,), bigram (26, 26)) - bigram[a, b] = a 다음에 b가 온 횟수
+    """
+    freqs = np.asarray(freqs)
+    n = UNKNOWN + 1
+    codes, word_id = encode_words(words)
+    weights = freqs[word_id].astype(float)
+    codes = codes.astype(np.intp)
+
+    unigram = np.bincount(codes, weights=weights, minlength=n)[:UNKNOWN]
+    #같은 단어 안의 쌍만 (단어 경계 코드가 끼면 [:26, :26] 밖으로 빠짐)
+    bigram = np.bincount(codes[:-1] * n + codes[1:], weights=weights[:-1],
+                         minlength=n * n).reshape(n, n)[:UNKNOWN, :UNKNOWN]
+    if np.issubdtype(freqs.dtype, np.integer):
+        unigram = np.rint(unigram).astype(np.int64)
+        bigram = np.rint(bigram).astype(np.int64)
+    return unigram, bigram
+
+
+#공백으로 나눈 칸이 정확히 세 개인 줄만 (\n 기준 줄, \r 등 다른 공백은 칸 구분자)
+_LINE_PATTERN = re.compile(r'^[^\S\n]*\S+[^\S\n]+(\S+)[^\S\n]+(\S+)[^\S\n]*$', re.MULTILINE)
+
+
+def parse_lines(text: str) -> tuple:
+    """'index 단어 빈도' 줄들 → (단어 목록, 빈도 배열) - 세 칸이 아닌 줄은 건너뜀 (줄마다 따로 판단)"""
+    rows = _LINE_PATTERN.findall(text)
+    return [row[0] for row in rows], _parse_freqs([row[1] for row in rows])
+
+
+def _parse_freqs(freqs: list) -> np.ndarray:
+    try:
+        return np.array(freqs, dtype=np.int64)
+    except ValueError:
+        return np.array(freqs, dtype=float)
+
+
+def stream_counts(path: str, start: int = 0, stop: int = None, chunk_size: int = 8 << 20) -> tuple:
+    """
+    'index 단어 빈도' 텍스트 파일을 mmap으로 열어 chunk_size 바이트씩 (줄 경계에서 자름) 바로 집계
+    DataFrame을 만들지 않고 파일 크기와 상관없이 청크 하나만큼의 메모리만 사용
+    Args:
+        start, stop: 읽을 바이트 구간 (줄 경계여야 함, stop=None이면 파일 끝까지)
+    Returns:
+        (unigram (26,), bigram (26, 26)) - bigram[a, b] = a 다음에 b가 온 횟수
+    """
+    unigram = np.zeros(len(korean_list), dtype=np.int64)
+    bigram = np.zeros((len(korean_list),) * 2, dtype=np.int64)
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        stop = size if stop is None else min(stop, size)
+        if stop <= start:
+            return unigram, bigram
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            pos = start
+            if start == 0 and mm[:len(codecs.BOM_UTF8)] == codecs.BOM_UTF8:
+                pos = len(codecs.BOM_UTF8)
+            while pos < stop:
+                end = min(pos + chunk_size, stop)
+                if end < stop:
+                    cut = mm.rfind(b'\n', pos, end)
+                    if cut < 0: #청크보다 긴 줄은 그 줄 끝까지
+                        cut = mm.find(b'\n', end, stop)
+                    end = stop if cut < 0 else cut + 1
+                words, freqs = parse_lines(mm[pos:end].decode('utf-8'))
+                if words:
+                    uni, bi = count_jamo(words, freqs)
+                    unigram = unigram + uni
+                    bigram = bigram + bi
+                pos = end
+    return unigram, bigram
+
+
+def preprocess_word(words):
+    unigram, bigram = count_jamo(words['단어'].tolist(), words['빈도'].to_numpy())
+
+    words_count = dict(zip(korean_list, unigram.tolist())) #jamo freq
+    raw_weight = {a: dict(zip(korean_list, row)) for a, row in zip(korean_list, bigram.tolist())} #raw dict (이중딕셔너리임, 후행 자모 빈도)
     return words_count, raw_weight
 
 if __name__ == "__main__":
+    import sys
+    from pathlib import Path
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+    from datas.ingest import ingest_corpus, save_counts
+    import pandas as pd
+
     high_words = pd.read_csv('datas/word_frequency.csv', encoding='utf-8')
-    all_words =pd.read_csv('datas/kor_news_2007_100K-words.txt', 
-                sep=r'\s+', 
-                header=None, 
-                engine='python',
-                names=['index', '단어', '빈도']) #10k words from news (txt여서 regex)
-    all_words.drop(columns=['index'], inplace=True)
-    
+    high_result = count_jamo(high_words['단어'].tolist(), high_words['빈도'].to_numpy())
+    all_result = ingest_corpus('datas/kor_news_2007_100K-words.txt') #10k words from news (줄 단위 샤드 병렬 집계)
 
-    high_result = preprocess_word(high_words)
-    all_result = preprocess_word(all_words)
+    #Save csv
+    save_counts(*high_result, "datas/high_count.csv", "datas/high_raw_weight.csv")
+    save_counts(*all_result, "datas/all_count.csv", "datas/all_raw_weight.csv")
+
+
+STORE_VERSION = 1
+
+
+def parse_count_csv(text: str) -> tuple:
+    """
+    high_count.csv / all_raw_weight.csv 형식 CSV 텍스트 → (자모 목록, 값)
+    - [, 단어, 빈도] 헤더면 (단어 열, 빈도 (n,))
+    - 아니면 가중치 표: (행 자모, (n, n)) - 열은 행 자모 순서로 맞춤
+    """
+    rows = [row for row in csv.reader(text.splitlines()) if row]
+    header, body = rows[0], rows[1:]
+    if header[1:] == ['단어', '빈도']:
+        return [row[1] for row in body], _parse_freqs([row[2] for row in body])
+
+    labels = [row[0] for row in body]
+    columns = {label: k for k, label in enumerate(header[1:])}
+    missing = [label for label in labels if label not in columns]
+    if missing:
+        raise ValueError(f"columns missing for rows: {missing}")
+    values = _parse_freqs([row[1:] for row in body])
+    return labels, values[:, [columns[label] for label in labels]]
+
+
+def load_counts(csv_path: str, store_path: str = None) -> tuple:
+    """
+    CSV 집계 파일 → (자모 목록, 값) - 옆의 .npz 저장소(자모 목록, 원본 sha256/mtime, 값)에서 읽음
+    저장소가 없거나, 원본이 더 새롭거나, 해시가 다르면 CSV를 다시 읽어서 저장소를 새로 만듦 (pandas 없이)
+    """
+    csv_path = Path(csv_path)
+    store_path = Path(store_path) if store_path else csv_path.with_suffix('.npz')
+    with open(csv_path, 'rb') as f:
+        data = f.read()
+        mtime_ns = os.fstat(f.fileno()).st_mtime_ns
+    checksum = hashlib.sha256(data).hexdigest()
 
-    high_count = pd.DataFrame(list(high_result[0].items()), columns=['단어', '빈도'])
-    all_count = pd.DataFrame(list(all_result[0].items()), columns=['단어', '빈도'])
+    try:
+        with np.load(store_path, allow_pickle=False) as store:
+            if (int(store['version']) == STORE_VERSION and str(store['checksum']) == checksum
+                    and int(store['mtime_ns']) >= mtime_ns):
+                return store['alphabet'].tolist(), store['counts']
+    except Exception: #없거나 깨진 저장소 (잘린 zip, 빈 파일 등)는 새로 만듦
+        pass
+
+    alphabet, counts = parse_count_csv(data.decode('utf-8-sig'))
+    try:
+        #프로세스마다 다른 임시 파일에 다 쓴 뒤 교체 (동시에 만들어도 반쯤 쓴 파일이 보이지 않음)
+        fd, tmp_path = tempfile.mkstemp(dir=store_path.parent, prefix=store_path.stem + '.', suffix='.npz')
+    except OSError: #저장소를 못 써도 읽은 값은 그대로 사용
+        return alphabet, counts
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            np.savez(f, version=STORE_VERSION, alphabet=np.array(alphabet), counts=counts,
+                     checksum=checksum, mtime_ns=mtime_ns)
+        os.replace(tmp_path, store_path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+    return alphabet, counts
 
-    high_weight = pd.DataFrame(high_result[1], index=korean_list)
-    all_weight = pd.DataFrame(all_result[1], index=korean_list)
 
-    #Save csv
-    high_count.to_csv("datas/high_count.csv", index=True, encoding='utf-8-sig')
-    all_count.to_csv("datas/all_count.csv", index=True, encoding='utf-8-sig')
-    high_weight.to_csv("datas/high_raw_weight.csv", index=True, encoding='utf-8-sig')
-    all_weight.to_csv("datas/all_raw_weight.csv", index=True, encoding='utf-8-sig')
+def _common_labels(labels: list, other: list) -> list:
+    """두 목록에 모두 있는 항목 (labels 순서)"""
+    other = set(other)
+    return [label for label in labels if label in other]
+
+
+def _select(values: np.ndarray, labels: list, chosen: list) -> np.ndarray:
+    """labels 기준 값에서 chosen 항목만 (2차원이면 행/열 모두)"""
+    position = {label: k for k, label in enumerate(labels)}
+    idx = [position[label] for label in chosen]
+    return values[np.ix_(idx, idx)] if values.ndim == 2 else values[idx]
 
 
 def load_co_occurrence_matrix(corpus_file: str = None, 
@@ -95,8 +309,8 @@ def load_co_occurrence_matrix(corpus_file: str = None,
     
     if csv_weight_file:
         try:
-            weight_df = pd.read_csv(csv_weight_file, index_col=0, encoding='utf-8-sig')
-            co_occurrence = weight_df.values.astype(float)
+            _, co_occurrence = load_counts(csv_weight_file)
+            co_occurrence = co_occurrence.astype(float)
 
             if normalize:
                 row_sum = co_occurrence.sum(axis=1, keepdims=True)
@@ -110,17 +324,8 @@ def load_co_occurrence_matrix(corpus_file: str = None,
     
     elif corpus_file:
         try:
-            words = pd.read_csv(corpus_file, 
-                              sep=r'\s+', 
-                              header=None, 
-                              engine='python',
-                              names=['index', '단어', '빈도'])
-            words.drop(columns=['index'], inplace=True)
-            
-            result = preprocess_word(words)
-            raw_weight = result[1]
-            
-            co_occurrence = pd.DataFrame(raw_weight, index=korean_list).values.astype(float)
+            _, bigram = stream_counts(corpus_file)
+            co_occurrence = bigram.T.astype(float) #행 = 뒤 자모, 열 = 앞 자모 (CSV와 같은 방향)
             
             if normalize:
                 row_sum = co_occurrence.sum(axis=1, keepdims=True)
@@ -144,18 +349,15 @@ def load_combined_cooccurrence(all_csv: str = 'datas/all_raw_weight.csv',
                                alpha: float = 0.6,
                                normalize: bool = True) -> np.ndarray:
     try:
-        df_all = pd.read_csv(all_csv, index_col=0, encoding='utf-8-sig')
-        df_high = pd.read_csv(high_csv, index_col=0, encoding='utf-8-sig')
+        idx_all, A = load_counts(all_csv)
+        idx_high, H = load_counts(high_csv)
     except Exception as e:
         print(f"Error loading CSVs for combined co-occurrence: {e}")
         return None
     
-    common_idx = df_all.index.intersection(df_high.index)
-    df_all = df_all.loc[common_idx, common_idx]
-    df_high = df_high.loc[common_idx, common_idx]
-
-    A = df_all.values.astype(float)
-    H = df_high.values.astype(float)
+    common_idx = _common_labels(idx_all, idx_high)
+    A = _select(A, idx_all, common_idx).astype(float)
+    H = _select(H, idx_high, common_idx).astype(float)
 
     if normalize:
         row_sums_A = A.sum(axis=1, keepdims=True)
@@ -179,16 +381,16 @@ def load_combined_frequency(all_count_csv: str = 'datas/all_count.csv',
                             high_count_csv: str = 'datas/high_count.csv',
                             alpha: float = 0.6) -> np.ndarray:
     try:
-        df_all = pd.read_csv(all_count_csv, index_col=0, encoding='utf-8-sig')
-        df_high = pd.read_csv(high_count_csv, index_col=0, encoding='utf-8-sig')
+        chars_all, freq_all = load_counts(all_count_csv)
+        chars_high, freq_high = load_counts(high_count_csv)
     except Exception as e:
         print(f"Error loading count CSVs: {e}")
         return None
 
-    common_chars = df_all.index.intersection(df_high.index)
+    common_chars = _common_labels(chars_all, chars_high)
 
-    freq_all = df_all.loc[common_chars, '빈도'].values.astype(float)
-    freq_high = df_high.loc[common_chars, '빈도'].values.astype(float)
+    freq_all = _select(freq_all, chars_all, common_chars).astype(float)
+    freq_high = _select(freq_high, chars_high, common_chars).astype(float)
 
     freq_all = freq_all / (freq_all.sum() + 1e-9)
     freq_high = freq_high / (freq_high.sum() + 1e-9)
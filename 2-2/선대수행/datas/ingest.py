@@ -0,0 +1,90 @@
+"""
+큰 코퍼스 병렬 집계 - 'index 단어 빈도' 텍스트 파일을 줄 경계에서 샤드로 나눠 워커마다 집계
+샤드 결과는 (26,) 자모 빈도 / (26, 26) 인접 자모 빈도라서 그냥 더하면 됨
+"""
+
+import numpy as np
+import os
+from multiprocessing import Pool
+import sys
+from pathlib import Path
+
+parent_path = Path(__file__).parent.parent
+sys.path.insert(0, str(parent_path))
+
+from datas.data import korean_list, stream_counts
+
+
+def split_shards(path: str, shard_size: int = 64 << 20) -> list:
+    """
+    파일을 약 shard_size 바이트씩 줄 경계에 맞춰 나눔
+    Returns:
+        [(path, start, stop), ...] 바이트 구간
+    """
+    size = os.path.getsize(path)
+    bounds = [0]
+    with open(path, 'rb') as f:
+        while bounds[-1] < size:
+            pos = bounds[-1] + shard_size
+            if pos >= size:
+                bounds.append(size)
+                break
+            f.seek(pos)
+            f.readline() #다음 줄 시작까지
+            bounds.append(min(size, f.tell()))
+    return [(path, start, stop) for start, stop in zip(bounds[:-1], bounds[1:]) if stop > start]
+
+
+def count_shard(shard: tuple) -> tuple:
+    """샤드 하나 (path, start, stop) → (unigram (26,), bigram (26, 26)) - mmap 청크 단위로 읽음"""
+    return stream_counts(*shard)
+
+
+def ingest_corpus(paths, workers: int = None, shard_size: int = 64 << 20) -> tuple:
+    """
+    여러 코퍼스 파일을 샤드 단위로 병렬 집계해서 합산
+    Args:
+        paths: 파일 경로 하나 또는 목록
+        workers: 프로세스 수 (None이면 CPU 수, 1이면 현재 프로세스)
+        shard_size: 샤드 크기 (바이트) - 워커 하나의 메모리 사용량 기준
+    Returns:
+        (unigram (26,), bigram (26, 26)) - bigram[a, b] = a 다음에 b가 온 횟수
+    """
+    if isinstance(paths, (str, os.PathLike)):
+        paths = [paths]
+    shards = [shard for path in paths for shard in split_shards(str(path), shard_size)]
+
+    unigram = np.zeros(len(korean_list), dtype=np.int64)
+    bigram = np.zeros((len(korean_list),) * 2, dtype=np.int64)
+    workers = workers or os.cpu_count() or 1
+    if workers > 1 and len(shards) > 1:
+        with Pool(min(workers, len(shards))) as pool:
+            results = pool.imap_unordered(count_shard, shards)
+            for uni, bi in results:
+                unigram = unigram + uni
+                bigram = bigram + bi
+    else:
+        for shard in shards:
+            uni, bi = count_shard(shard)
+            unigram = unigram + uni
+            bigram = bigram + bi
+    return unigram, bigram
+
+
+def count_frames(unigram: np.ndarray, bigram: np.ndarray) -> tuple:
+    """
+    집계 배열 → preprocess_word 결과로 만들던 DataFrame과 같은 모양
+    Returns:
+        (count_df: [단어, 빈도] 행, weight_df: 행 = 뒤 자모, 열 = 앞 자모)
+    """
+    import pandas as pd
+    count_df = pd.DataFrame({'단어': korean_list, '빈도': unigram})
+    weight_df = pd.DataFrame(bigram.T, index=korean_list, columns=korean_list)
+    return count_df, weight_df
+
+
+def save_counts(unigram: np.ndarray, bigram: np.ndarray, count_csv: str, weight_csv: str):
+    """high_count.csv / all_raw_weight.csv 와 같은 형식으로 저장"""
+    count_df, weight_df = count_frames(unigram, bigram)
+    count_df.to_csv(count_csv, index=True, encoding='utf-8-sig')
+    weight_df.to_csv(weight_csv, index=True, encoding='utf-8-sig')
@@ -1,6 +1,16 @@
 import numpy as np
 
 
+def char_cells(layout, n_chars=26):
+    # 글자 → flat 셀 역인덱스 (배치되지 않은 글자는 -1), 배열을 한 번만 훑음
+    flat = np.asarray(layout).ravel()
+    idx = np.flatnonzero(flat >= 0)[::-1]  # 중복 시 첫 위치가 남도록 역순 대입
+    size = max(n_chars, int(flat.max()) + 1) if len(idx) else n_chars
+    cells = np.full(size, -1, dtype=int)
+    cells[flat[idx]] = idx
+    return cells
+
+
 class KeyboardLayout:
     
     def __init__(self):
@@ -68,10 +78,11 @@ class KeyboardLayout:
         self.position_table[28] = (2, 9, 'Right', 'Ring')
         self.position_table[29] = (-1, -1, 'None', 'None')
     
-    def get_position_2d(self, layout, char_idx):
-        rows, cols = np.where(layout == char_idx)
-        if len(rows) > 0:
-            return (rows[0], cols[0])
+    def get_position_2d(self, layout, char_idx, cells=None):
+        if cells is None:
+            cells = char_cells(layout, self.n_chars)
+        if 0 <= char_idx < len(cells) and cells[char_idx] >= 0:
+            return divmod(int(cells[char_idx]), np.shape(layout)[1])
         return None
     
     def get_position_idx(self, row, col):
@@ -118,12 +129,13 @@ class KeyboardLayout:
     
     def _calc_fatigue(self, layout, W, f2_table, f3_table, f4_table):
         C_fatigue = 0.0
+        cells = char_cells(layout, self.n_chars)
         
         for i in range(self.n_chars):
             for j in range(self.n_chars):
                 if W[i, j] > 0:
-                    pos_i = self.get_position_2d(layout, i)
-                    pos_j = self.get_position_2d(layout, j)
+                    pos_i = self.get_position_2d(layout, i, cells)
+                    pos_j = self.get_position_2d(layout, j, cells)
                     
                     if pos_i is None or pos_j is None:
                         continue
@@ -173,12 +185,13 @@ class KeyboardLayout:
     
     def _calc_laplacian_penalty(self, layout, W, weight=0.3): #학습에서 laplacian penalty
         C_lap = 0.0
+        cells = char_cells(layout, self.n_chars)
         
         for i in range(self.n_chars):
             for j in range(self.n_chars):
                 if W[i, j] > 0:
-                    pos_i = self.get_position_2d(layout, i)
-                    pos_j = self.get_position_2d(layout, j)
+                    pos_i = self.get_position_2d(layout, i, cells)
+                    pos_j = self.get_position_2d(layout, j, cells)
                     
                     if pos_i is None or pos_j is None:
                         continue
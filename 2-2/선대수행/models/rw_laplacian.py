@@ -26,24 +26,62 @@ def spectral(L):
 class laplacian_spectral:
     
     def __init__(self, weights: np.ndarray):
+        self.laplacian = None
+        self.eigvals = None
+        self.eigvecs = None
         self.weights = weights
+    
+    @property
+    def weights(self):
+        return self._weights
+    
+    @weights.setter
+    def weights(self, weights):
+        self._weights = weights
+        self.invalidate()
+    
+    def invalidate(self):
+        # W가 바뀌면 (normalized별) 캐시된 L과 스펙트럼을 버림
+        self._weights_snapshot = np.array(self._weights, dtype=float)
+        self._laplacian_cache = {}
         self.laplacian = None
         self.eigvals = None
         self.eigvecs = None
         
     def compute_laplacian(self, normalized: bool = True):
-        if normalized:
-            # Normalized Laplacian: L_norm = I - D^{-1/2} A D^{-1/2}
-            D = np.diag(self.weights.sum(axis=1))
-            D_sqrt_inv = np.diag(1.0 / np.sqrt(np.diag(D) + 1e-10))
-            self.laplacian = np.eye(len(self.weights)) - D_sqrt_inv @ self.weights @ D_sqrt_inv
-        else:
-            # Unnormalized Laplacian: L = D - A
-            D = np.diag(self.weights.sum(axis=1))
-            self.laplacian = D - self.weights
+        # (W, normalized) 쌍마다 한 번만 계산해서 읽기 전용으로 고정
+        # W가 제자리에서 수정되어도 스냅샷과 비교해서 다시 계산
+        if not np.array_equal(self._weights_snapshot, self._weights):
+            self.invalidate()
         
+        L = self._laplacian_cache.get(normalized)
+        if L is None:
+            A = self._weights_snapshot
+            degree = A.sum(axis=1)
+            if normalized:
+                # Normalized Laplacian: L_norm = I - D^{-1/2} A D^{-1/2}
+                d_sqrt_inv = 1.0 / np.sqrt(degree + 1e-10)
+                L = np.eye(len(A)) - d_sqrt_inv[:, None] * A * d_sqrt_inv[None, :]
+            else:
+                # Unnormalized Laplacian: L = D - A
+                L = np.diag(degree) - A
+            L.flags.writeable = False
+            self._laplacian_cache[normalized] = L
+        
+        self.laplacian = L
         return self.laplacian
     
+    def quadratic_form(self, X: np.ndarray, Y: np.ndarray = None, normalized: bool = True):
+        # 좌표 벡터 여러 개에 대한 x^T L x + y^T L y를 한 번에 계산
+        # X, Y: (n,) 또는 (P, n) → 스칼라 또는 (P,)
+        L = self.compute_laplacian(normalized)
+        X = np.asarray(X, dtype=float)
+        result = ((X @ L) * X).sum(axis=-1)
+        if Y is not None:
+            Y = np.asarray(Y, dtype=float)
+            result = result + ((Y @ L) * Y).sum(axis=-1)
+        return result
+    
     def compute_spectrum(self, n_components: int = None):
         if self.laplacian is None:
             self.compute_laplacian()
@@ -0,0 +1,116 @@
+import numpy as np
+import weakref
+
+
+def _cost_or_one(fn, *args):
+    try:
+        return fn(*args)
+    except Exception:
+        return 1.0
+
+
+def build_step_cost_tensor(keyboard, fatigue_model, n_rows: int = 3, n_cols: int = 10) -> np.ndarray:
+    """
+    셀 쌍 step 비용 텐서 S[a, b] = distance × f2 × f3 × f4
+    a, b는 2D 배열의 flat 셀 인덱스 (row * n_cols + col)
+    """
+    n_cells = n_rows * n_cols
+    S = np.zeros((n_cells, n_cells))
+
+    for a in range(n_cells):
+        row_a, col_a = divmod(a, n_cols)
+        hand_a, finger_a = keyboard.get_hand_finger(a)
+        for b in range(n_cells):
+            row_b, col_b = divmod(b, n_cols)
+            hand_b, finger_b = keyboard.get_hand_finger(b)
+
+            try:
+                dist = keyboard.distance((row_a, col_a), (row_b, col_b))
+            except Exception:
+                dist = np.sqrt((row_a - row_b) ** 2 + (col_a - col_b) ** 2)
+            f2 = _cost_or_one(fatigue_model.get_f2_cost, finger_a, finger_b)
+            f3 = _cost_or_one(fatigue_model.get_f3_cost, hand_a, hand_b, row_a, row_b)
+            f4 = _cost_or_one(fatigue_model.get_f4_cost, finger_a, finger_b)
+            S[a, b] = dist * f2 * f3 * f4
+
+    S.flags.writeable = False
+    return S
+
+
+def grid_distance_sq_tensor(n_rows: int = 3, n_cols: int = 10) -> np.ndarray:
+    # 셀 쌍의 격자 거리 제곱 G[a, b] = (row_a - row_b)^2 + (col_a - col_b)^2
+    rows, cols = np.divmod(np.arange(n_rows * n_cols), n_cols)
+    G = (rows[:, None] - rows[None, :]) ** 2 + (cols[:, None] - cols[None, :]) ** 2
+    return G.astype(float)
+
+
+def center_distance_cost(n_rows: int = 3, n_cols: int = 10) -> np.ndarray:
+    # 셀별 위치 비용: 키보드 중심(row=1, col=4.5)으로부터의 거리 제곱
+    # 중심에서 멀수록 높은 비용
+    rows, cols = np.divmod(np.arange(n_rows * n_cols), n_cols)
+    center_row, center_col = 1.0, 4.5
+    return (rows - center_row) ** 2 + (cols - center_col) ** 2
+
+
+def _state_key(obj) -> tuple:
+    # 객체 속성(표) 스냅샷 - 배열은 bytes로, 나머지는 repr로 비교
+    state = getattr(obj, '__dict__', {})
+    return tuple((name, (value.shape, value.tobytes()) if isinstance(value, np.ndarray) else repr(value))
+                 for name, value in sorted(state.items()))
+
+
+#keyboard → fatigue_model → {(n_rows, n_cols): (속성 스냅샷, S)} - 두 객체가 사라지면 항목도 사라짐
+_step_cost_cache = weakref.WeakKeyDictionary()
+
+
+def step_cost_tensor(keyboard, fatigue_model, n_rows: int = 3, n_cols: int = 10) -> np.ndarray:
+    """
+    (keyboard, fatigue_model, 배열 크기)마다 한 번만 생성한 S
+    두 객체의 표가 바뀌면 (속성 스냅샷이 다르면) 다시 생성
+    자주 부르는 쪽은 받은 S를 보관해서 사용 (스냅샷 비교 비용)
+    """
+    try:
+        entries = _step_cost_cache.setdefault(keyboard, weakref.WeakKeyDictionary()) \
+            .setdefault(fatigue_model, {})
+    except TypeError: #약한 참조를 만들 수 없는 객체는 캐시하지 않음
+        return build_step_cost_tensor(keyboard, fatigue_model, n_rows, n_cols)
+
+    key = (_state_key(keyboard), _state_key(fatigue_model))
+    entry = entries.get((n_rows, n_cols))
+    if entry is None or entry[0] != key:
+        entry = (key, build_step_cost_tensor(keyboard, fatigue_model, n_rows, n_cols))
+        entries[(n_rows, n_cols)] = entry
+    return entry[1]
+
+
+def swap_delta(W, T, cells, cell_a, cell_b, char_a, char_b):
+    """
+    Σ W_ij · T[cells_i, cells_j] 에서 cell_a의 글자(char_a)와 cell_b의 글자(char_b)를
+    맞바꿨을 때의 변화량 - 옮겨지는 글자의 행/열만 보므로 O(n)
+    빈 셀(-1)과의 교환은 한 글자만 이동
+    """
+    moved = [c for c in (char_a, char_b) if 0 <= c < len(cells)]
+    if not moved:
+        return 0.0
+    moved = np.array(moved)
+    new_cells = cells.copy()
+    if 0 <= char_a < len(cells):
+        new_cells[char_a] = cell_b
+    if 0 <= char_b < len(cells):
+        new_cells[char_b] = cell_a
+
+    old_m, new_m = cells[moved], new_cells[moved]
+    rest = np.ones(len(cells), dtype=bool)
+    rest[moved] = False
+    rest_cells = cells[rest]
+
+    # 옮겨진 글자가 출발점인 쌍(행 전체) + 도착점인 쌍(나머지 행)
+    delta = (W[moved] * (T[new_m][:, new_cells] - T[old_m][:, cells])).sum()
+    delta += (W[rest][:, moved] * (T[rest_cells][:, new_m] - T[rest_cells][:, old_m])).sum()
+    return float(delta)
+
+
+def quadratic_form_delta(L, x, idx, new_vals):
+    # x^T L x 에서 x[idx]만 new_vals로 바뀔 때의 변화량 (O(n·|idx|))
+    d = new_vals - x[idx]
+    return float(d @ (L[idx] @ x) + (x @ L[:, idx]) @ d + d @ L[np.ix_(idx, idx)] @ d)
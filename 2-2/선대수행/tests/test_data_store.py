@@ -0,0 +1,35 @@
+import numpy as np
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+parent_path = Path(__file__).parent.parent
+sys.path.insert(0, str(parent_path))
+
+from datas.data import load_counts, parse_count_csv
+
+DATAS = parent_path / 'datas'
+
+
+@pytest.mark.parametrize('name', ['high_count.csv', 'high_raw_weight.csv'])
+@pytest.mark.parametrize('damage', [b'', b'PK\x03\x04junk', 'truncated'])
+def test_damaged_store_is_rebuilt(tmp_path, name, damage):
+    csv_path = tmp_path / name
+    shutil.copy(DATAS / name, csv_path)
+    expected = parse_count_csv(csv_path.read_text(encoding='utf-8-sig'))
+
+    store_path = csv_path.with_suffix('.npz')
+    load_counts(csv_path)
+    if damage == 'truncated':
+        damage = store_path.read_bytes()[:100]
+    store_path.write_bytes(damage)
+
+    for _ in range(2): #처음엔 다시 만들고, 그 다음엔 새 저장소에서 읽음
+        alphabet, counts = load_counts(csv_path)
+        assert alphabet == expected[0]
+        np.testing.assert_array_equal(counts, expected[1])
+    with np.load(store_path, allow_pickle=False) as store:
+        np.testing.assert_array_equal(store['counts'], expected[1])
+    assert sorted(p.name for p in tmp_path.iterdir()) == sorted([name, store_path.name])
@@ -0,0 +1,44 @@
+import numpy as np
+import sys
+from pathlib import Path
+
+import pytest
+
+parent_path = Path(__file__).parent.parent
+sys.path.insert(0, str(parent_path))
+
+from datas.data import parse_lines, stream_counts, count_jamo
+
+VALID = [('가', 10), ('나다', 7), ('ㄳ값', 3), ('뷁', 12), ('a한', 5)]
+
+
+def test_parse_lines_skips_malformed_lines():
+    #두 칸 / 네 칸 줄이 서로 상쇄돼도 뒤 줄이 밀리지 않아야 함
+    assert parse_lines('1 가 10\n2 나다 7 30\n3 40\n')[0] == ['가']
+    words, freqs = parse_lines('﻿1 가 10\r\n\n2 나다 7 30\n3 40\n  4\t라 5  \r\n5 마')
+    assert words == ['가', '라']
+    np.testing.assert_array_equal(freqs, [10, 5])
+
+
+def test_parse_lines_float_freqs():
+    words, freqs = parse_lines('1 가 1.5\n2 나 2\n')
+    assert words == ['가', '나'] and freqs.dtype == float
+
+
+@pytest.mark.parametrize('chunk_size', [1, 5, 17, 64, 1 << 20])
+def test_stream_counts_independent_of_chunk_size(tmp_path, chunk_size):
+    lines = []
+    for k, (word, freq) in enumerate(VALID * 20):
+        lines.append(f'{k} {word} {freq}')
+        if k % 7 == 0:
+            lines.append(f'{k} {word} {freq} 99') #네 칸
+        if k % 11 == 0:
+            lines.extend(['', f'{k} {freq}']) #빈 줄, 두 칸
+    path = tmp_path / 'corpus.txt'
+    path.write_bytes(b'\xef\xbb\xbf' + '\r\n'.join(lines).encode('utf-8'))
+
+    words, freqs = zip(*(VALID * 20))
+    expected = count_jamo(list(words), np.array(freqs))
+    unigram, bigram = stream_counts(path, chunk_size=chunk_size)
+    np.testing.assert_array_equal(unigram, expected[0])
+    np.testing.assert_array_equal(bigram, expected[1])